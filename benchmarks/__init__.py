@@ -0,0 +1 @@
+"""Offline benchmarks for mcp-server-steam."""
@@ -0,0 +1,122 @@
+"""Startup benchmark: time from process spawn to the first list_tools response.
+
+Usage:
+    uv run python -m benchmarks.bench_startup
+    uv run python -m benchmarks.bench_startup --runs 10 --budget-ms 2000 --output startup.json
+
+Desktop MCP clients spawn the server per session, so this latency is
+user-visible. The run fails (exit 1) when the median exceeds the budget,
+or when a module outside the startup path (httpx and the Steam client
+stack) was imported before the first response.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Agreed budget for spawn -> first list_tools response (median over runs)
+STARTUP_BUDGET_MS = 2500
+
+# Modules that must stay out of the startup path
+DEFERRED_MODULES = ("httpx", "mcp_server_steam.steam_client", "mcp_server_steam.cache")
+
+# Server entry point that reports import time, schema cache use and which
+# deferred modules got loaded (at exit, after serving only list_tools)
+PROBE = """
+import atexit, sys, time
+start = time.perf_counter()
+import mcp_server_steam.server as server
+imported = time.perf_counter()
+from mcp_server_steam import tool_schemas
+print(f"import_ms={(imported - start) * 1000:.1f}", file=sys.stderr)
+total = tool_schemas.hits + tool_schemas.misses
+print(f"precomputed_schemas={tool_schemas.hits}/{total}", file=sys.stderr)
+loaded = lambda: ",".join(m for m in DEFERRED if m in sys.modules)
+atexit.register(lambda: print("loaded=" + loaded(), file=sys.stderr))
+server.main()
+"""
+
+
+async def measure_once(env: dict[str, str]) -> tuple[float, dict[str, str]]:
+    """Spawn a stdio server and time the first list_tools round trip."""
+    from fastmcp import Client
+    from fastmcp.client.transports import StdioTransport
+
+    with tempfile.TemporaryFile("w+", encoding="utf-8") as log:
+        transport = StdioTransport(
+            command=sys.executable,
+            args=["-c", PROBE.replace("DEFERRED", repr(DEFERRED_MODULES))],
+            env=env,
+            log_file=log
+        )
+        start = time.perf_counter()
+        async with Client(transport) as client:
+            tools = await client.list_tools()
+            elapsed_ms = (time.perf_counter() - start) * 1000
+        await transport.close()
+        log.seek(0)
+        probe = dict(
+            line.strip().split("=", 1) for line in log
+            if line.startswith(("import_ms=", "precomputed_schemas=", "loaded="))
+        )
+    probe["tools"] = str(len(tools))
+    return elapsed_ms, probe
+
+
+async def run(runs: int) -> dict:
+    env = {
+        **os.environ,
+        "STEAM_API_KEY": os.environ.get("STEAM_API_KEY", "startup-benchmark"),
+        "FASTMCP_SHOW_SERVER_BANNER": "false",
+    }
+    samples = []
+    probe: dict[str, str] = {}
+    for _ in range(runs):
+        elapsed_ms, probe = await measure_once(env)
+        samples.append(elapsed_ms)
+    return {
+        "runs": runs,
+        "median_ms": round(statistics.median(samples), 1),
+        "min_ms": round(min(samples), 1),
+        "max_ms": round(max(samples), 1),
+        "import_ms": float(probe.get("import_ms", "nan")),
+        "precomputed_schemas": probe.get("precomputed_schemas"),
+        "tools": int(probe.get("tools", 0)),
+        "deferred_modules_loaded": [m for m in probe.get("loaded", "").split(",") if m],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure mcp-server-steam cold start")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=STARTUP_BUDGET_MS)
+    parser.add_argument("--output", help="Write JSON results to this file (default: stdout)")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args.runs))
+    result["budget_ms"] = args.budget_ms
+    output = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    else:
+        print(output)
+
+    failures = []
+    if result["median_ms"] > args.budget_ms:
+        failures.append(f"median startup {result['median_ms']}ms exceeds budget {args.budget_ms}ms")
+    if result["deferred_modules_loaded"]:
+        failures.append(f"imported during startup: {', '.join(result['deferred_modules_loaded'])}")
+    for failure in failures:
+        print(f"FAIL {failure}", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
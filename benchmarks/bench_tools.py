@@ -0,0 +1,332 @@
+"""Offline benchmark of every MCP tool against the mock Steam upstream.
+
+Usage:
+    uv run python -m benchmarks.bench_tools --output bench.json
+    uv run python -m benchmarks.bench_tools --compare bench.json
+    uv run python -m benchmarks.bench_tools --cassette steam-cassette.jsonl.gz
+
+Each tool is called through an in-memory MCP client (so argument
+validation and result serialization are included) at several concurrency
+levels, with cold caches at the start of every scenario. A burst scenario
+replays LLM-style parallel tool calls. Results are written as JSON and can
+be compared against a previous run to spot regressions.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict
+from typing import Any
+
+os.environ.setdefault("STEAM_API_KEY", "benchmark")
+os.environ.setdefault("STEAM_USER_ID", "76561197960265729")
+# Playtime snapshots and the price watchlist stay in memory during the run
+os.environ.setdefault("SNAPSHOT_PATH", ":memory:")
+os.environ.setdefault("WATCHLIST_PATH", ":memory:")
+
+from benchmarks.mock_steam import MockSteam, MockSteamConfig  # noqa: E402
+
+STEAM_ID = "76561197960265729"
+
+# Arguments used for every tool registered in server.py; a tool without an
+# entry here fails the benchmark so new tools can't go unmeasured
+TOOL_ARGS: dict[str, dict[str, Any]] = {
+    "get_user_overview": {"user": STEAM_ID},
+    "get_user_profile": {"steam_id": STEAM_ID},
+    "get_friends_list": {"steam_id": STEAM_ID},
+    "get_owned_games": {"steam_id": STEAM_ID},
+    "get_recently_played_games": {"steam_id": STEAM_ID},
+    "get_playtime_history": {"steam_id": STEAM_ID, "days": 30},
+    "get_steam_level": {"steam_id": STEAM_ID},
+    "get_player_achievements": {"steam_id": STEAM_ID, "app_id": 20},
+    "get_game_details": {"app_ids": [20]},
+    "watch_prices": {"app_ids": list(range(10, 5010, 10)), "target_price": 9.99},
+    "get_price_alerts": {"refresh": True},
+    "get_news_feed": {"app_ids": [10, 20, 30, 40, 50]},
+    "compare_regional_prices": {
+        "app_ids": [10, 20, 30], "country_codes": ["us", "kr", "de", "gb", "jp"]
+    },
+    "get_game_news": {"app_id": 730, "count": 10},
+    "get_global_achievement_percentages": {"app_id": 20},
+    "get_achievement_rarity_report": {"steam_id": STEAM_ID, "max_games": 10},
+    "search_games": {"query": "portal"},
+    "get_game_schema": {"app_id": 20},
+    "get_workshop_items": {"app_id": 4000},
+    "get_workshop_item_details": {"published_file_ids": list(range(1000000, 1000050))},
+    "get_user_reviews": {"app_id": 730, "count": 50},
+    "get_player_bans": {"steam_ids": [str(int(STEAM_ID) + i) for i in range(50)]},
+    "resolve_vanity_url": {"vanity_url": "gabelogannewell"},
+    "resolve_steam_ids": {
+        "identifiers": ["gabelogannewell", "STEAM_0:1:11101", "[U:1:22202]", "missing_user"]
+    },
+    "batch": {"calls": [
+        {"tool": "get_game_schema", "arguments": {"app_id": 10 * i}} for i in range(1, 9)
+    ] + [{"tool": "get_game_schema", "arguments": {"app_id": 10}}]},
+}
+
+# Tools an LLM typically calls together at the start of a conversation
+BURST_TOOLS = [
+    "resolve_vanity_url", "get_user_profile", "get_steam_level", "get_owned_games",
+    "get_recently_played_games", "get_player_bans", "get_game_details", "get_game_news",
+    "get_game_schema", "get_player_achievements",
+]
+
+
+def percentile(values: list[float], q: float) -> float | None:
+    """Nearest-rank percentile of a list of values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))]
+
+
+def summarize(
+    latencies: list[float], errors: int, elapsed: float, upstream_calls: int
+) -> dict[str, Any]:
+    calls = len(latencies)
+    return {
+        "calls": calls,
+        "errors": errors,
+        "throughput_per_s": round(calls / elapsed, 2) if elapsed else None,
+        "p50_ms": round(percentile(latencies, 0.5) * 1000, 2) if latencies else None,
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2) if latencies else None,
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 2) if latencies else None,
+        "upstream_calls": upstream_calls,
+        "upstream_per_call": round(upstream_calls / calls, 2) if calls else None,
+    }
+
+
+class Bench:
+    """Runs benchmark scenarios against the server with a mocked upstream."""
+
+    def __init__(self, upstream, transport, respect_rate_limit: bool = False):
+        """
+        Args:
+            upstream: Call counter of the upstream (MockSteam or ReplayTransport)
+            transport: httpx transport installed on every SteamAPIClient
+            respect_rate_limit: Keep the real client rate limits
+        """
+        from mcp_server_steam import server, steam_client
+        from mcp_server_steam.cache import response_cache
+        from mcp_server_steam.identity import vanity_cache
+        from mcp_server_steam.negative_cache import negative_cache
+        from mcp_server_steam.news_feed import news_feed
+        from mcp_server_steam.regional_prices import price_cache
+        from mcp_server_steam.workshop import workshop_cache
+
+        self.mock = upstream
+        self.server = server
+        # Every module-level cache, so each scenario starts cold
+        self.caches = [
+            response_cache, price_cache, workshop_cache, vanity_cache, negative_cache, news_feed
+        ]
+        self.limiters = [steam_client.rate_limiter, steam_client.store_rate_limiter]
+        self.respect_rate_limit = respect_rate_limit
+        steam_client.SteamAPIClient.transport = transport
+        if not respect_rate_limit:
+            # Measure the server, not the 100 requests/minute budget
+            steam_client.rate_limiter.rate = steam_client.rate_limiter.allowance = 10**9
+            steam_client.store_rate_limiter.rate = steam_client.store_rate_limiter.allowance = 10**9
+
+    def clear_caches(self) -> None:
+        for cache in self.caches:
+            cache.clear()
+
+    def lost_rate_overrides(self) -> list[str]:
+        """Limiters whose benchmark rate was overwritten during the run, e.g. by adaptive limits."""
+        if self.respect_rate_limit:
+            return []
+        return [f"{l.name} rate is {l.rate}" for l in self.limiters if l.rate != 10**9]
+
+    async def call(self, client, tool: str, args: dict[str, Any]) -> tuple[float, bool]:
+        start = time.perf_counter()
+        result = await client.call_tool(tool, args, raise_on_error=False)
+        return time.perf_counter() - start, bool(result.is_error)
+
+    async def scenario(
+        self,
+        client,
+        calls: list[tuple[str, dict[str, Any]]],
+        concurrency: int,
+        trace_memory: bool = False
+    ) -> dict[str, Any]:
+        """Run calls with bounded concurrency on cold caches."""
+        self.clear_caches()
+        self.mock.reset()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(tool: str, args: dict[str, Any]) -> tuple[float, bool]:
+            async with semaphore:
+                return await self.call(client, tool, args)
+
+        if trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        results = await asyncio.gather(*(run(tool, args) for tool, args in calls))
+        elapsed = time.perf_counter() - start
+        summary = summarize(
+            [latency for latency, _ in results],
+            sum(error for _, error in results),
+            elapsed,
+            self.mock.total_calls
+        )
+        if trace_memory:
+            summary["peak_memory_kb"] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+            tracemalloc.stop()
+        return summary
+
+    async def bursts(self, client, bursts: int, seed: int) -> dict[str, Any]:
+        """Replay LLM-style bursts of 3-8 parallel tool calls separated by short gaps."""
+        self.clear_caches()
+        self.mock.reset()
+        rng = random.Random(seed)
+        latencies: list[float] = []
+        errors = 0
+        start = time.perf_counter()
+        for _ in range(bursts):
+            tools = [rng.choice(BURST_TOOLS) for _ in range(rng.randint(3, 8))]
+            results = await asyncio.gather(*(self.call(client, t, TOOL_ARGS[t]) for t in tools))
+            latencies.extend(latency for latency, _ in results)
+            errors += sum(error for _, error in results)
+            await asyncio.sleep(rng.uniform(0.0, 0.05))
+        return summarize(latencies, errors, time.perf_counter() - start, self.mock.total_calls)
+
+    async def run(
+        self, concurrency_levels: list[int], calls_per_level: int, bursts: int, seed: int
+    ) -> dict[str, Any]:
+        from fastmcp import Client
+
+        results: dict[str, Any] = {"tools": {}}
+        async with Client(self.server.mcp) as client:
+            tools = [tool.name for tool in await client.list_tools()]
+            missing = sorted(set(tools) - set(TOOL_ARGS))
+            if missing:
+                raise SystemExit(f"No benchmark arguments for tools: {', '.join(missing)}")
+
+            for tool in tools:
+                per_tool: dict[str, Any] = {}
+                for concurrency in concurrency_levels:
+                    calls = [(tool, TOOL_ARGS[tool])] * calls_per_level
+                    per_tool[f"c{concurrency}"] = await self.scenario(client, calls, concurrency)
+                memory = await self.scenario(
+                    client, [(tool, TOOL_ARGS[tool])] * 8, 8, trace_memory=True
+                )
+                per_tool["peak_memory_kb"] = memory["peak_memory_kb"]
+                results["tools"][tool] = per_tool
+                summary = json.dumps(per_tool[f"c{concurrency_levels[-1]}"])
+                print(f"{tool}: {summary}", file=sys.stderr)
+
+            results["bursts"] = await self.bursts(client, bursts, seed)
+        return results
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], tolerance: float) -> list[str]:
+    """List scenarios whose p99 latency or throughput regressed beyond the tolerance."""
+    regressions = []
+    for tool, scenarios in current["tools"].items():
+        for name, result in scenarios.items():
+            before = baseline.get("tools", {}).get(tool, {}).get(name)
+            if not isinstance(result, dict) or not isinstance(before, dict):
+                continue
+            p99, throughput = before.get("p99_ms"), before.get("throughput_per_s")
+            if p99 and result["p99_ms"] > p99 * (1 + tolerance):
+                regressions.append(f"{tool} {name}: p99 {p99}ms -> {result['p99_ms']}ms")
+            if throughput and result["throughput_per_s"] < throughput * (1 - tolerance):
+                regressions.append(
+                    f"{tool} {name}: throughput {throughput}/s -> {result['throughput_per_s']}/s"
+                )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark mcp-server-steam tools against a mock Steam upstream"
+    )
+    parser.add_argument("--output", help="Write JSON results to this file (default: stdout)")
+    parser.add_argument("--compare", help="Baseline JSON results; exit 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed relative regression (default: 0.2)")
+    parser.add_argument("--concurrency", default="1,8,32",
+                        help="Comma-separated concurrency levels")
+    parser.add_argument("--calls", type=int, default=64,
+                        help="Calls per tool and concurrency level")
+    parser.add_argument("--bursts", type=int, default=30, help="Number of LLM-style call bursts")
+    parser.add_argument("--latency-ms", type=float, default=40.0)
+    parser.add_argument("--tail-rate", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0,
+                        help="Fraction of upstream 429 responses")
+    parser.add_argument("--respect-rate-limit", action="store_true",
+                        help="Keep the real client rate limits")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--cassette",
+                        help="Replay upstream responses from this cassette instead of the mock")
+    parser.add_argument("--replay-latency", choices=("original", "none"), default="original")
+    parser.add_argument("--record-cassette", help="Record the mock's responses to this cassette")
+    args = parser.parse_args()
+
+    config = MockSteamConfig(
+        latency_ms=args.latency_ms,
+        tail_rate=args.tail_rate,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        seed=args.seed,
+    )
+    from mcp_server_steam.cassette import Cassette, RecordingTransport, ReplayTransport
+
+    if args.cassette:
+        transport = ReplayTransport(Cassette.load(args.cassette), latency=args.replay_latency)
+        upstream = transport
+    else:
+        upstream = MockSteam(config)
+        transport = upstream.transport()
+        if args.record_cassette:
+            transport = RecordingTransport(Cassette(args.record_cassette), inner=transport)
+    bench = Bench(upstream, transport, respect_rate_limit=args.respect_rate_limit)
+    # server.py configures INFO logging on import; per-request logs would dominate the run
+    logging.getLogger().setLevel(logging.WARNING)
+    levels = [int(c) for c in args.concurrency.split(",")]
+    results = asyncio.run(bench.run(levels, args.calls, args.bursts, args.seed))
+    if isinstance(transport, RecordingTransport):
+        transport.cassette.save()
+    lost = bench.lost_rate_overrides()
+    for line in lost:
+        print(f"FAIL rate override lost: {line}", file=sys.stderr)
+    results["meta"] = {
+        "timestamp": int(time.time()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "mock": asdict(config),
+        "cassette": args.cassette,
+        "concurrency": levels,
+        "calls_per_level": args.calls,
+    }
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(json.load(f), results, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+    if lost:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
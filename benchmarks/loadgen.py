@@ -0,0 +1,261 @@
+"""Replay recorded MCP tool-call traces against a running server.
+
+Usage:
+    # Record a trace from real usage
+    TOOL_CALL_LOG=calls.jsonl mcp-server-steam
+
+    # Replay it 10x faster with 20 concurrent sessions, fully offline
+    uv run python -m benchmarks.loadgen calls.jsonl --sessions 20 --speedup 10 --mock
+
+    # Replay against a server already running over HTTP
+    uv run python -m benchmarks.loadgen calls.jsonl --transport http --url http://127.0.0.1:8000/mcp
+
+    # No trace yet: synthesize LLM-style sessions
+    uv run python -m benchmarks.loadgen --synthesize 50 --write-trace synthetic.jsonl --mock
+
+A trace is a JSON Lines file of tool calls: {"session", "t", "tool", "args"}
+where ``t`` is a timestamp in seconds. Calls keep their original spacing
+(divided by the speedup factor) within a session, so bursts of parallel
+calls and idle gaps are reproduced. Upstream amplification (upstream
+requests per tool call) is read from the server's steam://metrics resource.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from typing import Any
+
+from benchmarks.bench_tools import BURST_TOOLS, TOOL_ARGS, percentile
+from benchmarks.mock_steam import MockSteam, MockSteamConfig
+
+TraceCall = dict[str, Any]
+
+
+def load_trace(path: str) -> dict[str, list[TraceCall]]:
+    """Load a trace and group it by session, with times relative to each session's first call."""
+    sessions: dict[str, list[TraceCall]] = defaultdict(list)
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                call = json.loads(line)
+                sessions[str(call.get("session", "default"))].append(call)
+
+    for calls in sessions.values():
+        calls.sort(key=lambda c: c["t"])
+        start = calls[0]["t"]
+        for call in calls:
+            call["t"] -= start
+    return dict(sessions)
+
+
+def synthesize_trace(sessions: int, seed: int = 42) -> dict[str, list[TraceCall]]:
+    """Generate LLM-style sessions: bursts of 3-8 parallel calls, repeated lookups and idle gaps."""
+    rng = random.Random(seed)
+    trace: dict[str, list[TraceCall]] = {}
+    for s in range(sessions):
+        t = 0.0
+        calls = []
+        for _ in range(rng.randint(2, 6)):
+            for tool in (rng.choice(BURST_TOOLS) for _ in range(rng.randint(3, 8))):
+                calls.append({"session": f"s{s}", "t": round(t + rng.uniform(0, 0.05), 3),
+                              "tool": tool, "args": TOOL_ARGS[tool]})
+            # Model "thinking" time between turns, occasionally a long idle gap
+            t += rng.uniform(2, 8) if rng.random() > 0.1 else rng.uniform(30, 120)
+        trace[f"s{s}"] = calls
+    return trace
+
+
+async def upstream_requests(client) -> float:
+    """Total upstream requests reported by the server's steam://metrics resource."""
+    contents = await client.read_resource("steam://metrics")
+    snapshot = json.loads(contents[0].text)
+    return sum(snapshot["counters"].get("steam_upstream_requests_total", {}).values())
+
+
+class LoadGenerator:
+    """Replays trace sessions concurrently over stdio or HTTP."""
+
+    def __init__(self, transport: str, url: str | None, server_env: dict[str, str], speedup: float):
+        self.transport = transport
+        self.url = url
+        self.server_env = server_env
+        self.speedup = speedup
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+        self.upstream = 0.0
+
+    def client(self):
+        from fastmcp import Client
+        from fastmcp.client.transports import StdioTransport
+
+        if self.transport == "http":
+            return Client(self.url)
+        # One server process per session, as desktop MCP clients do
+        return Client(StdioTransport(
+            command=sys.executable,
+            args=["-m", "mcp_server_steam"],
+            env={**os.environ, **self.server_env}
+        ))
+
+    async def call(self, client, call: TraceCall) -> None:
+        start = time.perf_counter()
+        try:
+            result = await client.call_tool(
+                call["tool"], call.get("args", {}), raise_on_error=False
+            )
+            failed = result.is_error
+        except Exception:
+            failed = True
+        self.latencies[call["tool"]].append(time.perf_counter() - start)
+        if failed:
+            self.errors[call["tool"]] += 1
+
+    async def session(self, calls: list[TraceCall]) -> None:
+        async with self.client() as client:
+            if self.transport == "stdio":
+                before = await upstream_requests(client)
+            start = time.perf_counter()
+            tasks = []
+            for call in calls:
+                delay = call["t"] / self.speedup - (time.perf_counter() - start)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                tasks.append(asyncio.create_task(self.call(client, call)))
+            await asyncio.gather(*tasks)
+            if self.transport == "stdio":
+                self.upstream += await upstream_requests(client) - before
+
+    async def run(self, trace: dict[str, list[TraceCall]], sessions: int) -> dict[str, Any]:
+        # Reuse recorded sessions round-robin when more simulated sessions are requested
+        recorded = list(trace.values())
+        plan = [recorded[i % len(recorded)] for i in range(sessions)]
+
+        control = self.client() if self.transport == "http" else None
+        if control is not None:
+            async with control:
+                before = await upstream_requests(control)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(self.session(calls) for calls in plan))
+        elapsed = time.perf_counter() - start
+
+        if control is not None:
+            async with control:
+                self.upstream = await upstream_requests(control) - before
+
+        return self.report(elapsed, sessions)
+
+    def report(self, elapsed: float, sessions: int) -> dict[str, Any]:
+        def distribution(values: list[float]) -> dict[str, Any]:
+            return {
+                "calls": len(values),
+                **{
+                    f"p{int(q * 100)}_ms": round(percentile(values, q) * 1000, 2)
+                    for q in (0.5, 0.9, 0.99)
+                },
+                "max_ms": round(max(values) * 1000, 2),
+            }
+
+        everything = [v for values in self.latencies.values() for v in values]
+        total_calls = len(everything)
+        return {
+            "sessions": sessions,
+            "elapsed_s": round(elapsed, 2),
+            "tool_calls": total_calls,
+            "errors": sum(self.errors.values()),
+            "latency": distribution(everything) if everything else None,
+            "per_tool": {
+                tool: {**distribution(values), "errors": self.errors.get(tool, 0)}
+                for tool, values in sorted(self.latencies.items())
+            },
+            "upstream_requests": self.upstream,
+            "upstream_amplification": (
+                round(self.upstream / total_calls, 3) if total_calls else None
+            ),
+        }
+
+
+async def serve_mock(mock: MockSteam) -> tuple[Any, str]:
+    """Serve the mock upstream on a free local port; returns (server, base URL)."""
+    import uvicorn
+
+    config = uvicorn.Config(mock.asgi_app(), host="127.0.0.1", port=0, log_level="warning")
+    server = uvicorn.Server(config)
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        if task.done():
+            task.result()
+        await asyncio.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    return server, f"http://127.0.0.1:{port}"
+
+
+async def amain(args: argparse.Namespace) -> dict[str, Any]:
+    if args.trace:
+        trace = load_trace(args.trace)
+    else:
+        trace = synthesize_trace(args.synthesize, seed=args.seed)
+        if args.write_trace:
+            with open(args.write_trace, "w", encoding="utf-8") as f:
+                for calls in trace.values():
+                    f.writelines(json.dumps(call) + "\n" for call in calls)
+
+    server_env = {"STEAM_API_KEY": os.environ.get("STEAM_API_KEY", "loadgen")}
+    mock_server = None
+    if args.mock:
+        mock = MockSteam(MockSteamConfig(latency_ms=args.latency_ms, error_rate=args.error_rate,
+                                         rate_limit_rate=args.rate_limit_rate, seed=args.seed))
+        mock_server, base_url = await serve_mock(mock)
+        server_env.update({"STEAM_API_BASE_URL": base_url, "STEAM_STORE_BASE_URL": base_url})
+
+    try:
+        generator = LoadGenerator(args.transport, args.url, server_env, args.speedup)
+        return await generator.run(trace, args.sessions or len(trace))
+    finally:
+        if mock_server is not None:
+            mock_server.should_exit = True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Replay MCP tool-call traces against mcp-server-steam"
+    )
+    parser.add_argument("trace", nargs="?",
+                        help="Trace file (JSON Lines of session, t, tool, args)")
+    parser.add_argument("--synthesize", type=int, default=20,
+                        help="Sessions to synthesize when no trace is given")
+    parser.add_argument("--write-trace", help="Save the synthesized trace to this file")
+    parser.add_argument("--transport", choices=("stdio", "http"), default="stdio")
+    parser.add_argument("--url", default="http://127.0.0.1:8000/mcp",
+                        help="Server URL for --transport http")
+    parser.add_argument("--sessions", type=int,
+                        help="Concurrent simulated sessions (default: one per trace session)")
+    parser.add_argument("--speedup", type=float, default=1.0,
+                        help="Divide recorded inter-call gaps by this factor")
+    parser.add_argument("--mock", action="store_true",
+                        help="Serve a mock Steam upstream and point spawned stdio servers at it")
+    parser.add_argument("--latency-ms", type=float, default=40.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write the JSON report to this file (default: stdout)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    report = asyncio.run(amain(args))
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
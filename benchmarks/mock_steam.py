@@ -0,0 +1,411 @@
+"""Local stand-in for api.steampowered.com and store.steampowered.com.
+
+The mock serves deterministic, realistically sized payloads for every
+endpoint used by the server, with configurable latency, error rate and
+429 injection. Use ``MockSteam.transport()`` to plug it into
+``SteamAPIClient.transport``.
+"""
+
+import asyncio
+import hashlib
+import random
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import httpx
+
+STEAM_ID_BASE = 76561197960265728
+CURRENCIES = {"US": "USD", "KR": "KRW", "DE": "EUR", "GB": "GBP", "JP": "JPY"}
+
+
+@dataclass
+class MockSteamConfig:
+    """Behaviour of the mock upstream.
+
+    Args:
+        latency_ms: Median response latency
+        jitter_ms: Uniform jitter added to the latency
+        tail_rate: Fraction of responses delayed by tail_ms instead
+        tail_ms: Latency of slow (tail) responses
+        error_rate: Fraction of requests answered with HTTP 500
+        rate_limit_rate: Fraction of requests answered with HTTP 429
+        owned_games: Library size returned by GetOwnedGames
+        achievements: Achievements per game
+        friends: Friends returned by GetFriendList
+        store_etags: Store routes send an ETag and answer If-None-Match with 304
+        private_ids: Steam IDs answered like private profiles
+        missing_ids: Steam IDs without an account
+        no_stats_apps: App IDs without achievements or stats
+        seed: Random seed for payloads and injected faults
+    """
+
+    latency_ms: float = 40.0
+    jitter_ms: float = 20.0
+    tail_rate: float = 0.01
+    tail_ms: float = 1500.0
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    owned_games: int = 1500
+    achievements: int = 120
+    friends: int = 250
+    store_etags: bool = True
+    private_ids: tuple[str, ...] = ()
+    missing_ids: tuple[str, ...] = ()
+    no_stats_apps: tuple[int, ...] = ()
+    seed: int = 42
+
+
+class MockSteam:
+    """Request handler emulating the Steam Web API and store API."""
+
+    def __init__(self, config: MockSteamConfig | None = None):
+        self.config = config or MockSteamConfig()
+        self.calls: Counter[str] = Counter()
+        self._rng = random.Random(self.config.seed)
+        self._routes: dict[str, Callable[[httpx.QueryParams], Any]] = {
+            "ISteamUser/GetPlayerSummaries": self._player_summaries,
+            "ISteamUser/GetFriendList": self._friend_list,
+            "ISteamUser/GetPlayerBans": self._player_bans,
+            "ISteamUser/ResolveVanityURL": self._resolve_vanity,
+            "IPlayerService/GetOwnedGames": self._owned_games,
+            "IPlayerService/GetRecentlyPlayedGames": self._recently_played,
+            "IPlayerService/GetSteamLevel": lambda q: {
+                "response": (
+                    {} if q.get("steamid") in self.config.private_ids else {"player_level": 42}
+                )
+            },
+            "ISteamUserStats/GetPlayerAchievements": self._player_achievements,
+            "ISteamUserStats/GetGlobalAchievementPercentagesForApp": self._global_percentages,
+            "ISteamUserStats/GetSchemaForGame": self._schema,
+            "ISteamNews/GetNewsForApp": self._news,
+            "IPublishedFileService/QueryFiles": self._query_files,
+            "IPublishedFileService/GetDetails": self._file_details,
+            "store/api/appdetails": self._app_details,
+            "store/api/storesearch": self._store_search,
+            "store/appreviews": self._reviews,
+        }
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    def reset(self) -> None:
+        self.calls.clear()
+
+    def transport(self) -> httpx.MockTransport:
+        """httpx transport answering every request from this mock."""
+        return httpx.MockTransport(self.handle)
+
+    def asgi_app(self):
+        """ASGI app serving this mock over real HTTP (for out-of-process servers).
+
+        Point STEAM_API_BASE_URL and STEAM_STORE_BASE_URL at the app's address.
+        """
+
+        async def app(scope, receive, send):
+            if scope["type"] == "lifespan":
+                while True:
+                    message = await receive()
+                    if message["type"] == "lifespan.startup":
+                        await send({"type": "lifespan.startup.complete"})
+                    elif message["type"] == "lifespan.shutdown":
+                        await send({"type": "lifespan.shutdown.complete"})
+                        return
+            host = dict(scope["headers"]).get(b"host", b"localhost").decode()
+            url = httpx.URL(f"http://{host}{scope['path']}?{scope['query_string'].decode()}")
+            headers = [(k.decode(), v.decode()) for k, v in scope["headers"]]
+            response = await self.handle(httpx.Request(scope["method"], url, headers=headers))
+            await send({
+                "type": "http.response.start",
+                "status": response.status_code,
+                "headers": [
+                    (name.encode(), response.headers[name].encode())
+                    for name in ("content-type", "etag")
+                    if name in response.headers
+                ],
+            })
+            await send({"type": "http.response.body", "body": response.content})
+
+        return app
+
+    @staticmethod
+    def route_of(url: httpx.URL) -> str:
+        """Route name of a request URL (e.g. ISteamUser/GetPlayerSummaries, store/appreviews)."""
+        parts = [p for p in url.path.split("/") if p]
+        if url.host.startswith("store.") or parts[:1] in (["api"], ["appreviews"]):
+            return "store/" + "/".join(p for p in parts if not p.isdigit())
+        return "/".join(parts[:2])
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        """Answer one request after the configured latency, or with an injected fault."""
+        route = self.route_of(request.url)
+        self.calls[route] += 1
+        config = self.config
+
+        if self._rng.random() < config.tail_rate:
+            delay = config.tail_ms
+        else:
+            delay = config.latency_ms + self._rng.uniform(0, config.jitter_ms)
+        await asyncio.sleep(delay / 1000)
+
+        roll = self._rng.random()
+        if roll < config.rate_limit_rate:
+            return httpx.Response(429, text="Too Many Requests")
+        if roll < config.rate_limit_rate + config.error_rate:
+            return httpx.Response(500, text="Internal Server Error")
+
+        handler = self._routes.get(route)
+        if handler is None:
+            return httpx.Response(404, text="Not Found")
+        params = request.url.params
+        if route == "store/appreviews":
+            params = params.merge({"appid": request.url.path.rstrip("/").rsplit("/", 1)[-1]})
+        payload = handler(params)
+        if isinstance(payload, httpx.Response):
+            return payload
+        response = httpx.Response(200, json=payload)
+        if config.store_etags and route.startswith("store/"):
+            etag = '"' + hashlib.md5(response.content).hexdigest() + '"'
+            if request.headers.get("if-none-match") == etag:
+                return httpx.Response(304, headers={"etag": etag})
+            response.headers["etag"] = etag
+        return response
+
+    # ------------------------------------------------------------------
+    # Payload generators
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _text(seed: int, words: int) -> str:
+        rng = random.Random(seed)
+        vocabulary = ("steam", "update", "patch", "balance", "map", "weapon", "event", "season",
+                      "fix", "server", "player", "reward", "quest", "item", "mode", "ranked")
+        return " ".join(rng.choice(vocabulary) for _ in range(words))
+
+    def _player(self, steam_id: str) -> dict[str, Any]:
+        n = int(steam_id) % 100000 if steam_id.isdigit() else 0
+        return {
+            "steamid": steam_id,
+            "communityvisibilitystate": 3,
+            "profilestate": 1,
+            "personaname": f"player{n}",
+            "profileurl": f"https://steamcommunity.com/profiles/{steam_id}/",
+            "avatarfull": f"https://avatars.steamstatic.com/{n:040x}_full.jpg",
+            "personastate": n % 7,
+            "loccountrycode": ("US", "KR", "DE", "BR", "JP")[n % 5],
+            "timecreated": 1200000000 + n * 1000,
+        }
+
+    def _player_summaries(self, q: httpx.QueryParams) -> dict[str, Any]:
+        ids = [
+            s for s in q.get("steamids", "").split(",") if s and s not in self.config.missing_ids
+        ]
+        return {"response": {"players": [self._player(s) for s in ids]}}
+
+    def _friend_list(self, q: httpx.QueryParams) -> dict[str, Any] | httpx.Response:
+        if q.get("steamid") in self.config.private_ids:
+            return httpx.Response(401, text="<html><head><title>Unauthorized</title></head></html>")
+        return {"friendslist": {"friends": [
+            {
+                "steamid": str(STEAM_ID_BASE + 1000 + i),
+                "relationship": "friend",
+                "friend_since": 1400000000 + i
+            }
+            for i in range(self.config.friends)
+        ]}}
+
+    def _player_bans(self, q: httpx.QueryParams) -> dict[str, Any]:
+        ids = [s for s in q.get("steamids", "").split(",") if s]
+        return {"players": [
+            {"SteamId": s, "CommunityBanned": False, "VACBanned": False, "NumberOfVACBans": 0,
+             "DaysSinceLastBan": 0, "NumberOfGameBans": 0, "EconomyBan": "none"}
+            for s in ids
+        ]}
+
+    def _resolve_vanity(self, q: httpx.QueryParams) -> dict[str, Any]:
+        vanity = q.get("vanityurl", "")
+        if vanity.startswith("missing"):
+            return {"response": {"success": 42, "message": "No match"}}
+        return {"response": {"steamid": str(STEAM_ID_BASE + sum(map(ord, vanity))), "success": 1}}
+
+    def _game(self, appid: int, i: int) -> dict[str, Any]:
+        return {
+            "appid": appid,
+            "name": f"Game {appid}",
+            "playtime_forever": (i * 7919) % 50000,
+            "playtime_2weeks": (i * 31) % 600 if i < 20 else 0,
+            "img_icon_url": f"{appid:040x}",
+            "has_community_visible_stats": i % 3 != 0,
+            "rtime_last_played": 1700000000 - i * 3600,
+        }
+
+    def _owned_games(self, q: httpx.QueryParams) -> dict[str, Any]:
+        if q.get("steamid") in self.config.private_ids:
+            return {"response": {}}
+        games = [self._game(10 + i * 10, i) for i in range(self.config.owned_games)]
+        return {"response": {"game_count": len(games), "games": games}}
+
+    def _recently_played(self, q: httpx.QueryParams) -> dict[str, Any]:
+        if q.get("steamid") in self.config.private_ids:
+            return {"response": {}}
+        count = int(q.get("count", 10))
+        games = [self._game(10 + i * 10, i) for i in range(min(count, 20))]
+        return {"response": {"total_count": len(games), "games": games}}
+
+    def _player_achievements(self, q: httpx.QueryParams) -> dict[str, Any] | httpx.Response:
+        appid = int(q.get("appid", 0))
+        if q.get("steamid") in self.config.private_ids:
+            return httpx.Response(
+                403, json={"playerstats": {"error": "Profile is not public", "success": False}}
+            )
+        if appid in self.config.no_stats_apps:
+            return httpx.Response(
+                400, json={"playerstats": {"error": "Requested app has no stats", "success": False}}
+            )
+        rng = random.Random(appid)
+        return {"playerstats": {
+            "steamID": q.get("steamid"),
+            "gameName": f"Game {appid}",
+            "achievements": [
+                {"apiname": f"ACH_{i}", "achieved": int(rng.random() < 0.4),
+                 "unlocktime": 1600000000 + i, "name": f"Achievement {i}",
+                 "description": self._text(appid * 1000 + i, 12)}
+                for i in range(self.config.achievements)
+            ],
+            "success": True,
+        }}
+
+    def _global_percentages(self, q: httpx.QueryParams) -> dict[str, Any]:
+        rng = random.Random(int(q.get("gameid", 0)))
+        return {"achievementpercentages": {"achievements": [
+            {"name": f"ACH_{i}", "percent": f"{rng.uniform(0.1, 95):.1f}"}
+            for i in range(self.config.achievements)
+        ]}}
+
+    def _schema(self, q: httpx.QueryParams) -> dict[str, Any]:
+        appid = int(q.get("appid", 0))
+        return {"game": {
+            "gameName": f"Game {appid}",
+            "gameVersion": "12",
+            "availableGameStats": {
+                "achievements": [
+                    {"name": f"ACH_{i}", "defaultvalue": 0, "displayName": f"Achievement {i}",
+                     "hidden": 0,
+                     "description": self._text(appid * 1000 + i, 12),
+                     "icon": f"https://cdn.steamstatic.com/{appid}/{i:040x}.jpg",
+                     "icongray": f"https://cdn.steamstatic.com/{appid}/{i:040x}_gray.jpg"}
+                    for i in range(self.config.achievements)
+                ],
+                "stats": [
+                    {"name": f"STAT_{i}", "defaultvalue": 0, "displayName": f"Stat {i}"}
+                    for i in range(40)
+                ],
+            },
+        }}
+
+    def _news(self, q: httpx.QueryParams) -> dict[str, Any]:
+        appid = int(q.get("appid", 0))
+        count = int(q.get("count", 20))
+        max_length = int(q.get("maxlength", 0)) or 4000
+        enddate = int(q.get("enddate", 1800000000))
+        items = []
+        for i in range(count):
+            date = min(enddate, 1700000000) - i * 86400 - appid % 86400
+            items.append({
+                "gid": str(appid * 100000 + (1700000000 - date) // 60),
+                "title": f"Update {i} for {appid}",
+                "url": f"https://store.steampowered.com/news/app/{appid}/view/{i}",
+                "author": "dev",
+                "contents": self._text(appid + i, 800)[:max_length],
+                "feedlabel": "Community Announcements",
+                "date": date,
+                "feedname": "steam_community_announcements",
+                "appid": appid,
+            })
+        return {"appnews": {"appid": appid, "newsitems": items, "count": 500}}
+
+    def _file(self, file_id: int) -> dict[str, Any]:
+        return {
+            "result": 1,
+            "publishedfileid": str(file_id),
+            "creator": str(STEAM_ID_BASE + file_id % 5000),
+            "consumer_appid": 4000,
+            "filename": f"mod_{file_id}.bin",
+            "file_size": str(1000 + file_id % 10**7),
+            "title": f"Workshop item {file_id}",
+            "file_description": self._text(file_id, 150),
+            "subscriptions": file_id % 100000,
+            "favorited": file_id % 5000,
+            "tags": [{"tag": "Map"}, {"tag": "Addon"}],
+        }
+
+    def _query_files(self, q: httpx.QueryParams) -> dict[str, Any]:
+        count = int(q.get("numperpage", 30))
+        page = int(q.get("page", 1))
+        return {"response": {"total": 100000, "publishedfiledetails": [
+            self._file(1000000 + page * count + i) for i in range(count)
+        ]}}
+
+    def _file_details(self, q: httpx.QueryParams) -> dict[str, Any]:
+        ids = [v for k, v in q.multi_items() if re.fullmatch(r"publishedfileids(\[\d+\])?", k)]
+        ids = [int(i) for v in ids for i in v.split(",") if i]
+        return {"response": {"result": 1, "resultcount": len(ids),
+                             "publishedfiledetails": [self._file(i) for i in ids]}}
+
+    def _app_details(self, q: httpx.QueryParams) -> dict[str, Any]:
+        cc = q.get("cc", "us").upper()
+        price_only = q.get("filters") == "price_overview"
+        result = {}
+        for appid in (int(a) for a in q.get("appids", "").split(",") if a):
+            initial = 999 + (appid % 50) * 100
+            discount = (appid // 10) % 4 * 25 % 100
+            price = {
+                "currency": CURRENCIES.get(cc, "USD"),
+                "initial": initial,
+                "final": initial * (100 - discount) // 100,
+                "discount_percent": discount,
+                "initial_formatted": "",
+                "final_formatted": f"${initial * (100 - discount) / 10000:.2f}",
+            }
+            if price_only:
+                result[str(appid)] = {"success": True, "data": {"price_overview": price}}
+                continue
+            result[str(appid)] = {"success": True, "data": {
+                "type": "game",
+                "name": f"Game {appid}",
+                "steam_appid": appid,
+                "detailed_description": self._text(appid, 600),
+                "about_the_game": self._text(appid + 1, 400),
+                "short_description": self._text(appid + 2, 30),
+                "developers": ["Mock Studio"],
+                "publishers": ["Mock Publisher"],
+                "price_overview": price,
+                "genres": [{"id": "1", "description": "Action"}],
+                "screenshots": [
+                    {"id": i, "path_full": f"https://cdn.steamstatic.com/{appid}/{i}.jpg"}
+                    for i in range(20)
+                ],
+                "release_date": {"coming_soon": False, "date": "1 Jan, 2020"},
+            }}
+        return result
+
+    def _store_search(self, q: httpx.QueryParams) -> dict[str, Any]:
+        term = q.get("term", "")
+        return {"total": 50, "items": [
+            {"type": "app", "name": f"{term} {i}", "id": 1000 + i * 10,
+             "price": {"currency": "USD", "initial": 1999, "final": 999}, "metascore": "80"}
+            for i in range(50)
+        ]}
+
+    def _reviews(self, q: httpx.QueryParams) -> dict[str, Any]:
+        appid = int(q.get("appid", 0))
+        count = int(q.get("num_per_page", 20))
+        return {"success": 1, "query_summary": {"num_reviews": count}, "reviews": [
+            {"recommendationid": str(appid * 1000 + i),
+             "author": {"steamid": str(STEAM_ID_BASE + i), "playtime_forever": i * 60},
+             "review": self._text(appid * 7 + i, 200), "voted_up": i % 4 != 0,
+             "votes_up": i, "votes_funny": 0, "timestamp_created": 1690000000 + i}
+            for i in range(count)
+        ], "cursor": "AoJ4"}
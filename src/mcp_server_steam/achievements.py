@@ -0,0 +1,191 @@
+"""Rarity-weighted achievement scoring for mcp-server-steam."""
+
+import asyncio
+import logging
+from typing import Any
+
+import httpx
+
+from mcp_server_steam.deadline import DeadlineExceeded, gather_partial
+from mcp_server_steam.steam_client import SteamAPIClient, SteamAPIError
+
+logger = logging.getLogger(__name__)
+
+# Unlock rates below this are clamped so a 0% achievement doesn't get infinite weight
+MIN_PERCENT = 0.1
+
+# Maximum number of games analysed concurrently in library mode
+MAX_CONCURRENT_GAMES = 5
+
+
+def rarity_weight(percent: float) -> float:
+    """Weight of an achievement: 1 point at 100% global unlock rate, 100 points at 1%."""
+    return 100.0 / max(percent, MIN_PERCENT)
+
+
+def score_achievements(
+    player_achievements: list[dict[str, Any]],
+    global_percentages: list[dict[str, Any]]
+) -> dict[str, Any]:
+    """
+    Join a player's achievements with global unlock rates and score them.
+
+    The join is a single hash join on the achievement API name: global rates
+    are indexed once, then every player achievement is looked up in O(1).
+
+    Args:
+        player_achievements: Entries of GetPlayerAchievements (apiname, achieved, unlocktime)
+        global_percentages: Entries of GetGlobalAchievementPercentagesForApp (name, percent)
+
+    Returns:
+        Dictionary with unlock counts, rarity score (0-100) and unlocked
+        achievements sorted from rarest to most common. Counts and score
+        cover only achievements with a global unlock rate; the rest are
+        counted as unmatched
+    """
+    percent_by_name = {a["name"]: float(a["percent"]) for a in global_percentages}
+
+    earned_weight = 0.0
+    possible_weight = 0.0
+    scored = 0
+    unlocked = []
+    for achievement in player_achievements:
+        percent = percent_by_name.get(achievement["apiname"])
+        if percent is None:
+            continue
+        scored += 1
+        weight = rarity_weight(percent)
+        possible_weight += weight
+        if achievement.get("achieved"):
+            earned_weight += weight
+            unlocked.append({
+                "apiname": achievement["apiname"],
+                "name": achievement.get("name", achievement["apiname"]),
+                "percent": round(percent, 2),
+                "unlocktime": achievement.get("unlocktime"),
+            })
+
+    unlocked.sort(key=lambda a: a["percent"])
+    return {
+        "unlocked": len(unlocked),
+        "total": scored,
+        # Achievements without a global unlock rate count in neither total nor score
+        "unmatched": len(player_achievements) - scored,
+        "earned_weight": round(earned_weight, 2),
+        "possible_weight": round(possible_weight, 2),
+        "rarity_score": round(100 * earned_weight / possible_weight, 2) if possible_weight else 0.0,
+        "rarest_unlocks": unlocked,
+    }
+
+
+async def fetch_player_achievements(
+    client: SteamAPIClient,
+    steam_id: str,
+    app_id: int
+) -> tuple[str | None, list[dict[str, Any]]]:
+    """Fetch a player's achievements for one game.
+
+    Returns:
+        Tuple of (game name, achievements)
+    """
+    params = {"steamid": steam_id, "appid": app_id, "l": "english"}
+    result = await client.get(
+        "ISteamUserStats", "GetPlayerAchievements", version="v0001", params=params
+    )
+
+    stats = result.get("playerstats", {})
+    return stats.get("gameName"), stats.get("achievements", [])
+
+
+async def fetch_global_percentages(client: SteamAPIClient, app_id: int) -> list[dict[str, Any]]:
+    """Fetch global unlock rates for one game (served from the long-term cache)."""
+    params = {"gameid": app_id, "l": "english"}
+    result = await client.get(
+        "ISteamUserStats", "GetGlobalAchievementPercentagesForApp", version="v0002", params=params
+    )
+
+    return result.get("achievementpercentages", {}).get("achievements", [])
+
+
+async def score_game(client: SteamAPIClient, steam_id: str, app_id: int) -> dict[str, Any]:
+    """Fetch and score a player's achievements for one game."""
+    (game_name, player_achievements), global_percentages = await asyncio.gather(
+        fetch_player_achievements(client, steam_id, app_id),
+        fetch_global_percentages(client, app_id),
+    )
+    return {
+        "appid": app_id,
+        "name": game_name,
+        **score_achievements(player_achievements, global_percentages),
+    }
+
+
+async def build_rarity_report(
+    client: SteamAPIClient,
+    steam_id: str,
+    app_ids: list[int],
+    top_n: int = 10
+) -> dict[str, Any]:
+    """
+    Score a player's achievements across several games.
+
+    Games that fail (no stats, private profile, ...) are listed under
+    ``skipped`` instead of failing the whole report. Games not finished by
+    the tool call's deadline are listed under ``timed_out`` and the report
+    is marked ``partial``.
+
+    Args:
+        client: Open Steam API client
+        steam_id: 64-bit Steam ID
+        app_ids: Games to analyse
+        top_n: Number of rarest unlocks to return overall and per game
+
+    Returns:
+        Library-wide score, per-game scores and the rarest unlocks
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_GAMES)
+
+    async def run(app_id: int) -> dict[str, Any] | None:
+        async with semaphore:
+            try:
+                return await score_game(client, steam_id, app_id)
+            except DeadlineExceeded:
+                raise
+            except (SteamAPIError, httpx.HTTPError) as e:
+                logger.info(f"Skipping app {app_id} in rarity report: {str(e)}")
+                return None
+
+    # Games still being scored at the deadline are cancelled and reported as timed out
+    results = await gather_partial(*(run(app_id) for app_id in app_ids))
+
+    games = []
+    skipped = []
+    timed_out = []
+    rarest = []
+    earned_weight = 0.0
+    possible_weight = 0.0
+    for app_id, game in zip(app_ids, results):
+        if isinstance(game, DeadlineExceeded):
+            timed_out.append(app_id)
+            continue
+        if game is None or not game["total"]:
+            skipped.append(app_id)
+            continue
+        earned_weight += game["earned_weight"]
+        possible_weight += game["possible_weight"]
+        rarest.extend({"appid": app_id, "game": game["name"], **a} for a in game["rarest_unlocks"])
+        game["rarest_unlocks"] = game["rarest_unlocks"][:top_n]
+        games.append(game)
+
+    rarest.sort(key=lambda a: a["percent"])
+    games.sort(key=lambda g: g["rarity_score"], reverse=True)
+    return {
+        "steamid": steam_id,
+        "rarity_score": round(100 * earned_weight / possible_weight, 2) if possible_weight else 0.0,
+        "games_analyzed": len(games),
+        "rarest_unlocks": rarest[:top_n],
+        "games": games,
+        "skipped": skipped,
+        "partial": bool(timed_out),
+        "timed_out": timed_out,
+    }
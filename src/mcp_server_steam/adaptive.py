@@ -0,0 +1,233 @@
+"""Adaptive (AIMD) concurrency and rate limits per upstream host.
+
+Each host (the Web API and the store) has a concurrency limit and a rate
+factor applied to its token buckets. While responses are healthy and the
+limits are actually in use, they grow additively: concurrency by one and
+the rate by RATE_STEP of the configured rate, once per limit's worth of
+responses. A 429, a 5xx, a failed request or a slow latency window cuts
+both multiplicatively. Latency is judged per window of LATENCY_WINDOW
+responses: the window's p90 is compared with a baseline of earlier windows'
+p90s, so a few slow responses in healthy traffic cut nothing and a slow
+window cuts once. Only responses to requests sent after the last cut can
+cut again, so one bad burst halves the limits once, not once per request.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any
+
+from mcp_server_steam.config import settings
+from mcp_server_steam.metrics import metrics
+
+# Share of the configured rate added per increase
+RATE_STEP = 0.1
+
+# Factor applied to concurrency and rate on a cut
+DECREASE_FACTOR = 0.5
+
+# Lowest rate factor a host can be cut to; the key pool's cooldowns handle harder limits
+MIN_RATE_FACTOR = 0.5
+
+# Responses per latency window; each window is judged once, then cleared
+LATENCY_WINDOW = 50
+
+# Percentile of a window compared with the baseline
+LATENCY_PERCENTILE = 0.9
+
+# Weight of a new window's percentile in the latency baseline
+LATENCY_EWMA_ALPHA = 0.2
+
+# Window percentiles below this are never spikes, however small the baseline
+MIN_SPIKE_SECONDS = 0.25
+
+
+class AdaptiveLimit:
+    """AIMD-controlled concurrency limit and rate factor of one upstream host."""
+
+    def __init__(
+        self,
+        host: str,
+        initial_concurrency: int = 8,
+        max_concurrency: int = 64,
+        max_rate_factor: float = 1.0,
+        latency_spike: float = 3.0
+    ):
+        """
+        Args:
+            host: Host label in metrics ("api", "store")
+            initial_concurrency: Requests in flight allowed at start
+            max_concurrency: Highest concurrency limit
+            max_rate_factor: Highest multiple of the configured rate
+            latency_spike: Multiple of the baseline p90 latency that counts as a spike
+        """
+        self.host = host
+        self.concurrency = float(initial_concurrency)
+        self.max_concurrency = max_concurrency
+        self.rate_factor = 1.0
+        self.max_rate_factor = max_rate_factor
+        self.latency_spike = latency_spike
+        self.in_flight = 0
+        self.baseline: float | None = None
+        self.window: list[float] = []
+        self.cut_at = 0.0
+        self.cuts = 0
+        self.limiters: list[Any] = []
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def limit(self) -> int:
+        """Requests allowed in flight right now."""
+        return max(1, int(self.concurrency))
+
+    def attach(self, limiter) -> None:
+        """Scale a RateLimiter with this host's rate factor.
+
+        The factor is kept on the limiter apart from its configured rate, so
+        rates changed after attaching (settings, benchmarks) still apply.
+        """
+        self.limiters.append(limiter)
+        limiter.factor = self.rate_factor
+
+    async def acquire(self, timeout: float | None = None) -> bool:
+        """
+        Wait for an in-flight slot.
+
+        Returns:
+            False if no slot freed up within timeout seconds
+        """
+        if self.try_acquire():
+            return True
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+            return True
+        except asyncio.TimeoutError:
+            # Woken in the same tick the timeout fired: the slot is ours
+            return waiter.done() and not waiter.cancelled()
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                # Woken, then cancelled: pass the slot on
+                self.release()
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+    def try_acquire(self) -> bool:
+        """Take a slot only if one is free right now."""
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            return True
+        return False
+
+    def release(self) -> None:
+        """Free a slot taken by acquire()."""
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        # The slot moves to the waiter, so in_flight is counted for it here
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def record(self, sent_at: float, latency: float | None, status: int | None) -> None:
+        """
+        Adjust the limits from one response.
+
+        Args:
+            sent_at: time.monotonic() when the request was sent
+            latency: Seconds until the response (None if the request failed)
+            status: HTTP status (None if the request failed)
+        """
+        if status is None or status == 429 or status >= 500:
+            self._decrease(sent_at, "error" if status is None else str(status))
+            return
+
+        self.window.append(latency)
+        if len(self.window) >= LATENCY_WINDOW and self._slow_window():
+            self._decrease(sent_at, "latency")
+            return
+
+        # Only grow limits that are in use; an idle limit proves nothing
+        if self.in_flight + 1 >= self.limit and self.concurrency < self.max_concurrency:
+            self.concurrency = min(self.max_concurrency, self.concurrency + 1 / self.concurrency)
+        busy = any(l.headroom() < 0.5 for l in self.limiters)
+        if self.rate_factor < self.max_rate_factor and busy:
+            # One step per period's worth of responses at the current rate
+            rate = self.rate_factor * sum(l.rate for l in self.limiters)
+            self.rate_factor = min(self.max_rate_factor, self.rate_factor + RATE_STEP / rate)
+            self._apply_rate()
+        self._publish()
+
+    def _slow_window(self) -> bool:
+        """Judge the full latency window against the baseline, fold it in and start a new one."""
+        ordered = sorted(self.window)
+        percentile = ordered[min(len(ordered) - 1, int(len(ordered) * LATENCY_PERCENTILE))]
+        self.window.clear()
+        slow = (
+            self.baseline is not None
+            and percentile > max(MIN_SPIKE_SECONDS, self.baseline * self.latency_spike)
+        )
+        # Slow windows count too, so a lasting slowdown becomes the new
+        # baseline instead of cutting the limits forever
+        if self.baseline is None:
+            self.baseline = percentile
+        else:
+            self.baseline += LATENCY_EWMA_ALPHA * (percentile - self.baseline)
+        return slow
+
+    def _decrease(self, sent_at: float, reason: str) -> None:
+        if sent_at < self.cut_at:
+            # Sent before the last cut: already accounted for
+            return
+        self.concurrency = max(1.0, self.concurrency * DECREASE_FACTOR)
+        self.rate_factor = max(MIN_RATE_FACTOR, self.rate_factor * DECREASE_FACTOR)
+        self.cut_at = time.monotonic()
+        self.cuts += 1
+        self._apply_rate()
+        metrics.inc("steam_adaptive_cuts_total", host=self.host, reason=reason)
+        self._publish()
+
+    def _apply_rate(self) -> None:
+        for limiter in self.limiters:
+            limiter.factor = self.rate_factor
+
+    def _publish(self) -> None:
+        metrics.set_gauge("steam_adaptive_concurrency", self.limit, host=self.host)
+        metrics.set_gauge("steam_adaptive_rate_factor", round(self.rate_factor, 3), host=self.host)
+
+    def state(self) -> dict[str, Any]:
+        """Current limits for diagnostics."""
+        baseline_ms = round(self.baseline * 1000, 1) if self.baseline is not None else None
+        return {
+            "host": self.host,
+            "concurrency_limit": self.limit,
+            "in_flight": self.in_flight,
+            "rate_factor": round(self.rate_factor, 3),
+            "latency_p90_baseline_ms": baseline_ms,
+            "cuts": self.cuts,
+        }
+
+
+def _limit(host: str) -> AdaptiveLimit:
+    return AdaptiveLimit(
+        host,
+        initial_concurrency=settings.adaptive_initial_concurrency,
+        max_concurrency=settings.adaptive_max_concurrency,
+        max_rate_factor=settings.adaptive_max_rate_factor,
+        latency_spike=settings.adaptive_latency_spike
+    )
+
+
+# Global per-host limits; the client attaches the hosts' rate limiters
+adaptive_limits = {"api": _limit("api"), "store": _limit("store")}
+
+
+def adaptive_states() -> list[dict[str, Any]]:
+    """State of every host's limits."""
+    return [limit.state() for limit in adaptive_limits.values()]
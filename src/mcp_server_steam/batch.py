@@ -0,0 +1,90 @@
+"""Run many tool invocations in one MCP call."""
+
+import asyncio
+import json
+import logging
+from typing import Any
+
+from mcp_server_steam.deadline import DeadlineExceeded, gather_partial
+
+logger = logging.getLogger(__name__)
+
+# Most invocations accepted in one batch
+MAX_BATCH_CALLS = 50
+
+# Sub-calls running at once; upstream requests still share the rate limiters
+MAX_BATCH_CONCURRENCY = 8
+
+
+def _call_key(call: dict[str, Any]) -> str:
+    """Identity of an invocation: tool name plus canonical JSON arguments."""
+    return json.dumps([call.get("tool"), call.get("arguments") or {}], sort_keys=True, default=str)
+
+
+async def _invoke(mcp, call: dict[str, Any]) -> Any:
+    """Run one invocation and unwrap its structured result."""
+    name = call.get("tool")
+    arguments = call.get("arguments") or {}
+    if not isinstance(name, str) or not isinstance(arguments, dict):
+        raise ValueError("Each call needs a 'tool' name and an 'arguments' object")
+    if name == "batch":
+        raise ValueError("batch can't be nested")
+
+    # The batch call itself went through the middleware (deadline, metrics,
+    # stale data notice); sub-calls run directly under it
+    tool = await mcp.get_tool(name)
+    result = await mcp.call_tool(name, arguments, run_middleware=False)
+    if result.structured_content is not None:
+        if (tool.output_schema or {}).get("x-fastmcp-wrap-result"):
+            return result.structured_content.get("result")
+        return result.structured_content
+    return "\n".join(getattr(block, "text", "") for block in result.content)
+
+
+async def run_batch(mcp, calls: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Run tool invocations concurrently and return their outcomes in order.
+
+    Identical invocations (same tool and arguments) run once and share their
+    outcome. A failing invocation doesn't affect the others. Invocations not
+    finished by the tool call's deadline are cancelled and reported as errors.
+
+    Args:
+        mcp: Server whose tools are invoked
+        calls: Invocations as {"tool": name, "arguments": {...}}
+
+    Returns:
+        One {"tool", "ok", "result" | "error"} entry per invocation, in input order
+
+    Raises:
+        ValueError: If the batch is empty or too large
+    """
+    if not calls:
+        raise ValueError("calls is empty")
+    if len(calls) > MAX_BATCH_CALLS:
+        raise ValueError(f"A batch holds at most {MAX_BATCH_CALLS} calls, got {len(calls)}")
+
+    unique: dict[str, dict[str, Any]] = {}
+    for call in calls:
+        unique.setdefault(_call_key(call), call)
+
+    semaphore = asyncio.Semaphore(MAX_BATCH_CONCURRENCY)
+
+    async def run(call: dict[str, Any]) -> Any:
+        async with semaphore:
+            return await _invoke(mcp, call)
+
+    outcomes = dict(zip(unique, await gather_partial(*(run(call) for call in unique.values()))))
+
+    results = []
+    for call in calls:
+        outcome = outcomes[_call_key(call)]
+        entry: dict[str, Any] = {"tool": call.get("tool")}
+        if isinstance(outcome, Exception):
+            if not isinstance(outcome, DeadlineExceeded):
+                logger.info(f"Batch call {call.get('tool')} failed: {str(outcome)}")
+            entry.update(ok=False, error=str(outcome))
+        else:
+            entry.update(ok=True, result=outcome)
+        results.append(entry)
+    return results
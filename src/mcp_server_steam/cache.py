@@ -0,0 +1,338 @@
+"""In-memory response cache for Steam API requests."""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterator
+
+from mcp_server_steam.config import settings
+from mcp_server_steam.deadline import DeadlineExceeded, expired
+from mcp_server_steam.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Caching policy for a single Steam API endpoint.
+
+    Args:
+        ttl: Seconds an entry stays fresh
+        refresh_after: Age in seconds after which a hit also triggers a
+            background refresh (None: only refresh hot keys ahead of expiry)
+        stale_ttl: Seconds past expiry an entry is still served while it is
+            refreshed in the background (None: same as ttl)
+        revalidate: Refresh an entry with a conditional request (ETag,
+            Last-Modified) and a body hash check instead of a plain fetch
+    """
+
+    ttl: float
+    refresh_after: float | None = None
+    stale_ttl: float | None = None
+    revalidate: bool = False
+
+    @property
+    def max_age(self) -> float:
+        """Age after which an entry can no longer be served at all."""
+        return self.ttl + (self.ttl if self.stale_ttl is None else self.stale_ttl)
+
+
+# Per-endpoint policies keyed by "Interface/Method"; endpoints not listed are not cached
+CACHE_POLICIES: dict[str, CachePolicy] = {
+    "ISteamUser/GetPlayerSummaries": CachePolicy(ttl=300),
+    "IPlayerService/GetSteamLevel": CachePolicy(ttl=3600),
+    "IPlayerService/GetOwnedGames": CachePolicy(ttl=600),
+    "IPlayerService/GetRecentlyPlayedGames": CachePolicy(ttl=300),
+    "ISteamUserStats/GetSchemaForGame": CachePolicy(ttl=24 * 3600, refresh_after=6 * 3600),
+    # Global unlock rates move slowly, keep them for a day and refresh every 6 hours
+    "ISteamUserStats/GetGlobalAchievementPercentagesForApp": CachePolicy(
+        ttl=24 * 3600, refresh_after=6 * 3600
+    ),
+    # News has no validators upstream; unchanged bodies are detected by hash
+    "ISteamNews/GetNewsForApp": CachePolicy(ttl=600, revalidate=True),
+    # Store routes, keyed by store_endpoint() labels
+    "store/api/appdetails": CachePolicy(ttl=3600, revalidate=True),
+    "store/appreviews/{id}": CachePolicy(ttl=1800, revalidate=True),
+}
+
+# Hot keys are refreshed once they have used this fraction of their TTL
+REFRESH_AHEAD_FRACTION = 0.8
+
+# Entries served past their policy during an upstream outage, per tool call
+_stale_reads: ContextVar[list[dict[str, Any]] | None] = ContextVar("stale_reads", default=None)
+
+
+@contextmanager
+def track_stale_reads() -> Iterator[list[dict[str, Any]]]:
+    """Collect the outage fallbacks (cache key and age) served within the block."""
+    reads: list[dict[str, Any]] = []
+    token = _stale_reads.set(reads)
+    try:
+        yield reads
+    finally:
+        _stale_reads.reset(token)
+
+
+@dataclass
+class Validators:
+    """What a cached response is revalidated with: HTTP validators and a hash of its body."""
+
+    etag: str | None = None
+    last_modified: str | None = None
+    content_hash: str | None = None
+
+
+@dataclass
+class Revalidated:
+    """Fetch result that carries the validators to store next to its value."""
+
+    value: Any
+    validators: Validators
+
+
+@dataclass
+class CacheEntry:
+    """A cached value with its storage time, hit count and validators."""
+
+    value: Any
+    stored_at: float
+    ttl: float
+    hits: int = 0
+    validators: Validators | None = None
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.stored_at
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.age < self.ttl
+
+
+def make_cache_key(url: str, params: dict[str, Any] | None = None) -> str:
+    """Build a normalized cache key for a request.
+
+    The API key is never part of the cache key, and parameters are sorted
+    so that equivalent requests share one entry.
+    """
+    if not params:
+        return url
+    items = sorted((k, str(v)) for k, v in params.items() if k != "key")
+    return url + "?" + "&".join(f"{k}={v}" for k, v in items)
+
+
+class ResponseCache:
+    """LRU cache of decoded Steam API responses with stale-while-revalidate.
+
+    A miss is fetched once no matter how many callers wait on it. An expired
+    entry within its stale window is returned at once while a single
+    background task refreshes it, and hot entries are refreshed shortly
+    before they expire so callers rarely see a miss at all.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        max_background_refreshes: int = 4,
+        hot_key_hits: int = 3
+    ):
+        """
+        Args:
+            max_entries: Maximum number of entries kept before LRU eviction
+            max_background_refreshes: Maximum number of concurrent background refreshes
+            hot_key_hits: Hits after which an entry is refreshed ahead of expiry
+        """
+        self.max_entries = max_entries
+        self.max_background_refreshes = max_background_refreshes
+        self.hot_key_hits = hot_key_hits
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._background: set[str] = set()
+        # Second tier shared with other worker processes (see shared_state.py)
+        self.shared = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any | None:
+        """Return a fresh cached value, or None."""
+        entry = self._entries.get(key)
+        if entry is None or not entry.is_fresh:
+            return None
+        self._entries.move_to_end(key)
+        return entry.value
+
+    def peek(self, key: str) -> CacheEntry | None:
+        """Return the entry for a key at any age, without counting a hit."""
+        return self._entries.get(key)
+
+    def set(self, key: str, value: Any, ttl: float, validators: Validators | None = None) -> None:
+        """Store a value, evicting the least recently used entries if needed."""
+        self._entries[key] = CacheEntry(
+            value=value, stored_at=time.monotonic(), ttl=ttl, validators=validators
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and cancel pending fetches."""
+        self._entries.clear()
+        for task in self._inflight.values():
+            task.cancel()
+        self._inflight.clear()
+        self._background.clear()
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        policy: CachePolicy,
+        refresh: Callable[[], Awaitable[Any]] | None = None,
+        fallback_errors: tuple[type[BaseException], ...] = ()
+    ) -> Any:
+        """
+        Return a cached value or fetch and store it.
+
+        Args:
+            key: Normalized cache key (see make_cache_key)
+            fetch: Coroutine factory used on a miss. It may return a
+                Revalidated result to store validators with the value.
+            policy: TTL, stale window and background refresh policy for the entry
+            refresh: Coroutine factory used for background refreshes. It must
+                not depend on the caller's HTTP client, which may be closed
+                by the time the refresh runs. None disables background
+                refreshes for this call; stale entries are still served.
+            fallback_errors: Fetch errors on which an entry past its max age
+                is returned anyway, reported through track_stale_reads()
+
+        Returns:
+            Cached or freshly fetched value
+        """
+        entry = self._entries.get(key)
+        if self.shared is not None and (entry is None or entry.age >= policy.max_age):
+            entry = self._load_shared(key, policy) or entry
+        if entry is not None and entry.age < policy.max_age:
+            self._entries.move_to_end(key)
+            entry.hits += 1
+            metrics.inc("steam_cache_requests_total", result="hit" if entry.is_fresh else "stale")
+            if refresh is not None and self._needs_refresh(entry, policy):
+                self._schedule_refresh(key, refresh, policy)
+            return entry.value
+
+        metrics.inc("steam_cache_requests_total", result="miss")
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._start_fetch(key, fetch, policy)
+        try:
+            try:
+                # Shield the shared fetch so one cancelled caller doesn't fail the others
+                return await asyncio.shield(task)
+            except DeadlineExceeded:
+                # The fetch ran out of the time of the call that started it; this
+                # caller may have more left
+                if expired():
+                    raise
+                retry = self._inflight.get(key)
+                if retry is None or retry is task:
+                    retry = self._start_fetch(key, fetch, policy)
+                return await asyncio.shield(retry)
+        except fallback_errors as e:
+            if entry is None:
+                raise
+            logger.warning(f"Serving {entry.age:.0f}s old entry for {key}: {str(e)}")
+            metrics.inc("steam_cache_requests_total", result="outage_fallback")
+            reads = _stale_reads.get()
+            if reads is not None:
+                reads.append({"key": key, "age_s": round(entry.age)})
+            return entry.value
+
+    def _load_shared(self, key: str, policy: CachePolicy) -> CacheEntry | None:
+        """Copy an entry stored by another worker into this process, keeping its age."""
+        try:
+            stored = self.shared.cache_get(key)
+        except Exception as e:
+            logger.warning(f"Shared cache read failed for {key}: {str(e)}")
+            return None
+        if stored is None:
+            return None
+        value, age = stored
+        self.set(key, value, policy.ttl)
+        entry = self._entries[key]
+        entry.stored_at -= age
+        return entry
+
+    def _needs_refresh(self, entry: CacheEntry, policy: CachePolicy) -> bool:
+        """Whether a served entry should be refreshed in the background."""
+        age = entry.age
+        if age >= entry.ttl:
+            return True
+        if policy.refresh_after is not None and age >= policy.refresh_after:
+            return True
+        return entry.hits >= self.hot_key_hits and age >= entry.ttl * REFRESH_AHEAD_FRACTION
+
+    def _start_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        policy: CachePolicy
+    ) -> asyncio.Task:
+        """Start a shared fetch that stores its result in the cache."""
+
+        async def run() -> Any:
+            value = await fetch()
+            validators = None
+            if isinstance(value, Revalidated):
+                value, validators = value.value, value.validators
+            self.set(key, value, policy.ttl, validators)
+            if self.shared is not None:
+                try:
+                    self.shared.cache_set(key, value, policy.max_age)
+                except Exception as e:
+                    logger.warning(f"Shared cache write failed for {key}: {str(e)}")
+            return value
+
+        def done(task: asyncio.Task) -> None:
+            if self._inflight.get(key) is task:
+                del self._inflight[key]
+            self._background.discard(key)
+            # Retrieve the exception so abandoned fetches don't log "never retrieved"
+            if not task.cancelled() and task.exception() is not None:
+                logger.debug(f"Fetch failed for {key}: {str(task.exception())}")
+
+        task = asyncio.create_task(run())
+        task.add_done_callback(done)
+        self._inflight[key] = task
+        return task
+
+    def _schedule_refresh(
+        self,
+        key: str,
+        refresh: Callable[[], Awaitable[Any]],
+        policy: CachePolicy
+    ) -> None:
+        """Start a background refresh unless one is running or the cap is reached."""
+        if key in self._inflight or len(self._background) >= self.max_background_refreshes:
+            return
+
+        async def run() -> Any:
+            try:
+                return await refresh()
+            except Exception as e:
+                logger.warning(f"Background refresh failed for {key}: {str(e)}")
+                raise
+
+        self._background.add(key)
+        self._start_fetch(key, run, policy)
+
+
+# Global response cache
+response_cache = ResponseCache(
+    max_entries=settings.cache_max_entries,
+    max_background_refreshes=settings.cache_max_background_refreshes,
+    hot_key_hits=settings.cache_hot_key_hits
+)
@@ -0,0 +1,186 @@
+"""Record and replay upstream Steam responses ("cassettes").
+
+A cassette is a gzip-compressed JSON Lines file with one recorded response
+per line, indexed by a normalized request key that never contains the API
+key. Recording wraps the real HTTP transport; replay answers from the
+cassette with the recorded latency or none at all, so production
+problems can be reproduced offline and load tests get deterministic input.
+"""
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import time
+from collections import Counter, defaultdict
+from typing import Any
+
+import httpx
+
+from mcp_server_steam.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Response headers kept in a cassette; everything else is transport-specific
+RECORDED_HEADERS = ("content-type", "etag", "last-modified", "cache-control")
+
+# Recordings are flushed to disk after this many new entries
+SAVE_EVERY = 25
+
+
+def request_key(request: httpx.Request) -> str:
+    """Normalized key of a request: method, host, path and sorted query without the API key."""
+    url = request.url
+    query = sorted((k, v) for k, v in url.params.multi_items() if k != "key")
+    return f"{request.method} {url.host}{url.path}?" + "&".join(f"{k}={v}" for k, v in query)
+
+
+class Cassette:
+    """Recorded responses grouped by request key, in recording order."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        self._unsaved = 0
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        """Load a cassette, or start an empty one if the file doesn't exist."""
+        cassette = cls(path)
+        if os.path.exists(path):
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    entry = json.loads(line)
+                    cassette.entries[entry["key"]].append(entry)
+        return cassette
+
+    def __len__(self) -> int:
+        return sum(len(responses) for responses in self.entries.values())
+
+    def add(self, key: str, response: httpx.Response, body: bytes, latency_ms: float) -> None:
+        self.entries[key].append({
+            "key": key,
+            "status": response.status_code,
+            "headers": {h: response.headers[h] for h in RECORDED_HEADERS if h in response.headers},
+            "body": body.decode("utf-8", errors="replace"),
+            "latency_ms": round(latency_ms, 1),
+        })
+        self._unsaved += 1
+        if self._unsaved >= SAVE_EVERY:
+            self.save()
+
+    def save(self) -> None:
+        """Write the whole cassette to disk atomically."""
+        tmp_path = f"{self.path}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            for responses in self.entries.values():
+                for entry in responses:
+                    f.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+        os.replace(tmp_path, self.path)
+        self._unsaved = 0
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Forward requests to a real transport and record every response."""
+
+    def __init__(self, cassette: Cassette, inner: httpx.AsyncBaseTransport | None = None):
+        self.cassette = cassette
+        self.inner = inner or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        response = await self.inner.handle_async_request(request)
+        body = await response.aread()
+        latency_ms = (time.perf_counter() - start) * 1000
+        self.cassette.add(request_key(request), response, body, latency_ms)
+        return httpx.Response(
+            response.status_code,
+            headers={h: response.headers[h] for h in RECORDED_HEADERS if h in response.headers},
+            content=body,
+            request=request
+        )
+
+    async def aclose(self) -> None:
+        # Shared by every client; closed explicitly via close() on shutdown
+        pass
+
+    async def close(self) -> None:
+        self.cassette.save()
+        await self.inner.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Answer requests from a cassette without touching the network.
+
+    Repeated requests replay the recorded responses in order and then keep
+    returning the last one. Unknown requests fail like a connection error.
+    """
+
+    def __init__(self, cassette: Cassette, latency: str = "original"):
+        """
+        Args:
+            cassette: Recorded responses
+            latency: "original" to wait the recorded latency, "none" to answer at once
+        """
+        self.cassette = cassette
+        self.latency = latency
+        self.calls: Counter[str] = Counter()
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    def reset(self) -> None:
+        self.calls.clear()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = request_key(request)
+        responses = self.cassette.entries.get(key)
+        if not responses:
+            raise httpx.ConnectError(f"No cassette entry for {key}", request=request)
+
+        entry = responses[min(self.calls[key], len(responses) - 1)]
+        self.calls[key] += 1
+        if self.latency == "original":
+            await asyncio.sleep(entry["latency_ms"] / 1000)
+        return httpx.Response(
+            entry["status"],
+            headers=entry["headers"],
+            content=entry["body"].encode("utf-8"),
+            request=request
+        )
+
+    async def aclose(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+def install_cassette() -> RecordingTransport | ReplayTransport | None:
+    """Route every SteamAPIClient through a cassette according to CASSETTE_MODE.
+
+    Returns:
+        The installed transport (close it on shutdown), or None when disabled
+    """
+    from mcp_server_steam.steam_client import SteamAPIClient
+
+    mode = settings.cassette_mode.lower()
+    if mode == "off":
+        return None
+
+    path = os.path.expanduser(settings.cassette_path)
+    cassette = Cassette.load(path)
+    if mode == "record":
+        transport: RecordingTransport | ReplayTransport = RecordingTransport(cassette)
+    elif mode == "replay":
+        transport = ReplayTransport(cassette, latency=settings.cassette_latency)
+    else:
+        raise ValueError(
+            f"Invalid CASSETTE_MODE {settings.cassette_mode!r}: use 'off', 'record' or 'replay'"
+        )
+
+    logger.info(f"Cassette {mode} mode: {path} ({len(cassette)} recorded responses)")
+    SteamAPIClient.transport = transport
+    return transport
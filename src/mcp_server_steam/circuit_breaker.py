@@ -0,0 +1,142 @@
+"""Per-endpoint circuit breakers for upstream Steam requests.
+
+Each Web API method ("Interface/Method") and store route has its own
+breaker. It opens when the failure rate over its recent requests crosses
+a threshold. While open, requests fail at once instead of waiting for
+the request timeout. After a cool-off it lets a few probe requests
+through (half-open) and closes again once a probe succeeds. Only outage
+symptoms count as failures: timeouts, connection errors and 5xx
+responses. Client errors and 429s do not.
+"""
+
+import time
+from collections import deque
+
+from mcp_server_steam.config import settings
+from mcp_server_steam.metrics import metrics
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Gauge values of steam_circuit_state
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitBreaker:
+    """Failure-rate circuit breaker for one upstream endpoint."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        window: int = 20,
+        min_requests: int = 5,
+        failure_threshold: float = 0.5,
+        open_seconds: float = 30.0,
+        half_open_probes: int = 1
+    ):
+        """
+        Args:
+            endpoint: Endpoint label, e.g. "IPlayerService/GetOwnedGames"
+            window: Number of recent outcomes the failure rate is computed over
+            min_requests: Outcomes needed in the window before the circuit can open
+            failure_threshold: Failure rate at which the circuit opens
+            open_seconds: Time the circuit stays open before probing
+            half_open_probes: Concurrent probe requests allowed while half-open
+        """
+        self.endpoint = endpoint
+        self.min_requests = min_requests
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.half_open_probes = half_open_probes
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.probes_in_flight = 0
+        self._outcomes: deque[bool] = deque(maxlen=window)
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until an open circuit starts probing."""
+        return max(0.0, self.opened_at + self.open_seconds - time.monotonic())
+
+    def allow(self) -> str | None:
+        """
+        Admit or reject a request.
+
+        Returns:
+            CLOSED for a normal request, HALF_OPEN for a probe, None to fail fast.
+            Pass the value to record() when the request finishes.
+        """
+        if self.state == OPEN:
+            if self.retry_after > 0:
+                metrics.inc("steam_circuit_rejections_total", endpoint=self.endpoint)
+                return None
+            self._set_state(HALF_OPEN)
+        if self.state == HALF_OPEN:
+            if self.probes_in_flight >= self.half_open_probes:
+                metrics.inc("steam_circuit_rejections_total", endpoint=self.endpoint)
+                return None
+            self.probes_in_flight += 1
+            return HALF_OPEN
+        return CLOSED
+
+    def record(self, admission: str, success: bool | None) -> None:
+        """Record the outcome of a request admitted by allow().
+
+        None means no verdict, e.g. the request was cancelled.
+        """
+        if admission == HALF_OPEN:
+            self.probes_in_flight = max(0, self.probes_in_flight - 1)
+            if self.state != HALF_OPEN or success is None:
+                return
+            if success:
+                self._outcomes.clear()
+                self._set_state(CLOSED)
+            else:
+                self._open()
+            return
+
+        # Requests sent before the circuit opened don't count once it has
+        if self.state != CLOSED or success is None:
+            return
+        self._outcomes.append(success)
+        if len(self._outcomes) >= self.min_requests:
+            failures = self._outcomes.count(False)
+            if failures / len(self._outcomes) >= self.failure_threshold:
+                self._open()
+
+    def _open(self) -> None:
+        self.opened_at = time.monotonic()
+        self._outcomes.clear()
+        self._set_state(OPEN)
+
+    def _set_state(self, state: str) -> None:
+        self.state = state
+        metrics.set_gauge("steam_circuit_state", STATE_VALUES[state], endpoint=self.endpoint)
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(endpoint: str) -> CircuitBreaker:
+    """The breaker of an endpoint, created with the configured thresholds on first use."""
+    breaker = _breakers.get(endpoint)
+    if breaker is None:
+        breaker = _breakers[endpoint] = CircuitBreaker(
+            endpoint,
+            window=settings.circuit_window,
+            min_requests=settings.circuit_min_requests,
+            failure_threshold=settings.circuit_failure_threshold,
+            open_seconds=settings.circuit_open_seconds,
+            half_open_probes=settings.circuit_half_open_probes
+        )
+    return breaker
+
+
+def circuit_states() -> dict[str, dict[str, float | str]]:
+    """State of every breaker that isn't closed, for diagnostics."""
+    return {
+        endpoint: {"state": breaker.state, "retry_after_s": round(breaker.retry_after, 1)}
+        for endpoint, breaker in _breakers.items()
+        if breaker.state != CLOSED
+    }
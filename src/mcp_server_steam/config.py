@@ -11,6 +11,23 @@ class Settings(BaseSettings):
         default=None,
         description="Steam Web API key from https://steamcommunity.com/dev/apikey"
     )
+    steam_api_keys: str | None = Field(
+        default=None,
+        description="Additional comma-separated API keys used in rotation with STEAM_API_KEY; "
+                    "each key gets its own rate budget"
+    )
+    api_key_daily_limit: int = Field(
+        default=100000,
+        description="Requests per key per UTC day before the key is skipped until midnight"
+    )
+    api_key_cooldown: float = Field(
+        default=300.0,
+        description="Seconds a key is taken out of rotation after a 403 or repeated 429 responses"
+    )
+    api_key_max_consecutive_429: int = Field(
+        default=3,
+        description="Consecutive 429 responses after which a key is put on cooldown"
+    )
     steam_user_id: str | None = Field(
         default=None,
         description="Default Steam User ID (64-bit) for API calls"
@@ -19,14 +36,250 @@ class Settings(BaseSettings):
         default="https://api.steampowered.com",
         description="Base URL for Steam Web API"
     )
+    steam_store_base_url: str = Field(
+        default="https://store.steampowered.com",
+        description="Base URL for the Steam store API"
+    )
     request_timeout: float = Field(
         default=10.0,
         description="HTTP request timeout in seconds"
     )
+    tool_deadline: float = Field(
+        default=30.0,
+        description="Seconds a tool call may take, including rate limiter waits and upstream "
+                    "requests; fan-out tools return partial results when it is reached "
+                    "(0: no deadline)"
+    )
     max_retries: int = Field(
         default=3,
         description="Maximum number of retry attempts for failed requests"
     )
+    cache_enabled: bool = Field(
+        default=True,
+        description="Cache Steam API responses in memory"
+    )
+    cache_max_entries: int = Field(
+        default=4096,
+        description="Maximum number of cached responses"
+    )
+    cache_max_background_refreshes: int = Field(
+        default=4,
+        description="Maximum number of cache entries refreshed in the background at once"
+    )
+    cache_refresh_reserve: float = Field(
+        default=0.2,
+        description="Fraction of the rate budget kept for interactive requests; "
+                    "background refreshes are skipped below it"
+    )
+    cache_hot_key_hits: int = Field(
+        default=3,
+        description="Cache hits after which an entry is refreshed ahead of expiry"
+    )
+    workshop_item_ttl: float = Field(
+        default=3600.0,
+        description="Seconds a fetched workshop item's details are reused"
+    )
+    workshop_cache_max_items: int = Field(
+        default=50000,
+        description="Maximum number of cached workshop items (kept apart from the response cache)"
+    )
+    vanity_cache_ttl: float = Field(
+        default=604800.0,
+        description="Seconds a resolved vanity name is reused"
+    )
+    vanity_negative_ttl: float = Field(
+        default=3600.0,
+        description="Seconds a vanity name without an account is remembered as unresolvable"
+    )
+    vanity_cache_max_entries: int = Field(
+        default=10000,
+        description="Maximum number of cached vanity names"
+    )
+    negative_cache_ttl: float = Field(
+        default=300.0,
+        description="Seconds a private, no-stats or not-found answer is reused "
+                    "(0 disables negative caching)"
+    )
+    negative_cache_max_entries: int = Field(
+        default=10000,
+        description="Maximum number of cached empty results"
+    )
+    circuit_breaker_enabled: bool = Field(
+        default=True,
+        description="Fail fast (or serve stale cached data) for endpoints that are failing upstream"
+    )
+    circuit_failure_threshold: float = Field(
+        default=0.5,
+        description="Failure rate (timeouts, connection errors, 5xx) at which an endpoint's "
+                    "circuit opens"
+    )
+    circuit_window: int = Field(
+        default=20,
+        description="Number of recent requests per endpoint the failure rate is computed over"
+    )
+    circuit_min_requests: int = Field(
+        default=5,
+        description="Requests per endpoint needed before its circuit can open"
+    )
+    circuit_open_seconds: float = Field(
+        default=30.0,
+        description="Seconds an open circuit fails fast before letting probe requests through"
+    )
+    circuit_half_open_probes: int = Field(
+        default=1,
+        description="Concurrent probe requests allowed while a circuit is half-open"
+    )
+    adaptive_limits_enabled: bool = Field(
+        default=True,
+        description="Adjust upstream concurrency and rate per host: raise them while Steam answers "
+                    "quickly, halve them on 429s, 5xx responses and latency spikes"
+    )
+    adaptive_initial_concurrency: int = Field(
+        default=8,
+        description="Upstream requests in flight allowed per host at start"
+    )
+    adaptive_max_concurrency: int = Field(
+        default=64,
+        description="Highest upstream concurrency per host"
+    )
+    adaptive_max_rate_factor: float = Field(
+        default=1.0,
+        description="Highest multiple of the configured rate limits (100/min per key, "
+                    "200/5 min for the store); above 1.0 lets healthy hosts exceed Steam's "
+                    "documented limits"
+    )
+    adaptive_latency_spike: float = Field(
+        default=3.0,
+        description="p90 latency of a window of responses, as a multiple of the host's "
+                    "recent baseline, that counts as overload"
+    )
+    hedging_enabled: bool = Field(
+        default=False,
+        description="Send a second identical request when an upstream request is slower than "
+                    "its endpoint's recent latency percentile; the first response wins"
+    )
+    hedge_percentile: float = Field(
+        default=0.95,
+        description="Recent latency percentile per endpoint after which a request is hedged"
+    )
+    hedge_budget: float = Field(
+        default=0.05,
+        description="Maximum hedged requests as a fraction of all upstream requests"
+    )
+    hedge_min_samples: int = Field(
+        default=20,
+        description="Latencies recorded for an endpoint before its requests are hedged"
+    )
+    hedge_min_delay: float = Field(
+        default=0.05,
+        description="Minimum seconds before a hedge is sent"
+    )
+    warmup_enabled: bool = Field(
+        default=False,
+        description="Prefetch data for STEAM_USER_ID in the background on startup"
+    )
+    warmup_schema_games: int = Field(
+        default=5,
+        description="Number of most-played games whose schemas are prefetched on warm-up"
+    )
+    snapshot_path: str | None = Field(
+        default=None,
+        description="SQLite file where owned-games fetches are recorded as playtime snapshots "
+                    "for get_playtime_history (unset: disabled)"
+    )
+    snapshot_min_interval: float = Field(
+        default=3600.0,
+        description="Minimum seconds between two playtime snapshots of the same user"
+    )
+    snapshot_interval: float = Field(
+        default=0.0,
+        description="Also snapshot SNAPSHOT_USERS every this many seconds (0: only when fetched)"
+    )
+    snapshot_users: str | None = Field(
+        default=None,
+        description="Comma-separated Steam IDs snapshotted on schedule (default: STEAM_USER_ID)"
+    )
+    watchlist_path: str | None = Field(
+        default=None,
+        description="SQLite file holding the price watchlist and its price history "
+                    "(unset: disabled)"
+    )
+    watchlist_poll_interval: float = Field(
+        default=3600.0,
+        description="Seconds between price checks of each watched app "
+                    "(0: only when get_price_alerts runs)"
+    )
+    watchlist_cc: str = Field(
+        default="us",
+        description="Store country code whose prices the watchlist tracks"
+    )
+    regional_price_ttl: float = Field(
+        default=900.0,
+        description="Seconds a price fetched for one app in one region is reused by "
+                    "compare_regional_prices"
+    )
+    price_cache_max_entries: int = Field(
+        default=20000,
+        description="Maximum number of cached regional prices (kept apart from the response cache)"
+    )
+    currency_rates: str | None = Field(
+        default=None,
+        description="USD value of currency units overriding the built-in table, "
+                    "e.g. 'EUR=1.08,KRW=0.00073'"
+    )
+    tracing_exporter: str = Field(
+        default="none",
+        description="Span exporter: 'none', 'jsonl' (local file) or 'otlp' "
+                    "(OTLP/HTTP JSON collector)"
+    )
+    tracing_file: str = Field(
+        default="steam-traces.jsonl",
+        description="Output file for the jsonl span exporter"
+    )
+    tracing_otlp_endpoint: str = Field(
+        default="http://localhost:4318/v1/traces",
+        description="Collector URL for the otlp span exporter"
+    )
+    cassette_mode: str = Field(
+        default="off",
+        description="Upstream cassette mode: 'off', 'record' (save responses) or 'replay' (offline)"
+    )
+    cassette_path: str = Field(
+        default="steam-cassette.jsonl.gz",
+        description="Cassette file used by the record and replay modes"
+    )
+    cassette_latency: str = Field(
+        default="original",
+        description="Replay latency: 'original' (recorded latency) or 'none'"
+    )
+    tool_call_log: str | None = Field(
+        default=None,
+        description="Append every tool call (session, timestamp, name, arguments) to this "
+                    "JSONL file, for replay with benchmarks/loadgen.py"
+    )
+    server_transport: str = Field(
+        default="stdio",
+        description="MCP transport: 'stdio' (one client per process), 'http' (streamable HTTP) "
+                    "or 'sse'; http and sse serve many sessions from one process"
+    )
+    server_host: str = Field(
+        default="127.0.0.1",
+        description="Bind address for the http and sse transports"
+    )
+    server_port: int = Field(
+        default=8000,
+        description="Port for the http and sse transports"
+    )
+    server_workers: int = Field(
+        default=1,
+        description="Worker processes for the http transport; more than one requires "
+                    "stateless HTTP and shares state through SHARED_STATE_PATH"
+    )
+    shared_state_path: str | None = Field(
+        default=None,
+        description="SQLite file through which worker processes share cached responses and "
+                    "rate budgets (default with several workers: steam-shared-state.sqlite3)"
+    )
 
     model_config = SettingsConfigDict(
         env_file=".env",
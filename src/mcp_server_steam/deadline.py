@@ -0,0 +1,102 @@
+"""Per-tool-call deadlines.
+
+A deadline is set when a tool call starts and carried in a context
+variable to everything the call awaits: upstream request timeouts are
+shortened to the time left, rate limiter waits that would outlast it
+fail at once, and hedges are only sent while there is time to use them.
+Fan-out helpers cancel subrequests still running at the deadline so a
+tool can return what it has instead of working for a client that has
+given up.
+"""
+
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Iterator
+
+# Absolute deadline (time.monotonic()) of the current tool call, if any
+_deadline: ContextVar[float | None] = ContextVar("deadline", default=None)
+
+
+class DeadlineExceeded(Exception):
+    """Base for errors raised because the current deadline leaves no time for the work."""
+    pass
+
+
+@contextmanager
+def deadline_scope(seconds: float | None) -> Iterator[None]:
+    """Run the block under a deadline `seconds` from now (None: no deadline).
+
+    A nested scope can only shorten the deadline, except None, which
+    detaches work that outlives the call (e.g. background cache refreshes).
+    """
+    if seconds is None:
+        deadline = None
+    else:
+        deadline = time.monotonic() + seconds
+        current = _deadline.get()
+        if current is not None:
+            deadline = min(deadline, current)
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> float | None:
+    """Seconds left before the current deadline (None: no deadline)."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def expired() -> bool:
+    left = remaining()
+    return left is not None and left <= 0
+
+
+async def gather_partial(*aws: Awaitable[Any]) -> list[Any]:
+    """
+    Like asyncio.gather(..., return_exceptions=True), but stops at the deadline.
+
+    Awaitables still running at the deadline are cancelled and their
+    results are SteamDeadlineError instances, so callers can tell
+    unfinished work from failures and return partial results.
+    """
+    from mcp_server_steam.steam_client import SteamDeadlineError
+
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    if not tasks:
+        return []
+    left = remaining()
+    try:
+        _, pending = await asyncio.wait(tasks, timeout=None if left is None else max(left, 0))
+    except BaseException:
+        # The caller was cancelled: don't leave the requests running unowned
+        running = [task for task in tasks if not task.done()]
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.wait(running)
+        for task in tasks:
+            if not task.cancelled():
+                # Mark failures as retrieved so they aren't logged as unhandled
+                task.exception()
+        raise
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.wait(pending)
+
+    results: list[Any] = []
+    for task in tasks:
+        if task in pending or task.cancelled():
+            results.append(
+                SteamDeadlineError("Tool call deadline reached before this request finished")
+            )
+        else:
+            results.append(task.exception() or task.result())
+    return results
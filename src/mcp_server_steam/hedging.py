@@ -0,0 +1,159 @@
+"""Hedged upstream requests.
+
+When a request has not answered by a high percentile of its endpoint's
+recent latencies, a second identical request is sent and whichever
+answers first wins; the other is cancelled. All Steam requests made by
+this server are read-only GETs, so duplicates are safe. Hedges are
+capped twice: by a hedge budget that earns a fraction of a hedge per
+request, and by the caller's limits (rate token, API key, in-flight slot),
+which a hedge must get without waiting.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Awaitable, Callable, TypeVar
+
+from mcp_server_steam.config import settings
+from mcp_server_steam.deadline import remaining
+from mcp_server_steam.metrics import metrics
+
+T = TypeVar("T")
+
+# Latencies kept per endpoint for the deadline estimate
+LATENCY_WINDOW = 200
+
+# Unused hedge budget saved for bursts of slow requests
+MAX_HEDGE_CREDIT = 10.0
+
+
+class Hedger:
+    """Learns per-endpoint hedge deadlines and enforces the hedge budget."""
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        budget: float = 0.05,
+        min_samples: int = 20,
+        min_delay: float = 0.05
+    ):
+        """
+        Args:
+            percentile: Latency percentile after which a hedge is sent
+            budget: Maximum hedges as a fraction of requests
+            min_samples: Latencies needed for an endpoint before it is hedged
+            min_delay: Lower bound of the hedge deadline in seconds
+        """
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.credit = 0.0
+        self._latencies: dict[str, deque[float]] = {}
+        self._deadlines: dict[str, float] = {}
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        """Record the latency of a completed attempt."""
+        latencies = self._latencies.get(endpoint)
+        if latencies is None:
+            latencies = self._latencies[endpoint] = deque(maxlen=LATENCY_WINDOW)
+        latencies.append(seconds)
+        # Recompute the deadline every few samples instead of sorting per request
+        if len(latencies) >= self.min_samples and len(latencies) % 10 == 0:
+            ordered = sorted(latencies)
+            index = min(len(ordered) - 1, int(self.percentile * len(ordered)))
+            self._deadlines[endpoint] = max(self.min_delay, ordered[index])
+
+    def deadline(self, endpoint: str) -> float | None:
+        """Seconds after which a request to the endpoint is hedged (None: not yet learned)."""
+        return self._deadlines.get(endpoint)
+
+    def earn(self) -> None:
+        """Add the budget share of one request."""
+        self.credit = min(MAX_HEDGE_CREDIT, self.credit + self.budget)
+
+    def spend(self) -> bool:
+        """Take one hedge from the budget, if there is one."""
+        if self.credit < 1:
+            return False
+        self.credit -= 1
+        return True
+
+    async def run(
+        self,
+        endpoint: str,
+        send: Callable[[], Awaitable[T]],
+        try_hedge: Callable[[], Awaitable[T] | None]
+    ) -> T:
+        """
+        Run send(), hedging it with a second attempt once it exceeds the deadline.
+
+        Args:
+            endpoint: Endpoint label whose latencies set the deadline
+            send: Coroutine factory issuing the primary request
+            try_hedge: Starts the hedge if its limits allow it without waiting;
+                returns its awaitable, or None if it wasn't sent
+
+        Returns:
+            The first successful result; if both attempts fail, the primary's error
+        """
+        self.earn()
+        deadline = self.deadline(endpoint)
+        left = remaining()
+        if deadline is not None and left is not None and left <= deadline:
+            # The call's deadline comes first: a hedge sent then would be cancelled unanswered
+            deadline = None
+        start = time.perf_counter()
+        primary = asyncio.ensure_future(send())
+        if deadline is None:
+            return await self._finish(endpoint, primary, start)
+
+        done, _ = await asyncio.wait({primary}, timeout=deadline)
+        if done or not self.spend():
+            return await self._finish(endpoint, primary, start)
+        hedge_start = time.perf_counter()
+        attempt = try_hedge()
+        if attempt is None:
+            self.credit += 1  # Not sent: give the hedge back
+            return await self._finish(endpoint, primary, start)
+
+        hedge = asyncio.ensure_future(attempt)
+        attempts = {primary: start, hedge: hedge_start}
+        pending = set(attempts)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    self.record(endpoint, time.perf_counter() - attempts[task])
+                winner = next(
+                    (t for t in done if not t.cancelled() and t.exception() is None), None
+                )
+                if winner is not None:
+                    result = "won" if winner is hedge else "lost"
+                    metrics.inc("steam_hedges_total", endpoint=endpoint, result=result)
+                    return winner.result()
+            metrics.inc("steam_hedges_total", endpoint=endpoint, result="failed")
+            return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+                # Censored at cancellation; keeps slow tails in the window
+                self.record(endpoint, time.perf_counter() - attempts[task])
+
+    async def _finish(self, endpoint: str, task: asyncio.Future, start: float) -> T:
+        try:
+            return await task
+        finally:
+            if task.done() and not task.cancelled():
+                self.record(endpoint, time.perf_counter() - start)
+            else:
+                task.cancel()
+
+
+# Global hedger
+hedger = Hedger(
+    percentile=settings.hedge_percentile,
+    budget=settings.hedge_budget,
+    min_samples=settings.hedge_min_samples,
+    min_delay=settings.hedge_min_delay
+)
@@ -0,0 +1,149 @@
+"""Steam account identifiers resolved to 64-bit Steam IDs.
+
+SteamID64, SteamID2 (STEAM_0:1:23), SteamID3 ([U:1:47]) and profile URLs
+(steamcommunity.com/profiles/...) are converted locally. Only true vanity
+names (steamcommunity.com/id/<name> or a bare name) need
+ISteamUser/ResolveVanityURL; their results are cached for a long time, and
+names that don't exist for a shorter time, so repeated lookups cost no
+upstream requests.
+"""
+
+import asyncio
+import logging
+import re
+from typing import Any
+
+from mcp_server_steam.cache import ResponseCache
+from mcp_server_steam.config import settings
+from mcp_server_steam.deadline import gather_partial
+from mcp_server_steam.steam_client import SteamAPIClient
+
+logger = logging.getLogger(__name__)
+
+# SteamID64 of account number 0 of an individual account in the public universe
+STEAM_ID64_BASE = 76561197960265728
+
+# Largest account number (32 bits)
+MAX_ACCOUNT_ID = 2**32 - 1
+
+# ResolveVanityURL's answer when no account has the name
+NO_MATCH = 42
+
+# Identifiers resolved at once
+MAX_CONCURRENT_RESOLVES = 8
+
+STEAM_ID2 = re.compile(r"STEAM_[0-5]:([01]):(\d+)", re.IGNORECASE)
+STEAM_ID3 = re.compile(r"\[?U:1:(\d+)\]?", re.IGNORECASE)
+PROFILE_URL = re.compile(
+    r"(?:https?://)?(?:www\.)?steamcommunity\.com/(profiles|id)/([^/?#]+)/?(?:[?#].*)?",
+    re.IGNORECASE
+)
+VANITY_NAME = re.compile(r"[A-Za-z0-9_-]{2,32}")
+
+# Vanity name -> SteamID64, "" for names without an account
+vanity_cache = ResponseCache(max_entries=settings.vanity_cache_max_entries)
+
+
+def is_steam_id64(value: str) -> bool:
+    """Whether a string is the 64-bit Steam ID of an individual account in the public universe."""
+    return value.isdigit() and STEAM_ID64_BASE <= int(value) <= STEAM_ID64_BASE + MAX_ACCOUNT_ID
+
+
+def parse_steam_id(value: str) -> tuple[str, str] | None:
+    """
+    Convert a SteamID64, SteamID2, SteamID3 or profile URL without an API call.
+
+    Returns:
+        (SteamID64, format) or None if the value needs vanity resolution or isn't an identifier
+    """
+    value = value.strip()
+    if is_steam_id64(value):
+        return value, "steamid64"
+    if match := STEAM_ID2.fullmatch(value):
+        account_id = int(match[2]) * 2 + int(match[1])
+        if account_id <= MAX_ACCOUNT_ID:
+            return str(STEAM_ID64_BASE + account_id), "steamid2"
+    if match := STEAM_ID3.fullmatch(value):
+        account_id = int(match[1])
+        if account_id <= MAX_ACCOUNT_ID:
+            return str(STEAM_ID64_BASE + account_id), "steamid3"
+    if (match := PROFILE_URL.fullmatch(value)) and match[1].lower() == "profiles":
+        parsed = parse_steam_id(match[2])
+        if parsed is not None:
+            return parsed[0], "profile_url"
+    return None
+
+
+def vanity_name(value: str) -> str | None:
+    """The vanity name of a steamcommunity.com/id/ URL or a bare name, or None."""
+    value = value.strip()
+    if match := PROFILE_URL.fullmatch(value):
+        value = match[2] if match[1].lower() == "id" else ""
+    return value if VANITY_NAME.fullmatch(value) else None
+
+
+async def resolve_vanity(client: SteamAPIClient, name: str) -> str | None:
+    """SteamID64 of a vanity name, or None if no account has it."""
+    key = name.lower()
+    cached = vanity_cache.get(key)
+    if cached is not None:
+        return cached or None
+    result = await client.get(
+        "ISteamUser", "ResolveVanityURL", version="v0001", params={"vanityurl": name}
+    )
+    response = result.get("response", {})
+    if response.get("success") == 1:
+        vanity_cache.set(key, response["steamid"], settings.vanity_cache_ttl)
+        return response["steamid"]
+    if response.get("success") == NO_MATCH:
+        # Names can be claimed later, so misses are kept for less time
+        vanity_cache.set(key, "", settings.vanity_negative_ttl)
+    return None
+
+
+async def resolve_identity(client: SteamAPIClient, value: str) -> dict[str, Any]:
+    """
+    Resolve one identifier to a SteamID64.
+
+    Returns:
+        {"input", "steamid", "source"}; source is the parsed format or "vanity"
+
+    Raises:
+        ValueError: If the value isn't an identifier or no account has the vanity name
+    """
+    parsed = parse_steam_id(value)
+    if parsed is not None:
+        return {"input": value, "steamid": parsed[0], "source": parsed[1]}
+    name = vanity_name(value)
+    if name is None:
+        raise ValueError(f"Not a Steam ID, profile URL or vanity name: {value}")
+    steam_id = await resolve_vanity(client, name)
+    if steam_id is None:
+        raise ValueError(f"Could not resolve vanity URL: {name}")
+    return {"input": value, "steamid": steam_id, "source": "vanity"}
+
+
+async def resolve_user(client: SteamAPIClient, user: str) -> str:
+    """Return the SteamID64 of any identifier resolve_identity accepts."""
+    return (await resolve_identity(client, user))["steamid"]
+
+
+async def resolve_identities(client: SteamAPIClient, values: list[str]) -> list[dict[str, Any]]:
+    """
+    Resolve many identifiers concurrently.
+
+    Returns:
+        One entry per identifier, in order: resolve_identity's result, or {"input", "error"}
+    """
+    unique = list(dict.fromkeys(values))
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_RESOLVES)
+
+    async def run(value: str) -> dict[str, Any]:
+        async with semaphore:
+            return await resolve_identity(client, value)
+
+    outcomes = dict(zip(unique, await gather_partial(*(run(v) for v in unique))))
+    return [
+        {"input": value, "error": str(outcome)} if isinstance(outcome, Exception) else outcome
+        for value, outcome in ((v, outcomes[v]) for v in values)
+    ]
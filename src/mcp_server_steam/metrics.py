@@ -0,0 +1,209 @@
+"""Lightweight in-process metrics for mcp-server-steam.
+
+Metrics are kept in plain dictionaries keyed by name and label values, so
+recording one costs a dict lookup and an addition. They are exposed as a
+JSON snapshot (steam://metrics) and in Prometheus text format (/metrics
+when served over HTTP).
+"""
+
+import bisect
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+# Latency buckets in seconds, from fast cache-backed tool calls to multi-second upstream tails
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+METRIC_HELP: dict[str, tuple[str, str]] = {
+    "steam_tool_duration_seconds": ("histogram", "MCP tool call latency"),
+    "steam_tool_calls_total": ("counter", "MCP tool calls by outcome"),
+    "steam_tool_in_flight": ("gauge", "MCP tool calls currently running"),
+    "steam_upstream_duration_seconds": ("histogram", "Upstream Steam request latency"),
+    "steam_upstream_requests_total": ("counter", "Upstream Steam requests by HTTP status"),
+    "steam_upstream_in_flight": ("gauge", "Upstream Steam requests currently running"),
+    "steam_rate_limiter_wait_seconds": ("histogram", "Time spent waiting for a rate limit token"),
+    "steam_rate_limiter_tokens": ("gauge", "Rate limit tokens left in the bucket"),
+    "steam_cache_requests_total": ("counter", "Response cache lookups by result"),
+    "steam_api_key_cooldowns_total": ("counter", "API keys taken out of rotation by reason"),
+    "steam_circuit_state": (
+        "gauge", "Circuit breaker state per endpoint (0 closed, 1 half-open, 2 open)"
+    ),
+    "steam_circuit_rejections_total": ("counter", "Requests failed fast by an open circuit"),
+    "steam_hedges_total": ("counter", "Hedged upstream requests by result (won, lost, failed)"),
+    "steam_adaptive_concurrency": ("gauge", "Adaptive upstream concurrency limit per host"),
+    "steam_adaptive_rate_factor": (
+        "gauge", "Adaptive multiple of the configured rate limit per host"
+    ),
+    "steam_adaptive_cuts_total": (
+        "counter", "Adaptive limit cuts per host by cause (429, 5xx, error, latency)"
+    ),
+}
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+class Histogram:
+    """Cumulative-bucket histogram compatible with the Prometheus data model."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate a quantile as the upper bound of the bucket containing it.
+
+        A quantile in the overflow bucket is reported as the largest finite
+        bound, as Prometheus does, so snapshots stay valid JSON.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.buckets[-1]
+
+
+class MetricsRegistry:
+    """Registry of counters, gauges and histograms with string labels."""
+
+    def __init__(self):
+        self.counters: dict[str, dict[LabelKey, float]] = {}
+        self.gauges: dict[str, dict[LabelKey, float]] = {}
+        self.histograms: dict[str, dict[LabelKey, Histogram]] = {}
+
+    def inc(self, name: str, value: float = 1.0, **labels: str) -> None:
+        """Increment a counter."""
+        series = self.counters.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        series[key] = series.get(key, 0.0) + value
+
+    def set_gauge(self, name: str, value: float, **labels: str) -> None:
+        """Set a gauge to an absolute value."""
+        self.gauges.setdefault(name, {})[tuple(sorted(labels.items()))] = value
+
+    def add_gauge(self, name: str, delta: float, **labels: str) -> None:
+        """Move a gauge up or down."""
+        series = self.gauges.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        series[key] = series.get(key, 0.0) + delta
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Record a histogram observation."""
+        series = self.histograms.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = Histogram()
+        histogram.observe(value)
+
+    @contextmanager
+    def track(self, duration: str, in_flight: str, **labels: str) -> Iterator[None]:
+        """Time a block into a histogram and count it as in flight meanwhile."""
+        self.add_gauge(in_flight, 1)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(duration, time.perf_counter() - start, **labels)
+            self.add_gauge(in_flight, -1)
+
+    def reset(self) -> None:
+        """Drop all recorded series."""
+        self.counters.clear()
+        self.gauges.clear()
+        self.histograms.clear()
+
+    def snapshot(self) -> dict:
+        """Summarize all metrics as a JSON-serializable dictionary."""
+
+        def label_str(key: LabelKey) -> str:
+            return ",".join(f"{k}={v}" for k, v in key) or "all"
+
+        histograms = {}
+        for name, series in self.histograms.items():
+            histograms[name] = {
+                label_str(key): {
+                    "count": h.count,
+                    "mean": round(h.sum / h.count, 4) if h.count else None,
+                    "p50": h.quantile(0.5),
+                    "p99": h.quantile(0.99),
+                }
+                for key, h in series.items()
+            }
+
+        cache = self.counters.get("steam_cache_requests_total", {})
+        lookups = sum(cache.values())
+        served = sum(v for k, v in cache.items() if dict(k).get("result") in ("hit", "stale"))
+
+        hedges = self.counters.get("steam_hedges_total", {})
+        hedged = sum(hedges.values())
+        hedge_wins = sum(v for k, v in hedges.items() if dict(k).get("result") == "won")
+        upstream = sum(self.counters.get("steam_upstream_requests_total", {}).values())
+
+        return {
+            "counters": {
+                name: {label_str(k): v for k, v in series.items()}
+                for name, series in self.counters.items()
+            },
+            "gauges": {
+                name: {label_str(k): v for k, v in series.items()}
+                for name, series in self.gauges.items()
+            },
+            "histograms": histograms,
+            "cache_hit_ratio": round(served / lookups, 4) if lookups else None,
+            "hedge_rate": round(hedged / upstream, 4) if upstream else None,
+            "hedge_win_rate": round(hedge_wins / hedged, 4) if hedged else None,
+        }
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+
+        def fmt_labels(key: LabelKey, extra: tuple[tuple[str, str], ...] = ()) -> str:
+            pairs = key + extra
+            if not pairs:
+                return ""
+            escaped = (v.replace("\\", "\\\\").replace('"', '\\"') for _, v in pairs)
+            return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + "}"
+
+        lines = []
+
+        def header(name: str, default_type: str) -> None:
+            metric_type, help_text = METRIC_HELP.get(name, (default_type, name))
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+
+        for name, series in sorted(self.counters.items()):
+            header(name, "counter")
+            lines.extend(f"{name}{fmt_labels(k)} {v}" for k, v in series.items())
+
+        for name, series in sorted(self.gauges.items()):
+            header(name, "gauge")
+            lines.extend(f"{name}{fmt_labels(k)} {v}" for k, v in series.items())
+
+        for name, series in sorted(self.histograms.items()):
+            header(name, "histogram")
+            for key, h in series.items():
+                cumulative = 0
+                for bound, count in zip(h.buckets, h.counts):
+                    cumulative += count
+                    labels = fmt_labels(key, (("le", str(bound)),))
+                    lines.append(f"{name}_bucket{labels} {cumulative}")
+                lines.append(f"{name}_bucket{fmt_labels(key, (('le', '+Inf'),))} {h.count}")
+                lines.append(f"{name}_sum{fmt_labels(key)} {h.sum}")
+                lines.append(f"{name}_count{fmt_labels(key)} {h.count}")
+
+        return "\n".join(lines) + "\n"
+
+
+# Global metrics registry
+metrics = MetricsRegistry()
@@ -0,0 +1,102 @@
+"""Negative cache for requests Steam answers with a known empty result.
+
+Private profiles, games without stats and unknown accounts don't fail the
+same way: GetOwnedGames answers 200 with an empty response, GetFriendList
+401, GetPlayerAchievements 400/403 with an error message. Each endpoint's
+rule below classifies its answer as private, no_stats or not_found. The
+client remembers classified answers for NEGATIVE_CACHE_TTL seconds and
+raises SteamKnownEmptyError for them at once instead of asking again, so
+scans over many (often private) profiles don't spend their budget twice.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from mcp_server_steam.cache import ResponseCache
+from mcp_server_steam.config import settings
+
+PRIVATE = "private"
+NO_STATS = "no_stats"
+NOT_FOUND = "not_found"
+
+
+@dataclass(frozen=True)
+class KnownEmpty:
+    """Why a request has no result, and a message saying so."""
+
+    reason: str
+    message: str
+
+
+def _response(data: Any) -> dict[str, Any] | None:
+    return data.get("response") if isinstance(data, dict) else None
+
+
+def _owned_games(status: int, data: Any) -> KnownEmpty | None:
+    # A public library without games still reports game_count 0
+    response = _response(data)
+    if status == 200 and response is not None and "game_count" not in response:
+        return KnownEmpty(PRIVATE, "Game library is private")
+    return None
+
+
+def _recently_played(status: int, data: Any) -> KnownEmpty | None:
+    # No recent games is total_count 0
+    response = _response(data)
+    if status == 200 and response is not None and "total_count" not in response:
+        return KnownEmpty(PRIVATE, "Recently played games are private")
+    return None
+
+
+def _steam_level(status: int, data: Any) -> KnownEmpty | None:
+    response = _response(data)
+    if status == 200 and response is not None and "player_level" not in response:
+        return KnownEmpty(PRIVATE, "Steam level is private")
+    return None
+
+
+def _player_summaries(status: int, data: Any) -> KnownEmpty | None:
+    response = _response(data)
+    if status == 200 and response is not None and not response.get("players"):
+        return KnownEmpty(NOT_FOUND, "No profile found for this Steam ID")
+    return None
+
+
+def _friend_list(status: int, data: Any) -> KnownEmpty | None:
+    if status == 401:
+        return KnownEmpty(PRIVATE, "Friend list is private")
+    return None
+
+
+def _player_achievements(status: int, data: Any) -> KnownEmpty | None:
+    stats = data.get("playerstats") if isinstance(data, dict) else None
+    if not isinstance(stats, dict) or stats.get("success", True):
+        return None
+    error = str(stats.get("error", ""))
+    if "not public" in error.lower():
+        return KnownEmpty(PRIVATE, "Profile is not public")
+    if "no stats" in error.lower():
+        return KnownEmpty(NO_STATS, "Game has no stats")
+    return KnownEmpty(NOT_FOUND, error or "No achievements found")
+
+
+# Per-endpoint rules keyed by "Interface/Method"; they see the HTTP status
+# and the decoded body (None if it isn't JSON)
+EMPTY_RESULT_RULES: dict[str, Callable[[int, Any], KnownEmpty | None]] = {
+    "IPlayerService/GetOwnedGames": _owned_games,
+    "IPlayerService/GetRecentlyPlayedGames": _recently_played,
+    "IPlayerService/GetSteamLevel": _steam_level,
+    "ISteamUser/GetPlayerSummaries": _player_summaries,
+    "ISteamUser/GetFriendList": _friend_list,
+    "ISteamUserStats/GetPlayerAchievements": _player_achievements,
+}
+
+
+def classify(endpoint: str, status: int, data: Any) -> KnownEmpty | None:
+    """Classify an answer as a known empty result, or None if it isn't one."""
+    rule = EMPTY_RESULT_RULES.get(endpoint)
+    return rule(status, data) if rule is not None else None
+
+
+# Cache key -> KnownEmpty; kept apart so empty results don't evict real ones
+negative_cache = ResponseCache(max_entries=settings.negative_cache_max_entries)
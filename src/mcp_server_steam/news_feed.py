@@ -0,0 +1,219 @@
+"""News feed merged across many apps.
+
+Each app keeps its recent news items, newest first, and the date of the
+newest one as a watermark. A refresh requests the app's latest page and
+only pages further back (GetNewsForApp's enddate) while every item on the
+page is newer than the watermark, so apps without news since the last call
+cost one request, and apps checked within REFRESH_INTERVAL cost none.
+Feeds of all requested apps are refreshed concurrently and k-way merged by
+date, dropping duplicate gids (news cross-posted to several apps).
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+from mcp_server_steam.deadline import gather_partial
+from mcp_server_steam.snapshots import record_owned_games
+from mcp_server_steam.steam_client import SteamAPIClient
+
+logger = logging.getLogger(__name__)
+
+# Items per GetNewsForApp request
+NEWS_PAGE_SIZE = 10
+
+# Pages requested per app and refresh when catching up on a busy app
+MAX_NEWS_PAGES = 3
+
+# Characters of contents kept per item; feeds are truncated further per call
+NEWS_CONTENT_LENGTH = 500
+
+# Items kept per app, newest first
+MAX_ITEMS_PER_APP = 50
+
+# Apps whose feeds are kept; the least recently read are dropped first
+MAX_FEED_APPS = 5000
+
+# Seconds an app's feed is served without asking Steam; matches the GetNewsForApp cache TTL
+REFRESH_INTERVAL = 600
+
+# Apps refreshed at once
+MAX_CONCURRENT_APPS = 8
+
+# Item fields kept in the feed
+ITEM_FIELDS = ("gid", "appid", "title", "url", "author", "feedlabel", "date", "contents")
+
+
+@dataclass
+class AppFeed:
+    """Recent news of one app, newest first."""
+
+    items: list[dict[str, Any]] = field(default_factory=list)
+    checked_at: float = 0.0
+
+    @property
+    def watermark(self) -> int | None:
+        """Date of the newest known item."""
+        return self.items[0]["date"] if self.items else None
+
+    def add(self, items: list[dict[str, Any]]) -> int:
+        """Merge items in, dropping known gids; returns the number added."""
+        known = {item["gid"] for item in self.items}
+        new = [item for item in items if item["gid"] not in known]
+        if new:
+            merged = sorted(self.items + new, key=lambda item: item["date"], reverse=True)
+            self.items = merged[:MAX_ITEMS_PER_APP]
+        return len(new)
+
+
+class NewsFeed:
+    """Per-app news feeds with date watermarks, kept in memory."""
+
+    def __init__(self, max_apps: int = MAX_FEED_APPS):
+        self.max_apps = max_apps
+        self._feeds: OrderedDict[int, AppFeed] = OrderedDict()
+
+    def _feed(self, app_id: int) -> AppFeed:
+        feed = self._feeds.get(app_id)
+        if feed is None:
+            feed = self._feeds[app_id] = AppFeed()
+            while len(self._feeds) > self.max_apps:
+                self._feeds.popitem(last=False)
+        self._feeds.move_to_end(app_id)
+        return feed
+
+    async def refresh(self, client: SteamAPIClient, app_id: int) -> list[str]:
+        """
+        Fetch an app's news newer than its watermark.
+
+        The first refresh of an app fetches one page. Later ones page back
+        from the newest item until they reach the watermark, at most
+        MAX_NEWS_PAGES pages.
+
+        Returns:
+            gids of the items added
+        """
+        feed = self._feed(app_id)
+        if time.time() - feed.checked_at < REFRESH_INTERVAL:
+            return []
+        watermark = feed.watermark
+        fetched: list[dict[str, Any]] = []
+        enddate = None
+        for _ in range(MAX_NEWS_PAGES if watermark is not None else 1):
+            params = {"appid": app_id, "count": NEWS_PAGE_SIZE, "maxlength": NEWS_CONTENT_LENGTH}
+            if enddate is not None:
+                params["enddate"] = enddate
+            result = await client.get("ISteamNews", "GetNewsForApp", version="v0002", params=params)
+            page = result.get("appnews", {}).get("newsitems", [])
+            # Copies: the response is shared with the cache
+            fetched.extend(
+                {k: item.get(k) for k in ITEM_FIELDS} | {"appid": app_id} for item in page
+            )
+            oldest = min((i["date"] for i in page), default=None)
+            if len(page) < NEWS_PAGE_SIZE or watermark is None or oldest <= watermark:
+                break
+            # enddate is inclusive; the item repeated on the next page is dropped by gid
+            enddate = oldest
+        if watermark is not None:
+            fetched = [item for item in fetched if item["date"] >= watermark]
+        known = {item["gid"] for item in feed.items}
+        added = [item["gid"] for item in fetched if item["gid"] not in known]
+        feed.add(fetched)
+        feed.checked_at = time.time()
+        return added
+
+    def merged(self, app_ids: list[int], since: int = 0) -> Iterator[dict[str, Any]]:
+        """Items of the apps dated at or after since, newest first, without duplicate gids."""
+        streams = [self._feeds[a].items for a in dict.fromkeys(app_ids) if a in self._feeds]
+        seen = set()
+        for item in heapq.merge(*streams, key=lambda item: item["date"], reverse=True):
+            if item["date"] < since:
+                break
+            if item["gid"] not in seen:
+                seen.add(item["gid"])
+                yield item
+
+    def clear(self) -> None:
+        self._feeds.clear()
+
+
+news_feed = NewsFeed()
+
+
+async def most_played_apps(client: SteamAPIClient, steam_id: str, count: int) -> list[int]:
+    """App IDs of a user's most played games."""
+    # Same parameters as get_owned_games, so both share one cache entry
+    params = {
+        "steamid": steam_id,
+        "include_appinfo": "true",
+        "include_played_free_games": "false",
+        "format": "json"
+    }
+    result = await client.get("IPlayerService", "GetOwnedGames", version="v0001", params=params)
+    response = result.get("response", {})
+    # A public library without games still reports game_count 0
+    if "game_count" not in response:
+        raise ValueError(f"Game library of {steam_id} is private")
+    games = response.get("games", [])
+    record_owned_games(steam_id, games)
+    games = sorted(games, key=lambda g: g.get("playtime_forever", 0), reverse=True)
+    return [g["appid"] for g in games[:count]]
+
+
+async def build_news_feed(
+    client: SteamAPIClient,
+    app_ids: list[int],
+    days: int = 30,
+    count: int = 20,
+    max_length: int = 300
+) -> dict[str, Any]:
+    """
+    Refresh the feeds of many apps concurrently and merge them by date.
+
+    Apps whose refresh fails or misses the deadline are still merged from
+    what was fetched before, and named under ``stale``.
+
+    Args:
+        client: Open Steam API client
+        app_ids: Apps whose news are merged
+        days: Only items from the last days
+        count: Number of items to return
+        max_length: Characters of contents per item
+
+    Returns:
+        Merged items, newest first; items fetched by this call are marked new
+    """
+    app_ids = list(dict.fromkeys(app_ids))
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_APPS)
+
+    async def run(app_id: int) -> list[str]:
+        async with semaphore:
+            return await news_feed.refresh(client, app_id)
+
+    results = await gather_partial(*(run(a) for a in app_ids))
+    added = set()
+    stale = []
+    for app_id, result in zip(app_ids, results):
+        if isinstance(result, Exception):
+            logger.info(f"News refresh for {app_id} failed: {str(result)}")
+            stale.append(app_id)
+        else:
+            added.update(result)
+
+    since = int(time.time()) - days * 86400
+    items = []
+    for item in news_feed.merged(app_ids, since):
+        contents = (item["contents"] or "")[:max_length]
+        items.append(item | {"contents": contents, "new": item["gid"] in added})
+        if len(items) >= count:
+            break
+    return {
+        "apps": len(app_ids),
+        "new_items": len(added),
+        "items": items,
+        "stale": stale,
+    }
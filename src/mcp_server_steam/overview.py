@@ -0,0 +1,160 @@
+"""Composite user overview for mcp-server-steam."""
+
+import logging
+from typing import Any
+
+from mcp_server_steam.deadline import gather_partial
+from mcp_server_steam.identity import resolve_identity
+from mcp_server_steam.snapshots import record_owned_games
+from mcp_server_steam.steam_client import SteamAPIClient
+
+logger = logging.getLogger(__name__)
+
+# Profile fields kept in the overview
+PROFILE_FIELDS = (
+    "personaname", "realname", "profileurl", "avatarfull", "personastate",
+    "communityvisibilitystate", "loccountrycode", "timecreated", "lastlogoff", "gameextrainfo",
+)
+
+# Ban fields kept in the overview
+BAN_FIELDS = (
+    "CommunityBanned", "VACBanned", "NumberOfVACBans", "NumberOfGameBans",
+    "DaysSinceLastBan", "EconomyBan",
+)
+
+
+def _hours(minutes: int | None) -> float:
+    return round((minutes or 0) / 60, 1)
+
+
+async def _profile(client: SteamAPIClient, steam_id: str) -> dict[str, Any]:
+    result = await client.get("ISteamUser", "GetPlayerSummaries", params={"steamids": steam_id})
+    players = result.get("response", {}).get("players")
+    if not players:
+        raise ValueError(f"No profile found for Steam ID: {steam_id}")
+    return {k: players[0][k] for k in PROFILE_FIELDS if k in players[0]}
+
+
+async def _level(client: SteamAPIClient, steam_id: str) -> int:
+    result = await client.get("IPlayerService", "GetSteamLevel", params={"steamid": steam_id})
+    level = result.get("response", {}).get("player_level")
+    if level is None:
+        raise ValueError("Steam level is not visible")
+    return level
+
+
+async def _bans(client: SteamAPIClient, steam_id: str) -> dict[str, Any]:
+    result = await client.get(
+        "ISteamUser", "GetPlayerBans", version="v0001", params={"steamids": steam_id}
+    )
+    # GetPlayerBans answers with a top-level "players" list
+    players = result.get("players") or result.get("response", {}).get("players")
+    if not players:
+        raise ValueError("No ban record returned")
+    return {k: players[0][k] for k in BAN_FIELDS if k in players[0]}
+
+
+async def _library(client: SteamAPIClient, steam_id: str, top_games: int) -> dict[str, Any]:
+    # Same parameters as get_owned_games, so both share one cache entry
+    params = {
+        "steamid": steam_id,
+        "include_appinfo": "true",
+        "include_played_free_games": "false",
+        "format": "json"
+    }
+    result = await client.get("IPlayerService", "GetOwnedGames", version="v0001", params=params)
+    response = result.get("response", {})
+    # Private game details return an empty response; a public library
+    # without games still reports game_count 0
+    if "game_count" not in response:
+        raise ValueError("Game library is private")
+    games = response.get("games", [])
+    record_owned_games(steam_id, games)
+    most_played = sorted(games, key=lambda g: g.get("playtime_forever", 0), reverse=True)
+    most_played = most_played[:top_games]
+    return {
+        "game_count": response.get("game_count", len(games)),
+        "total_playtime_hours": _hours(sum(g.get("playtime_forever", 0) for g in games)),
+        "most_played": [
+            {
+                "appid": g["appid"],
+                "name": g.get("name"),
+                "playtime_hours": _hours(g.get("playtime_forever")),
+            }
+            for g in most_played
+        ],
+    }
+
+
+async def _recent(client: SteamAPIClient, steam_id: str, recent_games: int) -> list[dict[str, Any]]:
+    # Same parameters as get_recently_played_games' defaults; trimmed locally
+    params = {"steamid": steam_id, "count": max(10, recent_games)}
+    result = await client.get(
+        "IPlayerService", "GetRecentlyPlayedGames", version="v0001", params=params
+    )
+    response = result.get("response", {})
+    if "total_count" not in response:
+        # Private profiles return an empty response; no recent games is total_count 0
+        raise ValueError("Recently played games are private")
+    return [
+        {
+            "appid": g["appid"],
+            "name": g.get("name"),
+            "playtime_2weeks_hours": _hours(g.get("playtime_2weeks")),
+            "playtime_hours": _hours(g.get("playtime_forever")),
+        }
+        for g in response.get("games", [])[:recent_games]
+    ]
+
+
+async def build_user_overview(
+    client: SteamAPIClient,
+    user: str,
+    top_games: int = 5,
+    recent_games: int = 5
+) -> dict[str, Any]:
+    """
+    Fetch a user's profile, level, bans, library and recent games at once.
+
+    All sections are requested concurrently once the user is resolved to a
+    64-bit Steam ID. Sections that fail (private library, hidden level,
+    upstream error, deadline) are left out and named under ``unavailable``.
+
+    Args:
+        client: Open Steam API client
+        user: Steam ID in any format, profile URL or vanity name
+        top_games: Number of most-played games to include
+        recent_games: Number of recently played games to include
+
+    Returns:
+        Compact overview with one key per available section
+
+    Raises:
+        ValueError: If the user can't be resolved or no section is available
+    """
+    identity = await resolve_identity(client, user)
+    steam_id = identity["steamid"]
+    sections = {
+        "profile": _profile(client, steam_id),
+        "level": _level(client, steam_id),
+        "bans": _bans(client, steam_id),
+        "library": _library(client, steam_id, top_games),
+        "recent_games": _recent(client, steam_id, recent_games),
+    }
+    results = await gather_partial(*sections.values())
+
+    overview: dict[str, Any] = {"steamid": steam_id}
+    if identity["source"] == "vanity":
+        overview["vanity_url"] = user
+    unavailable = []
+    for name, result in zip(sections, results):
+        if isinstance(result, Exception):
+            logger.info(f"Leaving {name} out of overview for {steam_id}: {str(result)}")
+            unavailable.append(name)
+        else:
+            overview[name] = result
+
+    if len(unavailable) == len(sections):
+        raise ValueError(f"No data available for Steam ID: {steam_id}")
+    overview["unavailable"] = unavailable
+    return overview
@@ -0,0 +1,221 @@
+"""Store price comparison across regions.
+
+Prices are fetched with one appdetails price_overview request per region
+and batch of apps, all regions concurrently, and cached per (app, region)
+for a short time so overlapping comparisons only fetch what they miss;
+concurrent comparisons share the batch requests already in flight.
+Prices live in their own cache so large comparisons don't evict the API
+responses in the shared one.
+Currencies are converted with a local rate table (CURRENCY_RATES
+overrides entries), never with an exchange-rate service.
+"""
+
+import asyncio
+import functools
+import logging
+import statistics
+from typing import Any
+
+from mcp_server_steam.cache import ResponseCache
+from mcp_server_steam.config import settings
+from mcp_server_steam.deadline import gather_partial
+from mcp_server_steam.steam_client import SteamAPIClient
+from mcp_server_steam.watchlist import PRICE_BATCH_SIZE, parse_price_overview
+
+logger = logging.getLogger(__name__)
+
+# (region, app) -> price_overview, {} for apps without a price in the region
+price_cache = ResponseCache(max_entries=settings.price_cache_max_entries)
+
+# (region, app) -> batch request fetching it, shared by concurrent comparisons
+_inflight: dict[tuple[str, int], asyncio.Task] = {}
+
+# Regions compared when none are given
+DEFAULT_COUNTRY_CODES = ("us", "gb", "de", "pl", "br", "mx", "jp", "kr", "in", "au")
+
+# Approximate value of one unit of each store currency in USD
+DEFAULT_USD_RATES: dict[str, float] = {
+    "USD": 1.0, "EUR": 1.08, "GBP": 1.27, "CHF": 1.13, "PLN": 0.25, "NOK": 0.094, "SEK": 0.095,
+    "DKK": 0.145, "CAD": 0.73, "AUD": 0.66, "NZD": 0.60, "JPY": 0.0067, "KRW": 0.00073,
+    "CNY": 0.14, "HKD": 0.128, "TWD": 0.031, "SGD": 0.74, "MYR": 0.22, "THB": 0.028,
+    "IDR": 0.000063, "PHP": 0.0175, "VND": 0.00004, "INR": 0.012, "BRL": 0.18, "MXN": 0.055,
+    "CLP": 0.00107, "COP": 0.00025, "PEN": 0.27, "UYU": 0.025, "CRC": 0.0019, "ZAR": 0.055,
+    "TRY": 0.03, "RUB": 0.011, "UAH": 0.024, "KZT": 0.0021, "ILS": 0.27, "SAR": 0.27,
+    "AED": 0.27, "QAR": 0.27, "KWD": 3.25,
+}
+
+# Regions whose price requests run at once; all share the store rate bucket
+MAX_CONCURRENT_REGIONS = 8
+
+
+def currency_rates() -> dict[str, float]:
+    """USD value per currency unit: the built-in table with CURRENCY_RATES applied.
+
+    CURRENCY_RATES looks like "EUR=1.1,KRW=0.0007".
+    """
+    rates = dict(DEFAULT_USD_RATES)
+    for item in (settings.currency_rates or "").split(","):
+        code, _, value = item.partition("=")
+        if code.strip() and value.strip():
+            try:
+                rates[code.strip().upper()] = float(value)
+            except ValueError:
+                logger.warning(f"Ignoring invalid currency rate: {item}")
+    return rates
+
+
+def _cache_key(app_id: int, cc: str) -> str:
+    return f"price_overview:{cc}:{app_id}"
+
+
+async def fetch_regional_prices(
+    client: SteamAPIClient,
+    app_ids: list[int],
+    country_codes: list[str]
+) -> dict[tuple[int, str], dict[str, Any] | None]:
+    """
+    price_overview per (app, region); None where the store has no answer.
+
+    Cached pairs are served from the price cache, pairs another call is
+    already fetching wait for that request, and the rest are fetched with
+    one request per region and batch of apps. Pairs whose request failed or
+    missed the deadline are left out.
+    """
+    prices: dict[tuple[int, str], dict[str, Any] | None] = {}
+    missing: dict[str, list[int]] = {}
+    # Ordered set of requests started by other calls that this one waits for
+    joined: dict[asyncio.Task, None] = {}
+    for cc in country_codes:
+        for app_id in app_ids:
+            cached = price_cache.get(_cache_key(app_id, cc))
+            if cached is not None:
+                prices[app_id, cc] = cached or None
+            elif (task := _inflight.get((cc, app_id))) is not None:
+                joined[task] = None
+            else:
+                missing.setdefault(cc, []).append(app_id)
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REGIONS)
+
+    async def run(cc: str, batch: list[int]) -> dict[tuple[int, str], dict[str, Any] | None]:
+        async with semaphore:
+            params = {"appids": ",".join(map(str, batch)), "filters": "price_overview", "cc": cc}
+            # Cached per item below instead of per batch
+            result = await client.get_store("/api/appdetails", params=params, cache=False)
+        fetched = {}
+        for app_id in batch:
+            overview = parse_price_overview(result.get(str(app_id)))
+            # {} marks "no price here" in the cache, so it isn't fetched again
+            price_cache.set(_cache_key(app_id, cc), overview or {}, settings.regional_price_ttl)
+            fetched[app_id, cc] = overview or None
+        return fetched
+
+    started = []
+    for cc, ids in missing.items():
+        for i in range(0, len(ids), PRICE_BATCH_SIZE):
+            batch = ids[i:i + PRICE_BATCH_SIZE]
+            task = asyncio.ensure_future(run(cc, batch))
+            for app_id in batch:
+                _inflight[cc, app_id] = task
+            task.add_done_callback(functools.partial(_forget, cc=cc, batch=batch))
+            started.append(task)
+
+    # Shielded: this call's deadline must not cancel requests other calls started
+    results = await gather_partial(*started, *(asyncio.shield(task) for task in joined))
+    wanted = {(app_id, cc) for app_id in app_ids for cc in country_codes}
+    for result in results:
+        if isinstance(result, Exception):
+            logger.info(f"Price request failed: {str(result)}")
+            continue
+        prices.update((pair, overview) for pair, overview in result.items() if pair in wanted)
+    return prices
+
+
+def _forget(task: asyncio.Task, cc: str, batch: list[int]) -> None:
+    """Drop a finished (or cancelled) batch request from the in-flight map."""
+    for app_id in batch:
+        if _inflight.get((cc, app_id)) is task:
+            del _inflight[cc, app_id]
+
+
+async def compare_prices(
+    client: SteamAPIClient,
+    app_ids: list[int],
+    country_codes: list[str] | None = None,
+    base_currency: str = "USD"
+) -> dict[str, Any]:
+    """
+    Compare the store prices of apps across regions.
+
+    Args:
+        client: Open Steam API client
+        app_ids: Apps to compare
+        country_codes: Store regions (default: DEFAULT_COUNTRY_CODES)
+        base_currency: Currency prices are converted to
+
+    Returns:
+        Regions ranked by price index (their prices relative to each app's
+        median across regions, averaged), and per app its prices cheapest first
+
+    Raises:
+        ValueError: If base_currency has no rate
+    """
+    rates = currency_rates()
+    base_currency = base_currency.upper()
+    if base_currency not in rates:
+        raise ValueError(f"No exchange rate for {base_currency}; set it in CURRENCY_RATES")
+    codes = [cc.strip().lower() for cc in (country_codes or DEFAULT_COUNTRY_CODES) if cc.strip()]
+    codes = list(dict.fromkeys(codes))
+
+    prices = await fetch_regional_prices(client, app_ids, codes)
+
+    apps = []
+    ratios: dict[str, list[float]] = {cc: [] for cc in codes}
+    unpriced: dict[str, list[int]] = {}
+    unknown_currencies = set()
+    for app_id in app_ids:
+        entries = []
+        for cc in codes:
+            overview = prices.get((app_id, cc))
+            if not overview or overview.get("final") is None:
+                unpriced.setdefault(cc, []).append(app_id)
+                continue
+            currency = overview.get("currency", "")
+            if currency not in rates:
+                unknown_currencies.add(currency)
+                continue
+            price = overview["final"] / 100
+            entries.append({
+                "cc": cc,
+                "currency": currency,
+                "price": price,
+                "discount_percent": overview.get("discount_percent", 0),
+                "converted": round(price * rates[currency] / rates[base_currency], 2),
+            })
+        entries.sort(key=lambda e: e["converted"])
+        if entries:
+            median = statistics.median(e["converted"] for e in entries)
+            for entry in entries:
+                if median:
+                    ratios[entry["cc"]].append(entry["converted"] / median)
+        apps.append({
+            "appid": app_id,
+            "cheapest": entries[0]["cc"] if entries else None,
+            "prices": entries,
+        })
+
+    regions = [
+        {"cc": cc, "price_index": round(statistics.mean(values), 3), "apps_priced": len(values)}
+        for cc, values in ratios.items()
+        if values
+    ]
+    regions.sort(key=lambda r: r["price_index"])
+    report: dict[str, Any] = {
+        "base_currency": base_currency,
+        "regions": regions,
+        "apps": apps,
+        "unpriced": unpriced,
+    }
+    if unknown_currencies:
+        report["unknown_currencies"] = sorted(unknown_currencies)
+    return report
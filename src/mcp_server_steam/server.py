@@ -20,9 +20,11 @@ from contextlib import asynccontextmanager
 from typing import Any
 
 from fastmcp import FastMCP
+from fastmcp.server.middleware import Middleware
 from pydantic import Field
 
 from mcp_server_steam.config import settings
+from mcp_server_steam.tool_schemas import cached_tool
 
 logging.basicConfig(
     level=logging.INFO,
@@ -38,8 +40,17 @@ async def lifespan(app):
 
     logger.info("Starting mcp-server-steam v%s...", __version__)
 
-    # Validate API key on startup
-    if not settings.steam_api_key or settings.steam_api_key == "your_steam_api_key_here":
+    # Record or replay upstream responses if a cassette mode is set.
+    # httpx and the client stack are imported on first use, not at startup.
+    cassette_transport = None
+    if settings.cassette_mode.lower() != "off":
+        from mcp_server_steam.cassette import install_cassette
+        cassette_transport = install_cassette()
+
+    # Validate API key on startup (replay mode never reaches Steam)
+    if settings.cassette_mode.lower() != "replay" and (
+        not settings.steam_api_key or settings.steam_api_key == "your_steam_api_key_here"
+    ):
         raise ValueError(
             "Invalid STEAM_API_KEY. Get your API key from "
             "https://steamcommunity.com/dev/apikey and set it in .env file"
@@ -47,8 +58,53 @@ async def lifespan(app):
 
     logger.info("Steam API key validated successfully")
 
+    # Share cached responses and the rate budget with other worker processes
+    shared_state = None
+    if settings.shared_state_path:
+        from mcp_server_steam.shared_state import install_shared_state
+        shared_state = install_shared_state()
+
+    # Prefetch the default user's data without delaying readiness
+    warmup_task = None
+    if settings.warmup_enabled:
+        from mcp_server_steam.warmup import start_warmup
+        warmup_task = start_warmup()
+
+    # Snapshot playtime on a schedule, if configured
+    snapshot_task = None
+    if settings.snapshot_interval > 0:
+        from mcp_server_steam.snapshots import start_snapshot_scheduler
+        snapshot_task = start_snapshot_scheduler()
+
+    # Check watched prices in the background within the store rate budget
+    poller_task = None
+    if settings.watchlist_poll_interval > 0 and settings.watchlist_path:
+        from mcp_server_steam.watchlist import start_watchlist_poller
+        poller_task = start_watchlist_poller()
+
     yield
 
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+
+    if snapshot_task is not None:
+        snapshot_task.cancel()
+
+    if poller_task is not None:
+        poller_task.cancel()
+
+    from mcp_server_steam.tracing import tracer
+    await tracer.shutdown()
+
+    if tool_call_log is not None:
+        tool_call_log.close()
+
+    if cassette_transport is not None:
+        await cassette_transport.close()
+
+    if shared_state is not None:
+        shared_state.close()
+
     logger.info("Shutting down mcp-server-steam...")
 
 
@@ -56,15 +112,14 @@ async def lifespan(app):
 AI_INSTRUCTIONS = """
 ## Steam MCP Server 사용 가이드
 
-이 서버는 Steam Web API와 상호작용하기 위한 16개 도구를 제공합니다.
+이 서버는 Steam Web API와 상호작용하기 위한 25개 도구를 제공합니다.
 
 ## 🎯 일반적인 사용 패턴
 
 ### 1. 사용자 프로필 조회 (가장 일반적인 작업)
 ```
 사용자: "내 Steam 프로필 조회해줘" 또는 "내 스팀 정보 보여줘"
-AI: resolve_vanity_url로 vanity URL을 Steam ID로 변환 시도
-AI: get_user_profile로 프로필 조회
+AI: get_user_overview로 프로필, 레벨, 밴 상태, 라이브러리, 최근 게임을 한 번에 조회
 ```
 
 ### 2. 게임 라이브러리 분석
@@ -73,6 +128,8 @@ AI: get_user_profile로 프로필 조회
 AI: get_user_profile로 Steam ID 획득
 AI: get_owned_games로 소유 게임 목록 조회
 AI: 플레이타임 순으로 정렬하여 요약
+사용자: "이번 주에 뭐 했어?"
+AI: get_playtime_history로 기간 중 플레이시간 변화 조회 (API 호출 없음)
 ```
 
 ### 3. 특정 게임 정보 조회
@@ -80,22 +137,36 @@ AI: 플레이타임 순으로 정렬하여 요약
 사용자: "엘든 링 GO 정보 알려줘"
 AI: search_games로 "ELDEN RING" 검색
 AI: get_game_details로 상세 정보 조회
+사용자: "내 게임들 새 소식 있어?"
+AI: get_news_feed로 가장 많이 플레이한 게임들의 뉴스를 한 번에 조회
 ```
 
-### 4. 업적 및 통계
+### 4. 가격 추적
+```
+사용자: "이 게임들 할인하면 알려줘"
+AI: watch_prices로 추적 목록에 추가 (target_price로 목표 가격 설정 가능)
+AI: get_price_alerts로 할인, 목표 가격 도달, 가격 하락 조회
+사용자: "이 게임 어느 나라에서 제일 싸?"
+AI: compare_regional_prices로 여러 국가 스토어 가격을 한 통화로 비교
+```
+
+### 5. 업적 및 통계
 ```
 사용자: "내 업적 현황 알려줘"
-AI: get_owned_games로 게임 목록 획득
-AI: get_player_achievements로 각 게임 업적 조회
-AI: get_global_achievement_percentages로 전체 플레이어 대비 비교
+AI: get_achievement_rarity_report로 업적과 전역 달성률을 한 번에 분석
+AI: 희귀도 점수와 가장 희귀한 업적 요약
 ```
 
 ## 🔗 도구 간의 관계
 
 ### 필수 선행 도구
 - **resolve_vanity_url** → **모든 프로필 도구**의 선행 조건
-  - 사용자가 vanity URL(steamcommunity.com/id/username)만 알 경우
-  - 먼저 resolve_vanity_url로 Steam ID(64-bit)를 변환해야 함
+  - 사용자가 vanity URL(steamcommunity.com/id/username), 프로필 URL, SteamID2/SteamID3만 알 경우
+  - 먼저 resolve_vanity_url로 Steam ID(64-bit)를 변환해야 함 (vanity 이름 외에는 API 호출 없음)
+  - 여러 사용자를 한 번에 변환하려면 resolve_steam_ids 사용
+
+### 여러 번 조회할 때
+- 같은 도구를 여러 인자로 호출해야 하면 **batch**로 한 번에 실행
 
 ### 데이터 흐름
 ```
@@ -111,6 +182,8 @@ get_owned_games, get_friends_list, etc. (프로필 기반 작업)
 ### Steam ID 형식
 - 64-bit 숫자: 76561198000000000
 - vanity URL: "username" (steamcommunity.com/id/username 부분)
+- SteamID2 "STEAM_0:1:12345", SteamID3 "[U:1:24691]", 프로필 URL "steamcommunity.com/profiles/7656..."
+  → resolve_vanity_url / resolve_steam_ids가 로컬에서 변환
 - 도구마다 필요한 형식이 다름
 
 ### App ID 형식
@@ -161,19 +234,134 @@ get_owned_games, get_friends_list, etc. (프로필 기반 작업)
 """
 
 
+class DeadlineMiddleware(Middleware):
+    """Give each tool call a deadline that its upstream requests and limiter waits observe."""
+
+    # Time past the deadline a tool gets to assemble partial results
+    GRACE_SECONDS = 1.0
+
+    async def on_call_tool(self, context, call_next):
+        import asyncio
+
+        from fastmcp.exceptions import ToolError
+
+        from mcp_server_steam.deadline import deadline_scope
+
+        seconds = settings.tool_deadline
+        if seconds <= 0:
+            return await call_next(context)
+        with deadline_scope(seconds):
+            try:
+                # Backstop for work that doesn't check the deadline itself
+                return await asyncio.wait_for(call_next(context), seconds + self.GRACE_SECONDS)
+            except asyncio.TimeoutError:
+                raise ToolError(
+                    f"{context.message.name} 호출이 제한 시간({seconds:.0f}초)을 초과했습니다."
+                ) from None
+
+
+class MetricsMiddleware(Middleware):
+    """Record latency, outcome and concurrency of every tool call."""
+
+    async def on_call_tool(self, context, call_next):
+        from mcp_server_steam.metrics import metrics
+
+        tool = context.message.name
+        status = "error"
+        try:
+            with metrics.track("steam_tool_duration_seconds", "steam_tool_in_flight", tool=tool):
+                result = await call_next(context)
+            status = "ok"
+            return result
+        finally:
+            metrics.inc("steam_tool_calls_total", tool=tool, status=status)
+
+
+class TracingMiddleware(Middleware):
+    """Open a root span per tool call; upstream spans nest under it."""
+
+    async def on_call_tool(self, context, call_next):
+        from mcp_server_steam.tracing import tracer
+
+        with tracer.span("tool", tool=context.message.name):
+            return await call_next(context)
+
+
+class StaleDataMiddleware(Middleware):
+    """Mark results that contain expired cache entries served during an upstream outage."""
+
+    async def on_call_tool(self, context, call_next):
+        from mcp.types import TextContent
+
+        from mcp_server_steam.cache import track_stale_reads
+
+        with track_stale_reads() as reads:
+            result = await call_next(context)
+        if reads:
+            oldest = max(read["age_s"] for read in reads)
+            result.meta = {**(result.meta or {}), "stale": True, "stale_entries": reads}
+            result.content = [*result.content, TextContent(
+                type="text",
+                text=f"주의: Steam API 장애로 최대 {oldest}초 전에 캐시된 데이터를 반환했습니다."
+            )]
+        return result
+
+
+class ToolCallLogMiddleware(Middleware):
+    """Append each tool call to a JSONL trace that the load generator can replay."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    async def on_call_tool(self, context, call_next):
+        import time
+
+        try:
+            session = context.fastmcp_context.session_id
+        except Exception:
+            session = "default"
+        record = {
+            "session": session,
+            "t": round(time.time(), 3),
+            "tool": context.message.name,
+            "args": context.message.arguments or {},
+        }
+        # One handle for the server's lifetime, like tracing.JsonlExporter
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8", buffering=1)
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        return await call_next(context)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
 # Create main server instance
 mcp = FastMCP(
     name="mcp-server-steam",
     instructions=AI_INSTRUCTIONS,
     lifespan=lifespan,
 )
+mcp.add_middleware(MetricsMiddleware())
+mcp.add_middleware(TracingMiddleware())
+mcp.add_middleware(StaleDataMiddleware())
+mcp.add_middleware(DeadlineMiddleware())
+tool_call_log = ToolCallLogMiddleware(settings.tool_call_log) if settings.tool_call_log else None
+if tool_call_log is not None:
+    mcp.add_middleware(tool_call_log)
+
+# Registers tools like @mcp.tool(), reusing precomputed schemas (see tool_schemas.py)
+tool = cached_tool(mcp)
 
 
 # ============================================================================
 # Profile Tools
 # ============================================================================
 
-@mcp.tool()
+@tool
 async def get_user_profile(
     steam_id: str = Field(
         description="Steam 사용자의 64-bit ID입니다. 예: 76561198000000000. vanity URL(steamcommunity.com/id/xxx)이 있는 경우 먼저 resolve_vanity_url 도구로 변환하세요."
@@ -199,7 +387,51 @@ async def get_user_profile(
         return result["response"]["players"][0]
 
 
-@mcp.tool()
+@tool
+async def get_user_overview(
+    user: str | None = Field(
+        default=None,
+        description="64-bit Steam ID, SteamID2/SteamID3, 프로필 URL 또는 "
+                    "vanity URL(steamcommunity.com/id/xxx의 xxx)입니다. "
+                    "설정하지 않으면 환경변수 STEAM_USER_ID를 사용합니다."
+    ),
+    top_games: int = Field(
+        default=5,
+        description="포함할 플레이시간 상위 게임 수입니다."
+    ),
+    recent_games: int = Field(
+        default=5,
+        description="포함할 최근 플레이 게임 수입니다."
+    )
+) -> dict[str, Any]:
+    """
+    사용자 개요를 한 번에 조회합니다.
+
+    resolve_vanity_url, get_user_profile, get_steam_level, get_player_bans,
+    get_owned_games, get_recently_played_games를 따로 호출하는 대신 동시에 조회해서
+    하나의 요약으로 반환합니다. 사용자를 처음 파악할 때는 이 도구를 먼저 사용하세요.
+
+    반환 데이터: Steam ID(steamid), 프로필(profile), Steam 레벨(level), 밴 상태(bans),
+    라이브러리 요약(library: 게임 수, 총 플레이시간, 플레이시간 상위 게임), 최근 플레이 게임(recent_games)을
+    포함합니다. 플레이시간은 '시간' 단위입니다. 비공개 등으로 조회하지 못한 항목은 빠지고 unavailable에 나열됩니다.
+
+    사용 예시: user="76561198000000000" 또는 user="gabelogannewell"
+    """
+    from mcp_server_steam.overview import build_user_overview
+    from mcp_server_steam.steam_client import SteamAPIClient
+    from mcp_server_steam.config import settings
+
+    target_user = user or settings.steam_user_id
+    if not target_user:
+        raise ValueError("user 파라미터가 없고 환경변수 STEAM_USER_ID도 설정되지 않았습니다.")
+
+    async with SteamAPIClient() as client:
+        return await build_user_overview(
+            client, target_user.strip(), top_games=top_games, recent_games=recent_games
+        )
+
+
+@tool
 async def get_friends_list(
     steam_id: str = Field(
         description="친구 목록을 조회할 사용자의 64-bit Steam ID입니다."
@@ -230,7 +462,7 @@ async def get_friends_list(
         return friends_list
 
 
-@mcp.tool()
+@tool
 async def get_owned_games(
     steam_id: str | None = Field(
         default=None,
@@ -255,6 +487,7 @@ async def get_owned_games(
 
     사용 예시: steam_id="76561198000000000", include_app_info=True
     """
+    from mcp_server_steam.snapshots import record_owned_games
     from mcp_server_steam.steam_client import SteamAPIClient
     from mcp_server_steam.config import settings
 
@@ -273,10 +506,87 @@ async def get_owned_games(
         result = await client.get("IPlayerService", "GetOwnedGames", version="v0001", params=params)
 
         games = result.get("response", {}).get("games", [])
+        record_owned_games(target_steam_id, games)
         return games
 
 
-@mcp.tool()
+@tool
+async def get_playtime_history(
+    steam_id: str | None = Field(
+        default=None,
+        description="플레이 기록을 조회할 사용자의 64-bit Steam ID입니다. 설정하지 않으면 환경변수 STEAM_USER_ID를 사용합니다."
+    ),
+    days: int = Field(
+        default=7,
+        description="start를 지정하지 않은 경우 비교할 기간(일)입니다. 7이면 지난 7일간의 변화를 계산합니다."
+    ),
+    start: str | None = Field(
+        default=None,
+        description="비교 시작 시점입니다. 'YYYY-MM-DD' 날짜(UTC) 또는 Unix timestamp입니다."
+    ),
+    end: str | None = Field(
+        default=None,
+        description="비교 끝 시점입니다. 'YYYY-MM-DD' 날짜(UTC, 그날 끝까지) 또는 Unix timestamp입니다. "
+                    "비워두면 최신 스냅샷까지입니다."
+    ),
+    top_n: int = Field(
+        default=10,
+        description="반환할 플레이시간 증가 상위 게임 수입니다."
+    )
+) -> dict[str, Any]:
+    """
+    기간 동안의 플레이시간 변화를 조회합니다. "이번 주에 뭐 했지?" 같은 질문에 사용하세요.
+
+    get_owned_games 등으로 라이브러리를 조회할 때마다 로컬에 저장된 플레이시간 스냅샷을 비교하므로
+    Steam API를 호출하지 않습니다. 스냅샷이 요청한 기간보다 늦게 시작하면 가장 오래된 스냅샷부터 비교합니다.
+    서버에 SNAPSHOT_PATH가 설정되어 있어야 사용할 수 있습니다.
+
+    반환 데이터: 실제 비교 구간(from, to), 기간 중 총 플레이시간(hours_played), 플레이한 게임 수(games_played),
+    게임별 증가량(games: hours_played, 현재 총 플레이시간 playtime_hours), 새로 생긴 게임(new_games),
+    일별 플레이시간(daily)을 포함합니다. 시간 단위는 '시간'입니다.
+
+    사용 예시: days=7 또는 start="2026-09-01", end="2026-09-30"
+    """
+    import sqlite3
+    import time
+    from datetime import datetime, timezone
+
+    from mcp_server_steam.snapshots import get_store, run_in_store
+    from mcp_server_steam.config import settings
+
+    target_steam_id = steam_id or settings.steam_user_id
+    if not target_steam_id:
+        raise ValueError("steam_id 파라미터가 없고 환경변수 STEAM_USER_ID도 설정되지 않았습니다.")
+    store = get_store()
+    if store is None:
+        raise ValueError("플레이시간 스냅샷이 비활성화되어 있습니다(SNAPSHOT_PATH).")
+
+    def parse(value: str, end_of_day: bool = False) -> int:
+        if value.strip().isdigit():
+            return int(value)
+        try:
+            day = datetime.strptime(value.strip(), "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        except ValueError:
+            raise ValueError(f"날짜 형식이 올바르지 않습니다: {value} (YYYY-MM-DD 또는 Unix timestamp)") from None
+        return int(day.timestamp()) + (86399 if end_of_day else 0)
+
+    start_at = parse(start) if start else int(time.time()) - days * 86400
+    end_at = parse(end, end_of_day=True) if end else None
+    try:
+        history = await run_in_store(
+            lambda: store.history(target_steam_id, start_at, end_at, top_n=top_n)
+        )
+    except sqlite3.Error as e:
+        logger.warning(f"Reading playtime snapshots failed: {str(e)}")
+        raise ValueError(f"플레이시간 스냅샷 파일을 읽을 수 없습니다(SNAPSHOT_PATH): {str(e)}") from None
+    if history is None:
+        raise ValueError(
+            f"{target_steam_id}의 플레이시간 스냅샷이 없습니다. get_owned_games로 라이브러리를 조회하면 기록이 시작됩니다."
+        )
+    return history
+
+
+@tool
 async def get_recently_played_games(
     steam_id: str = Field(
         description="최근 플레이한 게임을 조회할 사용자의 64-bit Steam ID입니다."
@@ -307,7 +617,7 @@ async def get_recently_played_games(
         return games
 
 
-@mcp.tool()
+@tool
 async def get_steam_level(
     steam_id: str = Field(
         description="Steam 레벨을 조회할 사용자의 64-bit Steam ID입니다."
@@ -329,7 +639,7 @@ async def get_steam_level(
         return result.get("response", {})
 
 
-@mcp.tool()
+@tool
 async def get_player_achievements(
     steam_id: str = Field(
         description="업적을 조회할 사용자의 64-bit Steam ID입니다."
@@ -368,7 +678,7 @@ async def get_player_achievements(
 # Game Tools
 # ============================================================================
 
-@mcp.tool()
+@tool
 async def get_game_details(
     app_ids: list[int] = Field(
         description="상세 정보를 조회할 게임들의 Steam App ID 리스트입니다. 최대 100개까지 한 번에 조회 가능합니다."
@@ -388,15 +698,13 @@ async def get_game_details(
     사용 예시: app_ids=[730, 570, 440], language="english"
     """
     from mcp_server_steam.steam_client import SteamAPIClient
-    import httpx
 
     async with SteamAPIClient() as client:
-        url = f"https://store.steampowered.com/api/appdetails?appids={','.join(map(str, app_ids))}&l={language}"
-
-        async with client._client:
-            response = await client._client.get(url)
-            response.raise_for_status()
-            result = response.json()
+        params = {
+            "appids": ",".join(map(str, app_ids)),
+            "l": language
+        }
+        result = await client.get_store("/api/appdetails", params=params)
 
         games = []
         for app_id, app_data in result.items():
@@ -406,7 +714,130 @@ async def get_game_details(
         return games
 
 
-@mcp.tool()
+@tool
+async def watch_prices(
+    app_ids: list[int] = Field(
+        description="가격을 추적할(또는 remove=true면 추적을 멈출) 게임들의 Steam App ID 리스트입니다. 수천 개도 가능합니다."
+    ),
+    target_price: float | None = Field(
+        default=None,
+        description="목표 가격입니다(통화 단위, 예: 9.99). "
+                    "가격이 이 값 이하가 되면 get_price_alerts의 below_target에 표시됩니다."
+    ),
+    remove: bool = Field(
+        default=False,
+        description="true면 app_ids를 가격 추적 목록에서 제거합니다."
+    )
+) -> dict[str, Any]:
+    """
+    게임을 가격 추적 목록(watchlist)에 추가하거나 제거합니다.
+
+    추적 중인 게임의 가격은 백그라운드에서 여러 게임을 한 번에 묶어 주기적으로 확인되고,
+    가격이 바뀔 때마다 기록됩니다. 할인과 가격 하락은 get_price_alerts로 조회하세요.
+    서버에 WATCHLIST_PATH가 설정되어 있어야 사용할 수 있습니다.
+
+    반환 데이터: 추적 중인 게임 수(watched)를 포함합니다.
+
+    사용 예시: app_ids=[730, 570], target_price=9.99 또는 app_ids=[730], remove=true
+    """
+    from mcp_server_steam.watchlist import get_watchlist, run_in_watchlist
+
+    watchlist = get_watchlist()
+    if watchlist is None:
+        raise ValueError("가격 추적이 비활성화되어 있습니다(WATCHLIST_PATH).")
+
+    def update() -> int:
+        if remove:
+            watchlist.remove(app_ids)
+        else:
+            watchlist.add(app_ids, target_price)
+        return watchlist.count()
+
+    return {"watched": await run_in_watchlist(update)}
+
+
+@tool
+async def get_price_alerts(
+    refresh: bool = Field(
+        default=True,
+        description="true면 최근에 확인하지 않은 게임의 가격을 먼저 확인합니다. false면 저장된 가격만 사용합니다."
+    ),
+    days: int = Field(
+        default=7,
+        description="가격 하락(price_drops)을 찾을 기간(일)입니다."
+    ),
+    top_n: int = Field(
+        default=20,
+        description="각 목록에 반환할 최대 게임 수입니다."
+    )
+) -> dict[str, Any]:
+    """
+    가격 추적 목록(watchlist)의 현재 할인, 목표 가격 도달, 최근 가격 하락을 조회합니다.
+
+    watch_prices로 추가한 게임만 대상입니다. 가격은 여러 게임을 한 요청에 묶어 확인하므로
+    수천 개의 게임도 수십 번의 요청으로 확인됩니다.
+
+    반환 데이터: 추적 중인 게임 수(watched), 할인 중인 게임(on_sale, 할인율 순), 목표 가격 이하인 게임(below_target),
+    기간 중 가격 하락(price_drops: from_price, to_price, changed_at)을 포함합니다. 가격은 통화 단위입니다(예: 9.99 USD).
+
+    사용 예시: refresh=true, days=7
+    """
+    from mcp_server_steam.steam_client import SteamAPIClient
+    from mcp_server_steam.watchlist import get_watchlist, poll, run_in_watchlist
+    from mcp_server_steam.config import settings
+
+    watchlist = get_watchlist()
+    if watchlist is None:
+        raise ValueError("가격 추적이 비활성화되어 있습니다(WATCHLIST_PATH).")
+
+    stats = None
+    if refresh and await run_in_watchlist(watchlist.count):
+        # Only apps not checked within the poll interval are requested
+        max_age = settings.watchlist_poll_interval or 3600
+        async with SteamAPIClient() as client:
+            stats = await poll(watchlist, client, max_age, settings.watchlist_cc)
+
+    report = await run_in_watchlist(lambda: watchlist.report(days=days, top_n=top_n))
+    if stats is not None:
+        report["refreshed"] = stats
+    return report
+
+
+@tool
+async def compare_regional_prices(
+    app_ids: list[int] = Field(
+        description="가격을 비교할 게임들의 Steam App ID 리스트입니다."
+    ),
+    country_codes: list[str] | None = Field(
+        default=None,
+        description="비교할 스토어 국가 코드 리스트입니다(예: ['us', 'kr', 'tr']). "
+                    "생략하면 us, gb, de, pl, br, mx, jp, kr, in, au를 비교합니다."
+    ),
+    base_currency: str = Field(
+        default="USD",
+        description="가격을 환산할 기준 통화입니다(예: USD, KRW, EUR)."
+    )
+) -> dict[str, Any]:
+    """
+    여러 국가 스토어의 게임 가격을 한 통화로 환산해 비교합니다.
+
+    모든 국가의 가격을 동시에 조회하며, 국가마다 여러 게임을 한 요청에 묶습니다.
+    최근(기본 15분) 조회한 국가·게임의 가격은 다시 요청하지 않습니다. 환율은 서버의 고정 환율표(CURRENCY_RATES로 변경 가능)를 사용하므로 근사치입니다.
+
+    반환 데이터: 기준 통화(base_currency), 가격 지수가 낮은(저렴한) 순의 국가 목록(regions: 각 게임의 국가별 중앙값 대비 가격 비율의 평균),
+    게임별 최저가 국가(cheapest)와 저렴한 순의 국가별 가격(prices: 현지 가격, 통화, 할인율, 환산 가격),
+    가격이 없는 국가별 게임(unpriced)을 포함합니다.
+
+    사용 예시: app_ids=[1245620, 730], country_codes=["us", "kr", "tr", "ar"], base_currency="KRW"
+    """
+    from mcp_server_steam.regional_prices import compare_prices
+    from mcp_server_steam.steam_client import SteamAPIClient
+
+    async with SteamAPIClient() as client:
+        return await compare_prices(client, app_ids, country_codes, base_currency)
+
+
+@tool
 async def get_game_news(
     app_id: int = Field(
         description="뉴스를 조회할 게임의 Steam App ID입니다."
@@ -442,7 +873,67 @@ async def get_game_news(
         return news_items
 
 
-@mcp.tool()
+@tool
+async def get_news_feed(
+    app_ids: list[int] | None = Field(
+        default=None,
+        description="뉴스를 모아볼 게임들의 Steam App ID 리스트입니다(최대 200개). "
+                    "생략하면 steam_id 사용자의 가장 많이 플레이한 게임을 사용합니다."
+    ),
+    steam_id: str | None = Field(
+        default=None,
+        description="app_ids를 생략했을 때 라이브러리를 사용할 사용자의 64-bit Steam ID입니다. 생략하면 STEAM_USER_ID를 사용합니다."
+    ),
+    top_games: int = Field(
+        default=20,
+        description="steam_id의 라이브러리에서 사용할 게임 수(플레이타임 순)입니다. 최대 200개입니다."
+    ),
+    days: int = Field(
+        default=30,
+        description="최근 며칠 동안의 뉴스를 반환할지 지정합니다."
+    ),
+    count: int = Field(
+        default=20,
+        description="반환할 뉴스 개수입니다."
+    ),
+    max_length: int = Field(
+        default=300,
+        description="각 뉴스 내용의 최대 길이입니다(문자 수, 최대 500)."
+    )
+) -> dict[str, Any]:
+    """
+    여러 게임의 뉴스를 날짜순으로 합친 피드를 조회합니다.
+
+    모든 게임의 뉴스를 동시에 조회하고, 게임마다 마지막으로 받은 뉴스 이후의 새 뉴스만 가져옵니다.
+    최근(10분 이내) 확인한 게임은 다시 요청하지 않으므로 라이브러리 전체 뉴스도 한 번의 가벼운 호출로 볼 수 있습니다.
+    여러 게임에 함께 게시된 뉴스는 한 번만 표시됩니다.
+
+    반환 데이터: 게임 수(apps), 이번 호출에서 새로 받은 뉴스 수(new_items),
+    최신순 뉴스(items: gid, appid, 제목(title), URL(url), 날짜(date), 내용(contents),
+    피드 라벨(feedlabel), 새 뉴스 여부(new)),
+    갱신하지 못해 이전에 받은 뉴스만 포함된 게임(stale)을 포함합니다.
+
+    사용 예시: app_ids=[730, 570, 440] 또는 steam_id="76561198000000000", top_games=30
+    """
+    from mcp_server_steam.config import settings
+    from mcp_server_steam.news_feed import build_news_feed, most_played_apps
+    from mcp_server_steam.steam_client import SteamAPIClient
+
+    if app_ids and len(app_ids) > 200:
+        raise ValueError("app_ids는 최대 200개까지 가능합니다.")
+
+    async with SteamAPIClient() as client:
+        if not app_ids:
+            user = steam_id or settings.steam_user_id
+            if not user:
+                raise ValueError("app_ids 또는 steam_id가 필요합니다.")
+            app_ids = await most_played_apps(client, user, min(top_games, 200))
+        return await build_news_feed(
+            client, app_ids, days=days, count=count, max_length=min(max_length, 500)
+        )
+
+
+@tool
 async def get_global_achievement_percentages(
     app_id: int = Field(
         description="업적 통계를 조회할 게임의 Steam App ID입니다."
@@ -466,7 +957,69 @@ async def get_global_achievement_percentages(
         return achievements
 
 
-@mcp.tool()
+@tool
+async def get_achievement_rarity_report(
+    steam_id: str | None = Field(
+        default=None,
+        description="업적을 분석할 사용자의 64-bit Steam ID입니다. 설정하지 않으면 환경변수 STEAM_USER_ID를 사용합니다."
+    ),
+    app_ids: list[int] | None = Field(
+        default=None,
+        description="분석할 게임들의 Steam App ID 리스트입니다. 비워두면 라이브러리에서 플레이시간이 긴 게임부터 분석합니다."
+    ),
+    max_games: int = Field(
+        default=20,
+        description="app_ids를 비워둔 경우 분석할 최대 게임 수입니다."
+    ),
+    top_n: int = Field(
+        default=10,
+        description="반환할 희귀 업적 수입니다."
+    )
+) -> dict[str, Any]:
+    """
+    사용자의 달성 업적을 전역 달성률과 결합하여 희귀도 점수를 계산합니다.
+
+    get_player_achievements와 get_global_achievement_percentages를 따로 호출해서
+    이름으로 맞춰볼 필요 없이 한 번에 분석합니다. 전역 달성률은 장기간 캐시됩니다.
+
+    반환 데이터: 전체 희귀도 점수(rarity_score, 0-100), 가장 희귀한 달성 업적(rarest_unlocks,
+    전역 달성률 percent 포함), 게임별 점수(games), 통계가 없어 건너뛴 게임(skipped)을 포함합니다.
+    제한 시간 안에 분석하지 못한 게임은 timed_out에 나열되고 partial이 true가 됩니다.
+
+    사용 예시: steam_id="76561198000000000" 또는 app_ids=[730, 570], top_n=5
+    """
+    from mcp_server_steam.achievements import build_rarity_report
+    from mcp_server_steam.steam_client import SteamAPIClient
+    from mcp_server_steam.config import settings
+
+    target_steam_id = steam_id or settings.steam_user_id
+    if not target_steam_id:
+        raise ValueError("steam_id 파라미터가 없고 환경변수 STEAM_USER_ID도 설정되지 않았습니다.")
+
+    async with SteamAPIClient() as client:
+        if not app_ids:
+            params = {
+                "steamid": target_steam_id,
+                "include_appinfo": "true",
+                "include_played_free_games": "false",
+                "format": "json"
+            }
+            result = await client.get(
+                "IPlayerService", "GetOwnedGames", version="v0001", params=params
+            )
+
+            games = result.get("response", {}).get("games", [])
+            games = [
+                g for g in games
+                if g.get("has_community_visible_stats") and g.get("playtime_forever")
+            ]
+            games.sort(key=lambda g: g["playtime_forever"], reverse=True)
+            app_ids = [g["appid"] for g in games[:max_games]]
+
+        return await build_rarity_report(client, target_steam_id, app_ids, top_n=top_n)
+
+
+@tool
 async def search_games(
     query: str = Field(
         description="게임 검색어입니다. 영어 검색이 더 정확합니다."
@@ -487,21 +1040,20 @@ async def search_games(
     사용 예시: query="action", count=25
     """
     from mcp_server_steam.steam_client import SteamAPIClient
-    import httpx
 
     async with SteamAPIClient() as client:
-        url = f"https://store.steampowered.com/api/storesearch/?term={query}&l=english&cc=US"
-
-        async with client._client:
-            response = await client._client.get(url)
-            response.raise_for_status()
-            result = response.json()
+        params = {
+            "term": query,
+            "l": "english",
+            "cc": "US"
+        }
+        result = await client.get_store("/api/storesearch/", params=params)
 
         items = result.get("items", [])[:count]
         return items
 
 
-@mcp.tool()
+@tool
 async def get_game_schema(
     app_id: int = Field(
         description="게임 스키마를 조회할 게임의 Steam App ID입니다."
@@ -535,7 +1087,7 @@ async def get_game_schema(
 # Community Tools
 # ============================================================================
 
-@mcp.tool()
+@tool
 async def get_workshop_items(
     app_id: int = Field(
         description="워크샵 아이템을 조회할 게임의 Steam App ID입니다."
@@ -579,7 +1131,7 @@ async def get_workshop_items(
         return files
 
 
-@mcp.tool()
+@tool
 async def get_workshop_item_details(
     published_file_ids: list[int] | list[str] = Field(
         description="상세 정보를 조회할 워크샵 아이템들의 published file ID 리스트입니다."
@@ -588,24 +1140,22 @@ async def get_workshop_item_details(
     """
     워크샵 아이템의 상세 정보를 조회합니다.
 
-    반환 데이터: 각 아이템의 상세 메타데이터, 설명, 태그, 미리보기 이미지,
-    의존성, 구독/좋아요 통계 등을 포함합니다.
+    수만 개의 ID도 한 번에 조회할 수 있습니다. ID는 100개씩 나누어 동시에 요청되고,
+    최근(기본 1시간) 조회한 아이템은 다시 요청하지 않습니다.
+
+    반환 데이터: 요청한 ID 순서대로 각 아이템의 상세 메타데이터, 설명, 태그, 미리보기 이미지,
+    의존성, 구독/좋아요 통계 등을 포함합니다. 조회하지 못한 아이템은 result가 1이 아닙니다.
 
     사용 예시: published_file_ids=[12345678, 87654321]
     """
     from mcp_server_steam.steam_client import SteamAPIClient
+    from mcp_server_steam.workshop import fetch_workshop_details
 
     async with SteamAPIClient() as client:
-        params = {
-            "publishedfileids": ",".join(map(str, published_file_ids))
-        }
-        result = await client.get("IPublishedFileService", "GetDetails", version="v0001", params=params)
-
-        files = result.get("response", {}).get("publishedfiledetails", [])
-        return files
+        return await fetch_workshop_details(client, published_file_ids)
 
 
-@mcp.tool()
+@tool
 async def get_user_reviews(
     app_id: int = Field(
         description="리뷰를 조회할 게임의 Steam App ID입니다."
@@ -628,26 +1178,21 @@ async def get_user_reviews(
 
     사용 예시: app_id=730, review_type="all", count=10
     """
-    import httpx
-
-    url = f"https://store.steampowered.com/appreviews/{app_id}"
+    from mcp_server_steam.steam_client import SteamAPIClient
 
-    async with httpx.AsyncClient() as client:
+    async with SteamAPIClient() as client:
         params = {
             "json": "1",
             "filter": review_type,
             "num_per_page": count
         }
-
-        response = await client.get(url, params=params)
-        response.raise_for_status()
-        result = response.json()
+        result = await client.get_store(f"/appreviews/{app_id}", params=params)
 
     reviews = result.get("reviews", [])
     return reviews
 
 
-@mcp.tool()
+@tool
 async def get_player_bans(
     steam_ids: list[str] = Field(
         description="밴 상태를 조회할 사용자들의 64-bit Steam ID 리스트입니다. 최대 100개까지 가능합니다."
@@ -678,15 +1223,19 @@ async def get_player_bans(
 # Utility Tools
 # ============================================================================
 
-@mcp.tool()
+@tool
 async def resolve_vanity_url(
     vanity_url: str = Field(
-        description="변환할 Steam 커스텀 URL 또는 vanity ID입니다. steamcommunity.com/id/xxx에서 xxx 부분입니다."
+        description="변환할 Steam 커스텀 URL 또는 vanity ID입니다. steamcommunity.com/id/xxx에서 xxx 부분입니다. "
+                    "전체 URL, 프로필 URL, SteamID2, SteamID3도 가능합니다."
     )
 ) -> dict[str, Any]:
     """
     Steam 커스텀 URL(vanity URL)을 64-bit Steam ID로 변환합니다.
 
+    프로필 URL(steamcommunity.com/profiles/...), SteamID2(STEAM_0:1:12345), SteamID3([U:1:24691])는
+    API 호출 없이 변환되고, vanity 이름의 변환 결과는 오래 캐시됩니다.
+
     반환 데이터: 변환된 64-bit Steam ID(steamid)와 성공 여부(success)를 포함합니다.
 
     중요: 대부분의 다른 도구들은 64-bit Steam ID가 필요합니다.
@@ -694,17 +1243,62 @@ async def resolve_vanity_url(
 
     사용 예시: vanity_url="robinwalker" 또는 vanity_url="customusername"
     """
+    from mcp_server_steam.identity import resolve_user
+    from mcp_server_steam.steam_client import SteamAPIClient
+
+    async with SteamAPIClient() as client:
+        return {"steamid": await resolve_user(client, vanity_url), "success": True}
+
+
+@tool
+async def resolve_steam_ids(
+    identifiers: list[str] = Field(
+        description="변환할 사용자 식별자 리스트입니다. 64-bit Steam ID, SteamID2, SteamID3, 프로필 URL, "
+                    "vanity URL/이름을 섞어 쓸 수 있습니다. 최대 100개까지 가능합니다."
+    )
+) -> list[dict[str, Any]]:
+    """
+    여러 Steam 사용자 식별자를 한 번에 64-bit Steam ID로 변환합니다.
+
+    vanity 이름만 API로 조회하고(동시에, 결과는 캐시), 나머지 형식은 로컬에서 변환합니다.
+
+    반환 데이터: 입력 순서대로 각 식별자의 입력값(input), 64-bit Steam ID(steamid),
+    원래 형식(source: steamid64, steamid2, steamid3, profile_url, vanity)을 포함합니다.
+    변환하지 못한 식별자는 steamid 대신 오류(error)를 포함합니다.
+
+    사용 예시: identifiers=["robinwalker", "STEAM_0:1:12345",
+    "https://steamcommunity.com/profiles/76561197960287930"]
+    """
+    from mcp_server_steam.identity import resolve_identities
     from mcp_server_steam.steam_client import SteamAPIClient
 
+    if len(identifiers) > 100:
+        raise ValueError("identifiers는 최대 100개까지 가능합니다.")
     async with SteamAPIClient() as client:
-        params = {"vanityurl": vanity_url}
-        result = await client.get("ISteamUser", "ResolveVanityURL", version="v0001", params=params)
+        return await resolve_identities(client, identifiers)
+
 
-        response = result.get("response", {})
-        if not response.get("success"):
-            raise ValueError(f"Could not resolve vanity URL: {vanity_url}")
+@tool
+async def batch(
+    calls: list[dict[str, Any]] = Field(
+        description="실행할 도구 호출 리스트입니다. 각 항목은 {\"tool\": 도구 이름, \"arguments\": {인자}} 형식이며 "
+                    "최대 50개까지 가능합니다."
+    )
+) -> list[dict[str, Any]]:
+    """
+    여러 도구 호출을 한 번에 동시에 실행합니다.
 
-        return {"steamid": response["steamid"], "success": True}
+    게임 스키마 10개, 뉴스 20개처럼 같은 종류의 조회를 여러 번 해야 할 때 도구를 하나씩 호출하는 대신
+    사용하세요. 같은 도구와 인자의 중복 호출은 한 번만 실행됩니다. 하나가 실패해도 나머지 결과는 반환됩니다.
+
+    반환 데이터: 입력 순서대로 각 호출의 도구 이름(tool), 성공 여부(ok), 결과(result) 또는 에러 메시지(error)를 포함합니다.
+
+    사용 예시: calls=[{"tool": "get_game_schema", "arguments": {"app_id": 730}},
+    {"tool": "get_game_news", "arguments": {"app_id": 570, "count": 3}}]
+    """
+    from mcp_server_steam.batch import run_batch
+
+    return await run_batch(mcp, calls)
 
 
 # ============================================================================
@@ -718,8 +1312,15 @@ def get_config() -> str:
 
     AI가 서버의 기능, 제한사항, 문서 링크 등을 이해하는 데 사용합니다.
     """
+    from mcp_server_steam import __version__
+    from mcp_server_steam.steam_client import key_pool, store_rate_limiter
+
+    key_limiter = key_pool.keys[0].limiter
+    per_key = round(key_limiter.rate * 60 / key_limiter.per)
+    store_per_5_minutes = round(store_rate_limiter.rate * 300 / store_rate_limiter.per)
+    max_rate_factor = settings.adaptive_max_rate_factor if settings.adaptive_limits_enabled else 1.0
     return json.dumps({
-        "version": "1.0.0",
+        "version": __version__,
         "api_base": "https://api.steampowered.com",
         "features": [
             "user_profiles",
@@ -729,13 +1330,61 @@ def get_config() -> str:
             "reviews"
         ],
         "rate_limit": {
-            "requests_per_minute": 100,
-            "description": "Steam API는 분당 100회 호출로 제한됩니다."
+            "requests_per_minute": per_key * len(key_pool.keys),
+            "requests_per_minute_per_key": per_key,
+            "api_keys": len(key_pool.keys),
+            "store_requests_per_5_minutes": store_per_5_minutes,
+            "adaptive": settings.adaptive_limits_enabled,
+            "max_rate_factor": max_rate_factor,
+            "description": (
+                f"Steam API는 키당 분당 {per_key}회, 스토어는 5분당 {store_per_5_minutes}회로 제한됩니다. "
+                f"적응형 제한은 응답 상태에 따라 속도를 설정값의 {max_rate_factor:g}배까지 조절합니다."
+            )
         },
         "documentation": "https://steamapi.xpaw.me/"
     }, indent=2, ensure_ascii=False)
 
 
+@mcp.resource("steam://metrics")
+def get_metrics() -> str:
+    """
+    서버 성능 지표를 제공합니다.
+
+    도구별/엔드포인트별 지연 시간 분포(p50, p99), 상태별 요청 및 오류 수,
+    rate limiter 대기 시간과 남은 토큰, 캐시 적중률, 동시 실행 수,
+    API 키별 상태(남은 예산, 오늘 요청 수, 쿨다운), 열린 circuit breaker,
+    호스트별 적응형 동시성/속도 제한(adaptive_limits)을 포함합니다.
+    """
+    from mcp_server_steam.adaptive import adaptive_states
+    from mcp_server_steam.circuit_breaker import circuit_states
+    from mcp_server_steam.metrics import metrics
+    from mcp_server_steam.steam_client import key_pool
+
+    return json.dumps(
+        {
+            **metrics.snapshot(),
+            "api_keys": key_pool.health(),
+            "open_circuits": circuit_states(),
+            "adaptive_limits": adaptive_states(),
+        },
+        indent=2,
+        ensure_ascii=False
+    )
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def prometheus_metrics(request):
+    """Prometheus scrape endpoint, available when served over an HTTP transport."""
+    from starlette.responses import PlainTextResponse
+
+    from mcp_server_steam.metrics import metrics
+
+    return PlainTextResponse(
+        metrics.render_prometheus(),
+        media_type="text/plain; version=0.0.4"
+    )
+
+
 @mcp.resource("steam://supported-games")
 def get_supported_games() -> str:
     """
@@ -762,9 +1411,52 @@ def get_supported_games() -> str:
 # Main Entry Point
 # ============================================================================
 
+def http_app():
+    """ASGI app for the http transport, created once per worker process."""
+    return mcp.http_app(transport="http", stateless_http=settings.server_workers > 1)
+
+
 def main():
     """Main entry point for mcp-server-steam CLI."""
-    mcp.run()
+    import argparse
+    import os
+
+    parser = argparse.ArgumentParser(description="MCP server for the Steam Web API")
+    parser.add_argument(
+        "--transport", choices=("stdio", "http", "sse"), default=settings.server_transport
+    )
+    parser.add_argument("--host", default=settings.server_host)
+    parser.add_argument("--port", type=int, default=settings.server_port)
+    parser.add_argument("--workers", type=int, default=settings.server_workers)
+    args = parser.parse_args()
+
+    if args.transport == "stdio":
+        mcp.run()
+        return
+
+    settings.server_workers = args.workers
+    if args.workers <= 1:
+        mcp.run(transport=args.transport, host=args.host, port=args.port)
+        return
+
+    # Several workers: sessions can't be pinned to a process, so serve
+    # stateless HTTP and share the cache and rate budget through SQLite
+    if args.transport != "http":
+        parser.error("--workers > 1 requires --transport http")
+    import uvicorn
+
+    # Worker processes re-read their settings from the environment
+    os.environ["SERVER_WORKERS"] = str(args.workers)
+    os.environ["SHARED_STATE_PATH"] = settings.shared_state_path or "steam-shared-state.sqlite3"
+    logger.info(f"Serving on http://{args.host}:{args.port}/mcp with {args.workers} workers")
+    uvicorn.run(
+        "mcp_server_steam.server:http_app",
+        factory=True,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        log_level="warning"
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,136 @@
+"""Cross-process state for multi-worker HTTP serving.
+
+Worker processes share one SQLite file holding cached responses and the
+rate limiter buckets, so N workers behave like one warm server: an entry
+fetched by any worker serves all of them, and together they never spend
+more than each API key's request budget. SQLite runs in WAL mode and every
+operation is a single short transaction, fast enough to run on the event
+loop.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import time
+from typing import Any
+
+from mcp_server_steam.config import settings
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS buckets (
+    name TEXT PRIMARY KEY,
+    allowance REAL NOT NULL,
+    last_check REAL NOT NULL
+);
+"""
+
+# Expired cache rows are purged after this many writes
+PURGE_EVERY = 500
+
+
+class SharedState:
+    """Response cache and token buckets stored in a SQLite file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+        self._writes = 0
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        # Opened lazily so that every worker process gets its own connection
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+        return self._conn
+
+    def cache_get(self, key: str) -> tuple[Any, float] | None:
+        """Return (value, age in seconds) of a stored entry that hasn't expired, or None."""
+        row = self.conn.execute(
+            "SELECT value, stored_at FROM cache WHERE key = ? AND expires_at > ?",
+            (key, time.time())
+        ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), max(0.0, time.time() - row[1])
+
+    def cache_set(self, key: str, value: Any, max_age: float) -> None:
+        """Store an entry that other workers may serve for up to max_age seconds."""
+        now = time.time()
+        self.conn.execute(
+            "INSERT OR REPLACE INTO cache (key, value, stored_at, expires_at) VALUES (?, ?, ?, ?)",
+            (key, json.dumps(value, ensure_ascii=False, separators=(",", ":")), now, now + max_age)
+        )
+        self._writes += 1
+        if self._writes % PURGE_EVERY == 0:
+            self.conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+
+    def take_token(self, bucket: str, rate: float, per: float) -> tuple[float, float]:
+        """
+        Reserve one request from a shared token bucket.
+
+        The token is always taken; when the bucket is empty the allowance
+        goes negative and the caller has to wait before sending, which
+        queues workers fairly in the order they asked.
+
+        Returns:
+            (allowance left after the reservation, seconds to wait before sending)
+        """
+        conn = self.conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            now = time.time()
+            row = conn.execute(
+                "SELECT allowance, last_check FROM buckets WHERE name = ?", (bucket,)
+            ).fetchone()
+            allowance = rate if row is None else min(rate, row[0] + (now - row[1]) * (rate / per))
+            allowance -= 1
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (name, allowance, last_check) VALUES (?, ?, ?)",
+                (bucket, allowance, now)
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        wait = -allowance * per / rate if allowance < 0 else 0.0
+        return allowance, wait
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def install_shared_state() -> SharedState | None:
+    """Back the response cache and rate limiters with SHARED_STATE_PATH, if set.
+
+    Returns:
+        The installed state (close it on shutdown), or None when disabled
+    """
+    if not settings.shared_state_path:
+        return None
+
+    from mcp_server_steam.cache import response_cache
+    from mcp_server_steam.steam_client import key_pool, store_rate_limiter
+
+    path = os.path.expanduser(settings.shared_state_path)
+    state = SharedState(path)
+    state.conn  # Fail on startup, not on the first request, if the file is unusable
+    response_cache.shared = state
+    for api_key in key_pool.keys:
+        api_key.limiter.shared = state
+    store_rate_limiter.shared = state
+    logger.info(f"Sharing response cache and rate budget through {path} (pid {os.getpid()})")
+    return state
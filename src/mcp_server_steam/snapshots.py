@@ -0,0 +1,331 @@
+"""Local playtime history built from owned-games snapshots.
+
+Steam only reports current playtime totals, so "what did I play this week"
+needs history kept locally. Each time a user's owned games are fetched (or
+on a schedule) a snapshot is appended to a SQLite file. Snapshots are
+delta-encoded: a playtime row is written only for games whose total changed
+since the user's previous snapshot, so a year of hourly snapshots stays in
+the low megabytes. Diffs and trends between any two snapshots are computed
+from the file alone, without upstream calls.
+"""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, TypeVar
+
+from mcp_server_steam.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    steamid INTEGER NOT NULL,
+    taken_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS snapshots_by_user ON snapshots (steamid, taken_at);
+CREATE TABLE IF NOT EXISTS playtime (
+    steamid INTEGER NOT NULL,
+    appid INTEGER NOT NULL,
+    snapshot_id INTEGER NOT NULL,
+    minutes INTEGER NOT NULL,
+    PRIMARY KEY (steamid, appid, snapshot_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS apps (
+    appid INTEGER PRIMARY KEY,
+    name TEXT NOT NULL
+);
+"""
+
+
+def _iso(timestamp: int) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _hours(minutes: int) -> float:
+    return round(minutes / 60, 1)
+
+
+class SnapshotStore:
+    """Append-only, delta-encoded playtime snapshots in a SQLite file."""
+
+    def __init__(self, path: str, min_interval: float = 3600.0):
+        """
+        Args:
+            path: SQLite file
+            min_interval: Seconds between two snapshots of the same user;
+                fetches within it don't add a snapshot
+        """
+        self.path = path
+        self.min_interval = min_interval
+        self._conn: sqlite3.Connection | None = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        # Opened lazily; WAL lets worker processes append concurrently
+        if self._conn is None:
+            # Kept only once set up, so an unwritable path fails again on the next use
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.executescript(SCHEMA)
+            except BaseException:
+                conn.close()
+                raise
+            self._conn = conn
+        return self._conn
+
+    def _state(self, steam_id: int, snapshot_id: int | None = None) -> dict[int, int]:
+        """Playtime per appid as of a snapshot (None: the latest)."""
+        # SQLite returns the row holding MAX() for the bare column
+        rows = self.conn.execute(
+            "SELECT appid, minutes, MAX(snapshot_id) FROM playtime "
+            "WHERE steamid = ? AND snapshot_id <= ? GROUP BY appid",
+            (steam_id, snapshot_id if snapshot_id is not None else 2**62)
+        ).fetchall()
+        return {appid: minutes for appid, minutes, _ in rows}
+
+    def record(
+        self, steam_id: str, games: list[dict[str, Any]], taken_at: int | None = None
+    ) -> int | None:
+        """
+        Append a snapshot of a user's owned games.
+
+        Returns:
+            The snapshot id, or None if the user was snapshotted less than
+            min_interval ago or the library is empty (private)
+        """
+        if not games:
+            return None
+        user = int(steam_id)
+        now = int(taken_at if taken_at is not None else time.time())
+        conn = self.conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            (last,) = conn.execute(
+                "SELECT MAX(taken_at) FROM snapshots WHERE steamid = ?", (user,)
+            ).fetchone()
+            if last is not None and now - last < self.min_interval:
+                conn.execute("ROLLBACK")
+                return None
+            previous = self._state(user)
+            snapshot_id = conn.execute(
+                "INSERT INTO snapshots (steamid, taken_at) VALUES (?, ?)", (user, now)
+            ).lastrowid
+            conn.executemany(
+                "INSERT INTO playtime (steamid, appid, snapshot_id, minutes) VALUES (?, ?, ?, ?)",
+                [
+                    (user, g["appid"], snapshot_id, g.get("playtime_forever", 0))
+                    for g in games
+                    if previous.get(g["appid"]) != g.get("playtime_forever", 0)
+                ]
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO apps (appid, name) VALUES (?, ?)",
+                [
+                    (g["appid"], g["name"])
+                    for g in games
+                    if g.get("name") and g["appid"] not in previous
+                ]
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return snapshot_id
+
+    def history(
+        self,
+        steam_id: str,
+        start: int,
+        end: int | None = None,
+        top_n: int = 10
+    ) -> dict[str, Any] | None:
+        """
+        Diff and daily trend of a user's playtime between two points in time.
+
+        The diff runs from the last snapshot at or before start (or the first
+        snapshot, if history begins later) to the last snapshot at or before
+        end (default: the latest).
+
+        Returns:
+            Totals, per-game changes, new games and hours played per UTC day,
+            or None if the user has no snapshots in range
+        """
+        user = int(steam_id)
+        snapshots = self.conn.execute(
+            "SELECT id, taken_at FROM snapshots WHERE steamid = ? ORDER BY id", (user,)
+        ).fetchall()
+        if end is not None:
+            snapshots = [s for s in snapshots if s[1] <= end]
+        if not snapshots:
+            return None
+        before = [s for s in snapshots if s[1] <= start]
+        first = before[-1] if before else snapshots[0]
+        last = snapshots[-1]
+
+        # Replay the deltas up to the last snapshot, keeping the state at the
+        # first one and the total at the end of each day in between
+        rows = self.conn.execute(
+            "SELECT snapshot_id, appid, minutes FROM playtime "
+            "WHERE steamid = ? AND snapshot_id <= ? ORDER BY snapshot_id",
+            (user, last[0])
+        ).fetchall()
+        state: dict[int, int] = {}
+        total = 0
+        initial: dict[int, int] = {}
+        day_totals: dict[str, int] = {}
+        i = 0
+        for snapshot_id, when in snapshots:
+            while i < len(rows) and rows[i][0] <= snapshot_id:
+                _, appid, minutes = rows[i]
+                total += minutes - state.get(appid, 0)
+                state[appid] = minutes
+                i += 1
+            if snapshot_id == first[0]:
+                initial = dict(state)
+            if snapshot_id >= first[0]:
+                day_totals[_iso(when)[:10]] = total
+
+        changes = []
+        new_games = []
+        for appid, minutes in state.items():
+            if appid not in initial:
+                new_games.append(appid)
+            delta = minutes - initial.get(appid, 0)
+            if delta > 0:
+                changes.append((delta, appid, minutes))
+        changes.sort(reverse=True)
+        names = self._names([appid for _, appid, _ in changes[:top_n]] + new_games)
+
+        daily = []
+        previous_total = sum(initial.values())
+        for day, day_total in day_totals.items():
+            daily.append({"date": day, "hours_played": _hours(day_total - previous_total)})
+            previous_total = day_total
+
+        return {
+            "steamid": steam_id,
+            "from": _iso(first[1]),
+            "to": _iso(last[1]),
+            "snapshots": sum(1 for s in snapshots if s[0] >= first[0]),
+            "hours_played": _hours(total - sum(initial.values())),
+            "games_played": len(changes),
+            "games": [
+                {
+                    "appid": appid,
+                    "name": names.get(appid),
+                    "hours_played": _hours(delta),
+                    "playtime_hours": _hours(minutes),
+                }
+                for delta, appid, minutes in changes[:top_n]
+            ],
+            "new_games": [{"appid": appid, "name": names.get(appid)} for appid in new_games],
+            "daily": daily,
+        }
+
+    def _names(self, appids: list[int]) -> dict[int, str]:
+        if not appids:
+            return {}
+        marks = ",".join("?" * len(appids))
+        rows = self.conn.execute(f"SELECT appid, name FROM apps WHERE appid IN ({marks})", appids)
+        return dict(rows)
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+_store: SnapshotStore | None = None
+
+# SQLite work runs on one thread, off the event loop: a write can wait up
+# to 5 s for another worker's lock. One thread also keeps the connection
+# on the thread that opened it.
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="snapshots")
+_writes: set[asyncio.Future] = set()
+
+
+def get_store() -> SnapshotStore | None:
+    """The configured snapshot store, or None when SNAPSHOT_PATH is unset."""
+    global _store
+    if _store is None and settings.snapshot_path:
+        _store = SnapshotStore(
+            os.path.expanduser(settings.snapshot_path), settings.snapshot_min_interval
+        )
+    return _store
+
+
+async def run_in_store(fn: Callable[[], T]) -> T:
+    """Run snapshot store work on the store's thread."""
+    return await asyncio.get_running_loop().run_in_executor(_executor, fn)
+
+
+def record_owned_games(steam_id: str, games: list[dict[str, Any]]) -> None:
+    """Snapshot a fetched library in the background; failures are logged, never raised."""
+    store = get_store()
+    if store is None or not steam_id.isdigit() or not games:
+        return
+    write = asyncio.get_running_loop().run_in_executor(_executor, _record, store, steam_id, games)
+    # Keep a reference until the write is done
+    _writes.add(write)
+    write.add_done_callback(_writes.discard)
+
+
+def _record(store: SnapshotStore, steam_id: str, games: list[dict[str, Any]]) -> None:
+    try:
+        snapshot_id = store.record(steam_id, games)
+    except Exception as e:
+        logger.warning(f"Playtime snapshot for {steam_id} failed: {str(e)}")
+        return
+    if snapshot_id is not None:
+        logger.info(f"Recorded playtime snapshot {snapshot_id} for {steam_id}")
+
+
+async def _snapshot_loop(steam_ids: list[str], interval: float) -> None:
+    from mcp_server_steam.steam_client import SteamAPIClient
+
+    while True:
+        async with SteamAPIClient() as client:
+            for steam_id in steam_ids:
+                # Same parameters as get_owned_games, so scheduled snapshots warm its cache
+                params = {
+                    "steamid": steam_id,
+                    "include_appinfo": "true",
+                    "include_played_free_games": "false",
+                    "format": "json"
+                }
+                try:
+                    result = await client.get(
+                        "IPlayerService", "GetOwnedGames", version="v0001", params=params
+                    )
+                except Exception as e:
+                    logger.warning(f"Scheduled playtime snapshot for {steam_id} failed: {str(e)}")
+                    continue
+                record_owned_games(steam_id, result.get("response", {}).get("games", []))
+        await asyncio.sleep(interval)
+
+
+def start_snapshot_scheduler() -> asyncio.Task | None:
+    """Snapshot SNAPSHOT_USERS (default: STEAM_USER_ID) every SNAPSHOT_INTERVAL seconds, if set.
+
+    Returns:
+        The running task, or None when scheduled snapshots are disabled
+    """
+    users = settings.snapshot_users or settings.steam_user_id or ""
+    steam_ids = [s.strip() for s in users.split(",") if s.strip()]
+    if settings.snapshot_interval <= 0 or not steam_ids or get_store() is None:
+        return None
+
+    logger.info(
+        f"Snapshotting playtime of {len(steam_ids)} user(s) every {settings.snapshot_interval:.0f}s"
+    )
+    return asyncio.create_task(_snapshot_loop(steam_ids, settings.snapshot_interval))
@@ -1,13 +1,30 @@
 """Steam API client with error handling and rate limiting."""
 
 import asyncio
+import hashlib
 import logging
+import re
 import time
+from dataclasses import dataclass, replace
 from typing import Any
 
 import httpx
 
+from mcp_server_steam.adaptive import AdaptiveLimit, adaptive_limits
+from mcp_server_steam.cache import (
+    CACHE_POLICIES,
+    Revalidated,
+    Validators,
+    make_cache_key,
+    response_cache,
+)
+from mcp_server_steam.circuit_breaker import get_breaker
 from mcp_server_steam.config import settings
+from mcp_server_steam.deadline import DeadlineExceeded, deadline_scope, remaining
+from mcp_server_steam.hedging import hedger
+from mcp_server_steam.metrics import metrics
+from mcp_server_steam.negative_cache import EMPTY_RESULT_RULES, KnownEmpty, classify, negative_cache
+from mcp_server_steam.tracing import tracer
 
 logger = logging.getLogger(__name__)
 
@@ -33,49 +50,314 @@ class SteamNotFoundError(SteamAPIError):
     pass
 
 
+class SteamKnownEmptyError(SteamNotFoundError):
+    """Raised when Steam has no result: private profile, game without stats or unknown account."""
+
+    def __init__(self, known: KnownEmpty):
+        super().__init__(known.message)
+        self.known = known
+
+    @property
+    def reason(self) -> str:
+        """"private", "no_stats" or "not_found"."""
+        return self.known.reason
+
+
+class SteamCircuitOpenError(SteamAPIError):
+    """Raised without contacting Steam while an endpoint's circuit breaker is open."""
+    pass
+
+
+class SteamDeadlineError(SteamAPIError, DeadlineExceeded):
+    """Raised when the tool call's deadline leaves no time for an upstream request."""
+    pass
+
+
 class RateLimiter:
     """Token bucket rate limiter for Steam API requests."""
 
-    def __init__(self, rate: int = 100, per: float = 60.0):
+    def __init__(self, rate: int = 100, per: float = 60.0, name: str = "api"):
         """
         Args:
             rate: Number of requests allowed
             per: Time period in seconds
+            name: Bucket name used in metrics
         """
         self.rate = rate
         self.per = per
+        self.name = name
+        # Multiple of rate set by the host's adaptive limit (see adaptive.py)
+        self.factor = 1.0
         self.allowance = rate
         self.last_check = time.time()
+        # Bucket shared with other worker processes (see shared_state.py)
+        self.shared = None
+
+    @property
+    def effective_rate(self) -> float:
+        """Requests allowed per period right now: the configured rate times the adaptive factor."""
+        return self.rate * self.factor
 
     async def acquire(self) -> None:
         """Acquire permission to make a request."""
         await asyncio.sleep(0)  # Yield to event loop
 
+        if self.shared is not None:
+            await self._acquire_shared()
+            return
+
+        rate = self.effective_rate
         current = time.time()
         elapsed = current - self.last_check
         self.last_check = current
 
-        self.allowance += elapsed * (self.rate / self.per)
+        self.allowance += elapsed * (rate / self.per)
 
-        if self.allowance > self.rate:
-            self.allowance = self.rate
+        if self.allowance > rate:
+            self.allowance = rate
 
         if self.allowance < 1:
-            sleep_time = self.per * (1 - self.allowance) / self.rate
+            sleep_time = self.per * (1 - self.allowance) / rate
+            left = remaining()
+            if left is not None and sleep_time > left:
+                # Keep the token for a caller that can still use it
+                raise SteamDeadlineError(
+                    f"Rate limit wait of {sleep_time:.1f}s exceeds the "
+                    f"{max(left, 0):.1f}s left in this call"
+                )
             logger.warning(f"Rate limit reached, sleeping for {sleep_time:.2f}s")
+            metrics.observe("steam_rate_limiter_wait_seconds", sleep_time, bucket=self.name)
             await asyncio.sleep(sleep_time)
             self.allowance = 0
         else:
+            metrics.observe("steam_rate_limiter_wait_seconds", 0.0, bucket=self.name)
             self.allowance -= 1
 
+        metrics.set_gauge("steam_rate_limiter_tokens", round(self.allowance, 2), bucket=self.name)
+
+    async def _acquire_shared(self) -> None:
+        """Reserve a token from the bucket shared by all worker processes."""
+        self.allowance, sleep_time = self.shared.take_token(
+            self.name, self.effective_rate, self.per
+        )
+        self.last_check = time.time()
+        left = remaining()
+        if left is not None and sleep_time > left:
+            # The reservation is spent either way; don't wait for it
+            raise SteamDeadlineError(
+                f"Shared rate limit wait of {sleep_time:.1f}s exceeds the "
+                f"{max(left, 0):.1f}s left in this call"
+            )
+        metrics.observe("steam_rate_limiter_wait_seconds", sleep_time, bucket=self.name)
+        if sleep_time > 0:
+            logger.warning(f"Shared rate limit reached, sleeping for {sleep_time:.2f}s")
+            await asyncio.sleep(sleep_time)
+        metrics.set_gauge(
+            "steam_rate_limiter_tokens", round(max(self.allowance, 0), 2), bucket=self.name
+        )
+
+    def try_acquire(self) -> bool:
+        """Take a token only if one is available right now; never waits."""
+        if self.shared is not None:
+            # A shared reservation can't be handed back, so don't take optional tokens
+            return False
+        rate = self.effective_rate
+        current = time.time()
+        self.allowance = min(rate, self.allowance + (current - self.last_check) * (rate / self.per))
+        self.last_check = current
+        if self.allowance < 1:
+            return False
+        self.allowance -= 1
+        return True
+
+    def headroom(self) -> float:
+        """Fraction of the bucket currently available, without consuming a token."""
+        rate = self.effective_rate
+        elapsed = time.time() - self.last_check
+        allowance = min(rate, self.allowance + elapsed * (rate / self.per))
+        return max(allowance, 0) / rate
+
+
+@dataclass
+class ApiKey:
+    """A Steam Web API key with its own rate budget, daily counter and health."""
+
+    key: str | None
+    limiter: RateLimiter
+    requests_today: int = 0
+    day: str = ""
+    consecutive_429: int = 0
+    cooldown_until: float = 0.0
+    cooldowns: int = 0
+    last_error: str | None = None
+
+    @property
+    def label(self) -> str:
+        """Masked key for logs and diagnostics."""
+        return f"...{self.key[-4:]}" if self.key else "none"
+
+    @property
+    def cooldown_left(self) -> float:
+        return max(0.0, self.cooldown_until - time.time())
+
+
+class KeyPool:
+    """API keys in rotation; each request goes to the healthy key with the most headroom.
+
+    A key that answers 403, or 429 several times in a row, is taken out of
+    rotation for a cooldown. A key that used up its daily quota is skipped
+    until the next UTC day.
+    """
+
+    def __init__(
+        self,
+        keys: list[str | None],
+        rate: int = 100,
+        per: float = 60.0,
+        daily_limit: int = 100000,
+        cooldown: float = 300.0,
+        max_consecutive_429: int = 3
+    ):
+        """
+        Args:
+            keys: API keys; the first key's bucket is named "api", the others "api-2", "api-3", ...
+            rate: Requests allowed per key in each period
+            per: Rate period in seconds
+            daily_limit: Requests per key per UTC day
+            cooldown: Seconds a failing key stays out of rotation
+            max_consecutive_429: Consecutive 429 responses that put a key on cooldown
+        """
+        self.keys = [
+            ApiKey(key=key, limiter=RateLimiter(rate, per, name=f"api-{i + 1}" if i else "api"))
+            for i, key in enumerate(keys or [None])
+        ]
+        self.daily_limit = daily_limit
+        self.cooldown = cooldown
+        self.max_consecutive_429 = max_consecutive_429
+
+    def _available(self) -> list[ApiKey]:
+        today = time.strftime("%Y-%m-%d", time.gmtime())
+        available = []
+        for api_key in self.keys:
+            if api_key.day != today:
+                api_key.day = today
+                api_key.requests_today = 0
+            if api_key.cooldown_left == 0 and api_key.requests_today < self.daily_limit:
+                available.append(api_key)
+        return available
+
+    def choose(self) -> ApiKey:
+        """Pick the key for the next request and count it against the key's daily quota.
+
+        Raises:
+            SteamRateLimitError: When every key is cooling down or over its daily quota
+        """
+        available = self._available()
+        if not available:
+            raise SteamRateLimitError(
+                "No Steam API key available: all keys are cooling down or over their daily quota"
+            )
+        api_key = max(available, key=lambda k: k.limiter.headroom())
+        api_key.requests_today += 1
+        return api_key
+
+    def try_choose(self) -> ApiKey | None:
+        """Pick a key whose rate token is free right now, take the token and count the request.
+
+        Never waits; returns None when no key in rotation has a token.
+        """
+        for api_key in sorted(self._available(), key=lambda k: k.limiter.headroom(), reverse=True):
+            if api_key.limiter.try_acquire():
+                api_key.requests_today += 1
+                return api_key
+        return None
+
+    def report(self, api_key: ApiKey, status: int) -> None:
+        """Update a key's health from the HTTP status of a request it made."""
+        if status == 429:
+            api_key.consecutive_429 += 1
+            api_key.last_error = "429"
+            if api_key.consecutive_429 >= self.max_consecutive_429:
+                self._cool_down(api_key, "429")
+        elif status == 403:
+            api_key.last_error = "403"
+            self._cool_down(api_key, "403")
+        else:
+            api_key.consecutive_429 = 0
+
+    def _cool_down(self, api_key: ApiKey, reason: str) -> None:
+        api_key.cooldown_until = time.time() + self.cooldown
+        api_key.consecutive_429 = 0
+        api_key.cooldowns += 1
+        metrics.inc("steam_api_key_cooldowns_total", key=api_key.label, reason=reason)
+        logger.warning(
+            f"API key {api_key.label} returned {reason}, out of rotation for {self.cooldown:.0f}s"
+        )
+
+    def headroom(self) -> float:
+        """Best headroom among the keys currently in rotation (0 if none is)."""
+        return max((k.limiter.headroom() for k in self._available()), default=0.0)
+
+    def health(self) -> list[dict[str, Any]]:
+        """Per-key state for diagnostics; keys are masked."""
+        available = self._available()
+        return [
+            {
+                "key": api_key.label,
+                "bucket": api_key.limiter.name,
+                "in_rotation": api_key in available,
+                "headroom": round(api_key.limiter.headroom(), 3),
+                "requests_today": api_key.requests_today,
+                "daily_limit": self.daily_limit,
+                "cooldown_left_s": round(api_key.cooldown_left, 1),
+                "cooldowns": api_key.cooldowns,
+                "last_error": api_key.last_error,
+            }
+            for api_key in self.keys
+        ]
+
+
+def configured_keys() -> list[str | None]:
+    """STEAM_API_KEY followed by STEAM_API_KEYS, without duplicates."""
+    keys = [settings.steam_api_key] + (settings.steam_api_keys or "").split(",")
+    unique = list(dict.fromkeys(k.strip() for k in keys if k and k.strip()))
+    return unique or [None]
 
-# Global rate limiter
-rate_limiter = RateLimiter(rate=100, per=60)
+
+# Global key pool; each key has its own API budget of 100 requests/minute
+key_pool = KeyPool(
+    configured_keys(),
+    daily_limit=settings.api_key_daily_limit,
+    cooldown=settings.api_key_cooldown,
+    max_consecutive_429=settings.api_key_max_consecutive_429
+)
+
+# Global rate limiters; rate_limiter is the first key's bucket, the store
+# has its own, stricter budget
+rate_limiter = key_pool.keys[0].limiter
+store_rate_limiter = RateLimiter(rate=200, per=300, name="store")
+
+# The rates above are starting points the adaptive limits scale per host
+for _api_key in key_pool.keys:
+    adaptive_limits["api"].attach(_api_key.limiter)
+adaptive_limits["store"].attach(store_rate_limiter)
+
+
+# Returned by a revalidating request when the cached copy is still current
+NOT_MODIFIED = object()
+
+
+def store_endpoint(path: str) -> str:
+    """Metric label for a store path: /appreviews/730 -> store/appreviews/{id}."""
+    return "store" + re.sub(r"/\d+", "/{id}", path.rstrip("/"))
 
 
 class SteamAPIClient:
     """Async HTTP client for Steam Web API with built-in error handling."""
 
+    # Transport override for every client, e.g. a mock upstream in benchmarks
+    transport: httpx.AsyncBaseTransport | None = None
+
     def __init__(self):
         self.base_url = settings.steam_api_base_url
         self.api_key = settings.steam_api_key
@@ -87,10 +369,12 @@ class SteamAPIClient:
         self._client = httpx.AsyncClient(
             base_url=self.base_url,
             timeout=self.timeout,
+            # Sized to the adaptive limits, which decide how many requests are in flight
             limits=httpx.Limits(
-                max_keepalive_connections=20,
-                max_connections=100
-            )
+                max_keepalive_connections=sum(l.limit for l in adaptive_limits.values()),
+                max_connections=sum(l.max_concurrency for l in adaptive_limits.values())
+            ),
+            transport=SteamAPIClient.transport
         )
         return self
 
@@ -110,6 +394,10 @@ class SteamAPIClient:
         """
         Make a GET request to Steam Web API.
 
+        Responses of endpoints listed in CACHE_POLICIES are served from the
+        shared response cache, including recently expired entries while they
+        are refreshed in the background.
+
         Args:
             interface: API interface name (e.g., ISteamUser)
             method: API method name (e.g., GetPlayerSummaries)
@@ -124,15 +412,9 @@ class SteamAPIClient:
             httpx.HTTPError: For HTTP errors
             ValueError: For invalid responses
         """
-        # Acquire rate limit
-        await rate_limiter.acquire()
-
         if params is None:
             params = {}
 
-        # Always include API key
-        params["key"] = self.api_key
-
         url = f"/{interface}/{method}/{version}/"
 
         if bypass_base_url:
@@ -141,29 +423,351 @@ class SteamAPIClient:
         else:
             full_url = url
 
+        return await self._cached(full_url, params, f"{interface}/{method}")
+
+    async def get_store(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        cache: bool = True
+    ) -> Any:
+        """
+        Make a GET request to the Steam store API (store.steampowered.com).
+
+        Store requests use their own rate limiter and never carry the API key.
+        Routes listed in CACHE_POLICIES are cached like Web API responses.
+
+        Args:
+            path: Store path (e.g., /api/appdetails)
+            params: Query parameters
+            cache: Use the response cache; callers that need current data
+                or cache per item pass False
+
+        Returns:
+            Decoded JSON response
+        """
+        url = f"{settings.steam_store_base_url}{path}"
+        if not cache:
+            return await self._request(url, params or {}, store_endpoint(path), store=True)
+        return await self._cached(url, params or {}, store_endpoint(path), store=True)
+
+    async def _cached(
+        self,
+        url: str,
+        params: dict[str, Any],
+        endpoint: str,
+        store: bool = False
+    ) -> Any:
+        """Serve a request, answering known empty results from the negative cache."""
+        key = make_cache_key(url, params)
+        if endpoint in EMPTY_RESULT_RULES and settings.negative_cache_ttl > 0:
+            known = negative_cache.get(key)
+            if known is not None:
+                metrics.inc("steam_cache_requests_total", result="negative_hit")
+                raise SteamKnownEmptyError(known)
+            try:
+                return await self._cached_response(key, url, params, endpoint, store)
+            except SteamKnownEmptyError as e:
+                negative_cache.set(key, e.known, settings.negative_cache_ttl)
+                raise
+        return await self._cached_response(key, url, params, endpoint, store)
+
+    async def _cached_response(
+        self,
+        key: str,
+        url: str,
+        params: dict[str, Any],
+        endpoint: str,
+        store: bool
+    ) -> Any:
+        """Serve a request through the response cache if its endpoint has a cache policy."""
+        policy = CACHE_POLICIES.get(endpoint)
+        if policy is None or not settings.cache_enabled:
+            return await self._request(url, params, endpoint, store=store)
+
+        # Background refreshes only spend tokens above the interactive reserve
+        headroom = store_rate_limiter.headroom() if store else key_pool.headroom()
+        refresh = None
+        if headroom > settings.cache_refresh_reserve:
+            refresh = lambda: _fetch_with_new_client(
+                key, url, params, endpoint, store, policy.revalidate
+            )
+
+        # While the endpoint's circuit is open, expired entries beat no answer
+        return await response_cache.get_or_fetch(
+            key,
+            lambda: self._fetch(key, url, params, endpoint, store, policy.revalidate),
+            policy,
+            refresh=refresh,
+            fallback_errors=(SteamCircuitOpenError,)
+        )
+
+    async def _fetch(
+        self,
+        key: str,
+        url: str,
+        params: dict[str, Any],
+        endpoint: str,
+        store: bool,
+        revalidate: bool
+    ) -> Any:
+        """Fetch a value for the cache, revalidating the cached copy if the policy asks for it."""
+        if not revalidate:
+            return await self._request(url, params, endpoint, store=store)
+
+        entry = response_cache.peek(key)
+        if entry is not None and entry.validators is not None:
+            # Copied: the request updates it in place from the response
+            validators = replace(entry.validators)
+        else:
+            validators = Validators()
+        data = await self._request(url, params, endpoint, store=store, validators=validators)
+        if data is NOT_MODIFIED:
+            return Revalidated(entry.value, validators)
+        return Revalidated(data, validators)
+
+    async def _request(
+        self,
+        url: str,
+        params: dict[str, Any],
+        endpoint: str,
+        store: bool = False,
+        validators: Validators | None = None
+    ) -> Any:
+        """
+        Send a rate-limited GET request and decode the JSON response.
+
+        With validators, the request is conditional on the cached copy they
+        describe, and they are updated from the response. NOT_MODIFIED is
+        returned instead of the body when the upstream answers 304 or the
+        body hashes the same as before; it is then not decoded.
+        """
+        # Fail fast while the endpoint's circuit is open, before spending a token
+        breaker = get_breaker(endpoint) if settings.circuit_breaker_enabled else None
+        admission = breaker.allow() if breaker is not None else None
+        if breaker is not None and admission is None:
+            raise SteamCircuitOpenError(
+                f"{endpoint} is failing upstream; "
+                f"requests are skipped for {breaker.retry_after:.0f}s"
+            )
+
+        # Outcome for the circuit breaker: False for outage symptoms, None if unknown
+        upstream_ok: bool | None = None
+        slot = None
         try:
-            response = await self._client.get(full_url, params=params)
-            response.raise_for_status()
-
-            data = response.json()
-
-            # Check for Steam API errors
-            if "error" in data:
-                logger.error(f"Steam API error: {data['error']}")
-                raise SteamAPIError(data["error"])
-
-            return data
-
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error: {e.response.status_code}")
-            if e.response.status_code == 403:
-                raise SteamAuthError("Invalid Steam API key") from e
-            elif e.response.status_code == 429:
-                raise SteamRateLimitError("Steam API rate limit exceeded") from e
-            raise
-        except httpx.RequestError as e:
-            logger.error(f"Request error: {str(e)}")
-            raise SteamAPIError(f"Request failed: {str(e)}") from e
-        except Exception as e:
-            logger.error(f"Unexpected error: {str(e)}")
-            raise SteamAPIError(f"Unexpected error: {str(e)}") from e
+            # Slot before token: a request that gives up waiting for a slot
+            # must not have spent a token
+            if settings.adaptive_limits_enabled:
+                adaptive = adaptive_limits["store" if store else "api"]
+                if not await adaptive.acquire(remaining()):
+                    raise SteamDeadlineError(
+                        f"Tool call deadline reached waiting for a slot to request {endpoint}"
+                    )
+                slot = adaptive
+
+            api_key = None
+            if store:
+                limiter = store_rate_limiter
+            else:
+                api_key = key_pool.choose()
+                limiter = api_key.limiter
+
+            # Acquire rate limit
+            with tracer.span("rate_limiter.acquire", bucket=limiter.name):
+                await limiter.acquire()
+
+            # Don't start a request whose answer nobody will wait for, and
+            # cut its timeout to the time left in the tool call
+            left = remaining()
+            if left is not None and left <= 0:
+                raise SteamDeadlineError(f"Tool call deadline reached before requesting {endpoint}")
+            timeout = self.timeout if left is None else min(self.timeout, left)
+
+            headers = {}
+            if validators is not None:
+                if validators.etag:
+                    headers["If-None-Match"] = validators.etag
+                if validators.last_modified:
+                    headers["If-Modified-Since"] = validators.last_modified
+
+            status = "error"
+            try:
+                with tracer.span(
+                    "http.request",
+                    host=self._client.base_url.join(url).host,
+                    endpoint=endpoint
+                ) as span, metrics.track(
+                    "steam_upstream_duration_seconds", "steam_upstream_in_flight", endpoint=endpoint
+                ):
+                    trace_hook = tracer.httpx_trace_hook()
+
+                    async def send(
+                        api_key: ApiKey | None, slot: AdaptiveLimit | None
+                    ) -> httpx.Response:
+                        # One attempt, accounted to its own key and in-flight slot
+                        sent_at = time.monotonic()
+                        try:
+                            query = params if api_key is None else {**params, "key": api_key.key}
+                            response = await self._client.get(
+                                url,
+                                params=query,
+                                headers=headers or None,
+                                timeout=timeout,
+                                extensions={"trace": trace_hook} if trace_hook else None
+                            )
+                        except httpx.TimeoutException:
+                            # A timeout cut short by the deadline says nothing about the host
+                            if slot is not None and timeout >= self.timeout:
+                                slot.record(sent_at, None, None)
+                            raise
+                        except httpx.RequestError:
+                            if slot is not None:
+                                slot.record(sent_at, None, None)
+                            raise
+                        if slot is not None:
+                            slot.record(sent_at, time.monotonic() - sent_at, response.status_code)
+                        if api_key is not None:
+                            # A private profile's 401/403 says nothing about the key
+                            known = _known_error(endpoint, response)
+                            status = 200 if known is not None else response.status_code
+                            key_pool.report(api_key, status)
+                        return response
+
+                    def try_hedge() -> asyncio.Future | None:
+                        # Same key, token and slot accounting as the primary, without waiting
+                        if slot is not None and not slot.try_acquire():
+                            return None
+                        hedge_key = None
+                        if store:
+                            acquired = store_rate_limiter.try_acquire()
+                        else:
+                            hedge_key = key_pool.try_choose()
+                            acquired = hedge_key is not None
+                        if not acquired:
+                            if slot is not None:
+                                slot.release()
+                            return None
+                        hedge = asyncio.ensure_future(send(hedge_key, slot))
+                        if slot is not None:
+                            # Also runs if the hedge is cancelled before it starts
+                            hedge.add_done_callback(lambda _: slot.release())
+                        return hedge
+
+                    if settings.hedging_enabled:
+                        response = await hedger.run(
+                            endpoint, lambda: send(api_key, slot), try_hedge
+                        )
+                    else:
+                        response = await send(api_key, slot)
+                    span.set_attribute("status", response.status_code)
+                    span.set_attribute("bytes", len(response.content))
+                status = str(response.status_code)
+                upstream_ok = response.status_code < 500
+                known = _known_error(endpoint, response)
+                if known is not None:
+                    raise SteamKnownEmptyError(known)
+                if validators is not None:
+                    if response.status_code == 304:
+                        metrics.inc(
+                            "steam_cache_revalidations_total",
+                            endpoint=endpoint,
+                            result="not_modified"
+                        )
+                        return NOT_MODIFIED
+                    if response.is_success:
+                        content_hash = hashlib.blake2b(response.content, digest_size=16).hexdigest()
+                        unchanged = content_hash == validators.content_hash
+                        validators.etag = response.headers.get("etag")
+                        validators.last_modified = response.headers.get("last-modified")
+                        validators.content_hash = content_hash
+                        if unchanged:
+                            metrics.inc(
+                                "steam_cache_revalidations_total",
+                                endpoint=endpoint,
+                                result="unchanged"
+                            )
+                            return NOT_MODIFIED
+                        metrics.inc(
+                            "steam_cache_revalidations_total",
+                            endpoint=endpoint,
+                            result="changed"
+                        )
+                response.raise_for_status()
+
+                with tracer.span("decode", endpoint=endpoint):
+                    data = response.json()
+
+                # Check for Steam API errors
+                if isinstance(data, dict) and "error" in data:
+                    logger.error(f"Steam API error: {data['error']}")
+                    raise SteamAPIError(data["error"])
+
+                known = classify(endpoint, response.status_code, data)
+                if known is not None:
+                    raise SteamKnownEmptyError(known)
+                return data
+
+            except SteamAPIError:
+                raise
+
+            except httpx.HTTPStatusError as e:
+                logger.error(f"HTTP error: {e.response.status_code}")
+                if e.response.status_code == 403:
+                    raise SteamAuthError("Invalid Steam API key") from e
+                elif e.response.status_code == 429:
+                    raise SteamRateLimitError("Steam API rate limit exceeded") from e
+                raise
+            except httpx.TimeoutException as e:
+                if timeout < self.timeout:
+                    # Cut short by the deadline: says nothing about upstream health
+                    logger.warning(f"Deadline reached waiting for {endpoint}")
+                    raise SteamDeadlineError(
+                        f"Tool call deadline reached waiting for {endpoint}"
+                    ) from e
+                upstream_ok = False
+                logger.error(f"Request error: {str(e)}")
+                raise SteamAPIError(f"Request failed: {str(e)}") from e
+            except httpx.RequestError as e:
+                upstream_ok = False
+                logger.error(f"Request error: {str(e)}")
+                raise SteamAPIError(f"Request failed: {str(e)}") from e
+            except Exception as e:
+                logger.error(f"Unexpected error: {str(e)}")
+                raise SteamAPIError(f"Unexpected error: {str(e)}") from e
+            finally:
+                metrics.inc("steam_upstream_requests_total", endpoint=endpoint, status=status)
+        finally:
+            if slot is not None:
+                slot.release()
+            if breaker is not None:
+                breaker.record(admission, upstream_ok)
+
+
+def _known_error(endpoint: str, response: httpx.Response) -> KnownEmpty | None:
+    """Known empty result behind a 4xx response of an endpoint with a rule, if any."""
+    if endpoint in EMPTY_RESULT_RULES and 400 <= response.status_code < 500:
+        return classify(endpoint, response.status_code, _json_or_none(response))
+    return None
+
+
+def _json_or_none(response: httpx.Response) -> Any:
+    """Decoded body of an error response, or None if it isn't JSON."""
+    try:
+        return response.json()
+    except ValueError:
+        return None
+
+
+async def _fetch_with_new_client(
+    key: str,
+    url: str,
+    params: dict[str, Any],
+    endpoint: str,
+    store: bool,
+    revalidate: bool
+) -> Any:
+    """Fetch a cache value on a dedicated client, for work that outlives a tool call."""
+    # Not bound by the deadline of the call that triggered it
+    with deadline_scope(None):
+        async with SteamAPIClient() as client:
+            return await client._fetch(key, url, params, endpoint, store, revalidate)
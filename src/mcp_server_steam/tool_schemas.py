@@ -0,0 +1,123 @@
+"""Precomputed tool schemas for fast startup.
+
+Generating the JSON schema of every tool from its signature is the most
+expensive part of importing the server. The schemas are stored in
+tool_schemas.json next to this module and reused at registration as long
+as the tool's name, docstring, signature and the FastMCP version are
+unchanged; otherwise the tool is registered the normal way. Argument
+validation still happens on every call.
+
+Regenerate after changing a tool:
+    uv run python -m mcp_server_steam.tool_schemas
+"""
+
+import hashlib
+import inspect
+import json
+import logging
+from pathlib import Path
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_FILE = Path(__file__).with_name("tool_schemas.json")
+
+# Registration statistics, reported by the startup benchmark
+hits = 0
+misses = 0
+
+_registered: list[Callable[..., Any]] = []
+_schemas: dict[str, Any] | None = None
+
+
+def fingerprint(fn: Callable[..., Any]) -> str:
+    """Hash of everything the generated schema depends on."""
+    import fastmcp
+
+    source = "\n".join(
+        (fn.__name__, fn.__doc__ or "", repr(inspect.signature(fn)), fastmcp.__version__)
+    )
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()[:16]
+
+
+def _load() -> dict[str, Any]:
+    global _schemas
+    if _schemas is None:
+        try:
+            _schemas = json.loads(SCHEMA_FILE.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            _schemas = {}
+    return _schemas
+
+
+def _precomputed_tool(fn: Callable[..., Any]):
+    """FunctionTool built from the stored schema, or None if it is missing or stale."""
+    cached = _load().get(fn.__name__)
+    if not cached or cached["fingerprint"] != fingerprint(fn):
+        return None
+
+    from fastmcp.tools import FunctionTool
+
+    try:
+        return FunctionTool(
+            fn=fn,
+            name=fn.__name__,
+            description=cached["description"],
+            parameters=cached["parameters"],
+            output_schema=cached["output_schema"],
+        )
+    except Exception as e:
+        logger.debug(f"Precomputed schema for {fn.__name__} unusable: {e}")
+        return None
+
+
+def cached_tool(mcp):
+    """Decorator equivalent to ``@mcp.tool()`` that reuses precomputed schemas."""
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        global hits, misses
+        _registered.append(fn)
+        tool = _precomputed_tool(fn)
+        if tool is None:
+            misses += 1
+            mcp.tool()(fn)
+        else:
+            hits += 1
+            mcp.add_tool(tool)
+        return fn
+
+    return decorator
+
+
+def generate() -> dict[str, Any]:
+    """Compute the schemas of every registered tool the normal way."""
+    from fastmcp.tools import FunctionTool
+
+    import mcp_server_steam.server  # noqa: F401  (registers the tools)
+
+    schemas = {}
+    for fn in _registered:
+        tool = FunctionTool.from_function(fn)
+        schemas[fn.__name__] = {
+            "fingerprint": fingerprint(fn),
+            "description": tool.description,
+            "parameters": tool.parameters,
+            "output_schema": tool.output_schema,
+        }
+    return schemas
+
+
+def main() -> None:
+    # Under ``python -m`` this file is __main__; the server registers its
+    # tools through the imported module
+    from mcp_server_steam import tool_schemas
+
+    schemas = tool_schemas.generate()
+    SCHEMA_FILE.write_text(
+        json.dumps(schemas, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
+    )
+    print(f"Wrote {len(schemas)} tool schemas to {SCHEMA_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""Request tracing from MCP tool calls down to upstream HTTP requests.
+
+Spans form a tree per tool call: the tool span, with children for rate
+limiter waits, upstream requests (including connection setup) and JSON
+decoding. Finished spans go to a local JSONL file or, optionally, to an
+OTLP/HTTP collector. With the default exporter ("none") tracing costs a
+single attribute check per span.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import secrets
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator
+
+from mcp_server_steam.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Number of spans buffered before an OTLP export is sent
+OTLP_BATCH_SIZE = 64
+
+# httpx trace events recorded as connection-setup spans
+CONNECTION_EVENTS = ("connection.connect_tcp", "connection.start_tls")
+
+
+class Span:
+    """A timed operation within a trace."""
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_id", "start_ns", "end_ns", "attributes", "error"
+    )
+
+    def __init__(self, name: str, trace_id: str, parent_id: str | None, attributes: dict[str, Any]):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.start_ns = time.time_ns()
+        self.end_ns: int | None = None
+        self.attributes = attributes
+        self.error: str | None = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e6
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": round(self.duration_ms, 3),
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class _NullSpan:
+    """Stand-in yielded while tracing is disabled."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+_current_span: ContextVar[Span | None] = ContextVar("steam_current_span", default=None)
+
+
+class JsonlExporter:
+    """Append finished spans to a local JSON Lines file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    def export(self, span: Span) -> None:
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8", buffering=1)
+        self._file.write(json.dumps(span.to_dict(), ensure_ascii=False) + "\n")
+
+    async def shutdown(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class OtlpExporter:
+    """Send spans in batches to an OTLP/HTTP (JSON) collector.
+
+    Export failures are logged and the batch dropped, so the server keeps
+    working when no collector is reachable.
+    """
+
+    def __init__(self, endpoint: str, service_name: str = "mcp-server-steam"):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self._buffer: list[Span] = []
+        self._tasks: set[asyncio.Task] = set()
+
+    def export(self, span: Span) -> None:
+        self._buffer.append(span)
+        if len(self._buffer) >= OTLP_BATCH_SIZE:
+            self._flush_in_background()
+
+    def _flush_in_background(self) -> None:
+        batch, self._buffer = self._buffer, []
+        task = asyncio.create_task(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _payload(self, spans: list[Span]) -> dict[str, Any]:
+        def attribute(key: str, value: Any) -> dict[str, Any]:
+            if isinstance(value, bool):
+                return {"key": key, "value": {"boolValue": value}}
+            if isinstance(value, int):
+                return {"key": key, "value": {"intValue": str(value)}}
+            if isinstance(value, float):
+                return {"key": key, "value": {"doubleValue": value}}
+            return {"key": key, "value": {"stringValue": str(value)}}
+
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [attribute("service.name", self.service_name)]},
+                "scopeSpans": [{
+                    "scope": {"name": "mcp_server_steam"},
+                    "spans": [
+                        {
+                            "traceId": span.trace_id,
+                            "spanId": span.span_id,
+                            "parentSpanId": span.parent_id or "",
+                            "name": span.name,
+                            "kind": 1,
+                            "startTimeUnixNano": str(span.start_ns),
+                            "endTimeUnixNano": str(span.end_ns),
+                            "attributes": [attribute(k, v) for k, v in span.attributes.items()],
+                            "status": (
+                                {"code": 2, "message": span.error} if span.error else {"code": 1}
+                            ),
+                        }
+                        for span in spans
+                    ],
+                }],
+            }]
+        }
+
+    async def _send(self, spans: list[Span]) -> None:
+        import httpx
+
+        try:
+            async with httpx.AsyncClient(timeout=5.0) as client:
+                response = await client.post(self.endpoint, json=self._payload(spans))
+                response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.warning(f"Dropped {len(spans)} spans, OTLP export failed: {str(e)}")
+
+    async def shutdown(self) -> None:
+        if self._buffer:
+            self._flush_in_background()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+class Tracer:
+    """Creates spans and hands finished ones to the configured exporter."""
+
+    def __init__(self, exporter: JsonlExporter | OtlpExporter | None = None):
+        self.exporter = exporter
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def start_span(self, name: str, **attributes: Any) -> Span:
+        """Start a span as a child of the current span (or as a new trace)."""
+        parent = _current_span.get()
+        trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        return Span(name, trace_id, parent.span_id if parent else None, attributes)
+
+    def end_span(self, span: Span, error: BaseException | None = None) -> None:
+        """Finish a span and export it."""
+        span.end_ns = time.time_ns()
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+        try:
+            self.exporter.export(span)
+        except Exception as e:
+            logger.warning(f"Span export failed: {str(e)}")
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span | _NullSpan]:
+        """Trace a block as a child of the current span."""
+        if self.exporter is None:
+            yield _NULL_SPAN
+            return
+
+        span = self.start_span(name, **attributes)
+        token = _current_span.set(span)
+        error = None
+        try:
+            yield span
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            _current_span.reset(token)
+            self.end_span(span, error)
+
+    def httpx_trace_hook(self) -> Callable[[str, dict], Any] | None:
+        """Build an httpx ``trace`` extension that records connection setup as child spans."""
+        if self.exporter is None:
+            return None
+
+        started: dict[str, Span] = {}
+
+        async def trace(event_name: str, info: dict) -> None:
+            prefix, _, stage = event_name.rpartition(".")
+            if prefix not in CONNECTION_EVENTS:
+                return
+            if stage == "started":
+                started[prefix] = self.start_span(prefix)
+            elif prefix in started:
+                error = info.get("exception") if stage == "failed" else None
+                self.end_span(started.pop(prefix), error)
+
+        return trace
+
+    async def shutdown(self) -> None:
+        """Flush and close the exporter."""
+        if self.exporter is not None:
+            await self.exporter.shutdown()
+
+
+def create_tracer() -> Tracer:
+    """Build the tracer selected by the TRACING_EXPORTER setting."""
+    exporter_name = settings.tracing_exporter.lower()
+    if exporter_name == "jsonl":
+        return Tracer(JsonlExporter(os.path.expanduser(settings.tracing_file)))
+    if exporter_name == "otlp":
+        return Tracer(OtlpExporter(settings.tracing_otlp_endpoint))
+    if exporter_name != "none":
+        logger.warning(f"Unknown TRACING_EXPORTER {settings.tracing_exporter!r}, tracing disabled")
+    return Tracer()
+
+
+# Global tracer
+tracer = create_tracer()
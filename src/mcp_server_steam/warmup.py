@@ -0,0 +1,85 @@
+"""Startup cache warm-up for the configured default user."""
+
+import asyncio
+import logging
+from typing import Any
+
+from mcp_server_steam.config import settings
+from mcp_server_steam.snapshots import record_owned_games
+from mcp_server_steam.steam_client import SteamAPIClient
+
+logger = logging.getLogger(__name__)
+
+
+async def warm_up_user(steam_id: str, schema_games: int = 5) -> None:
+    """
+    Prefetch the data most conversations start with into the response cache.
+
+    Request parameters mirror the defaults of the matching tools in server.py
+    so that the first tool calls hit the cache. Failures are logged and
+    otherwise ignored; warm-up never affects server readiness.
+
+    Args:
+        steam_id: 64-bit Steam ID to warm up
+        schema_games: Number of most-played games whose schemas are prefetched
+    """
+    async with SteamAPIClient() as client:
+        requests: list[tuple[str, str, str, dict[str, Any]]] = [
+            ("ISteamUser", "GetPlayerSummaries", "v0002", {"steamids": steam_id}),
+            ("IPlayerService", "GetSteamLevel", "v0002", {"steamid": steam_id}),
+            ("IPlayerService", "GetOwnedGames", "v0001", {
+                "steamid": steam_id,
+                "include_appinfo": "true",
+                "include_played_free_games": "false",
+                "format": "json"
+            }),
+            ("IPlayerService", "GetRecentlyPlayedGames", "v0001", {
+                "steamid": steam_id,
+                "count": 10
+            }),
+        ]
+        results = await asyncio.gather(
+            *(client.get(interface, method, version=version, params=params)
+              for interface, method, version, params in requests),
+            return_exceptions=True
+        )
+        for (interface, method, _, _), result in zip(requests, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Warm-up of {interface}/{method} failed: {str(result)}")
+
+        owned = results[2]
+        if isinstance(owned, Exception):
+            return
+        record_owned_games(steam_id, owned.get("response", {}).get("games", []))
+        if schema_games <= 0:
+            return
+
+        # Cached responses are shared, so sort a copy
+        games = sorted(
+            owned.get("response", {}).get("games", []),
+            key=lambda g: g.get("playtime_forever", 0),
+            reverse=True
+        )
+        await asyncio.gather(
+            *(client.get("ISteamUserStats", "GetSchemaForGame", version="v0002",
+                         params={"appid": g["appid"], "l": "english"})
+              for g in games[:schema_games]),
+            return_exceptions=True
+        )
+
+    logger.info(f"Cache warm-up finished for {steam_id}")
+
+
+def start_warmup() -> asyncio.Task | None:
+    """Start warm-up for STEAM_USER_ID in the background if enabled.
+
+    Returns:
+        The running task, or None when warm-up is disabled
+    """
+    if not settings.warmup_enabled or not settings.steam_user_id:
+        return None
+
+    logger.info(f"Warming up cache for {settings.steam_user_id}")
+    return asyncio.create_task(
+        warm_up_user(settings.steam_user_id, schema_games=settings.warmup_schema_games)
+    )
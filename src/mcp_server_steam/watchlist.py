@@ -0,0 +1,347 @@
+"""Price watchlist polled in batched store requests.
+
+The store's appdetails endpoint returns price_overview for many apps in
+one request when filtered to it, so thousands of watched apps cost tens of
+requests per round instead of one full-payload request each. Watched apps,
+their last seen price and price changes live in a SQLite file; a price row
+is only written when an app's price changes. Polling stops for the round
+once the store rate bucket drops to its interactive reserve, and picks up
+the apps checked longest ago next time.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, TypeVar
+
+from mcp_server_steam.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS watch (
+    appid INTEGER PRIMARY KEY,
+    target_price INTEGER,
+    added_at INTEGER NOT NULL,
+    checked_at INTEGER,
+    currency TEXT,
+    initial INTEGER,
+    final INTEGER,
+    discount_percent INTEGER
+);
+CREATE INDEX IF NOT EXISTS watch_by_check ON watch (checked_at);
+CREATE TABLE IF NOT EXISTS prices (
+    appid INTEGER NOT NULL,
+    changed_at INTEGER NOT NULL,
+    final INTEGER,
+    discount_percent INTEGER,
+    PRIMARY KEY (appid, changed_at)
+) WITHOUT ROWID;
+"""
+
+# Apps per appdetails request; filters=price_overview accepts long appid lists
+PRICE_BATCH_SIZE = 100
+
+# Batches requested at once while polling
+MAX_CONCURRENT_BATCHES = 4
+
+
+def parse_price_overview(entry: dict[str, Any] | None) -> dict[str, Any] | None:
+    """
+    price_overview of one app in an appdetails response.
+
+    Returns:
+        The overview ({} for free or unpriced apps), or None if the store has no answer for the app
+    """
+    if not entry or not entry.get("success"):
+        return None
+    # Free and unreleased apps answer with an empty list instead of an object
+    data = entry.get("data") or {}
+    overview = data.get("price_overview") if isinstance(data, dict) else None
+    return overview or {}
+
+
+def _price(cents: int | None) -> float | None:
+    return None if cents is None else cents / 100
+
+
+def _iso(timestamp: int) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class Watchlist:
+    """Watched apps, their current prices and price changes in a SQLite file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        # Opened lazily; WAL lets worker processes share the file
+        if self._conn is None:
+            # Kept only once set up, so an unwritable path fails again on the next use
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.executescript(SCHEMA)
+            except BaseException:
+                conn.close()
+                raise
+            self._conn = conn
+        return self._conn
+
+    def add(self, app_ids: list[int], target_price: float | None = None) -> None:
+        """Watch apps, setting (or clearing) their target price in major currency units."""
+        target = None if target_price is None else round(target_price * 100)
+        now = int(time.time())
+        self.conn.executemany(
+            "INSERT INTO watch (appid, target_price, added_at) VALUES (?, ?, ?) "
+            "ON CONFLICT (appid) DO UPDATE SET target_price = excluded.target_price",
+            [(app_id, target, now) for app_id in app_ids]
+        )
+
+    def remove(self, app_ids: list[int]) -> None:
+        """Stop watching apps and drop their price history."""
+        self.conn.executemany("DELETE FROM watch WHERE appid = ?", [(a,) for a in app_ids])
+        self.conn.executemany("DELETE FROM prices WHERE appid = ?", [(a,) for a in app_ids])
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM watch").fetchone()[0]
+
+    def due(self, max_age: float) -> list[int]:
+        """Apps not checked within max_age seconds, least recently checked first."""
+        rows = self.conn.execute(
+            "SELECT appid FROM watch WHERE checked_at IS NULL OR checked_at < ? "
+            "ORDER BY checked_at IS NOT NULL, checked_at",
+            (int(time.time() - max_age),)
+        ).fetchall()
+        return [appid for (appid,) in rows]
+
+    def apply(
+        self, app_ids: list[int], result: dict[str, Any], checked_at: int | None = None
+    ) -> int:
+        """
+        Store the prices of an appdetails price_overview response for the apps it was requested for.
+
+        Apps the store has no answer for are marked checked, keeping their last price.
+
+        Returns:
+            Number of apps whose price changed
+        """
+        if not app_ids:
+            return 0
+        now = int(checked_at if checked_at is not None else time.time())
+        marks = ",".join("?" * len(app_ids))
+        current = {
+            appid: (final, discount)
+            for appid, final, discount in self.conn.execute(
+                f"SELECT appid, final, discount_percent FROM watch WHERE appid IN ({marks})",
+                app_ids
+            )
+        }
+        checked = []
+        updates = []
+        changes = []
+        for appid in app_ids:
+            if appid not in current:
+                continue
+            overview = parse_price_overview(result.get(str(appid)))
+            if overview is None:
+                checked.append((now, appid))
+                continue
+            final = overview.get("final")
+            discount = overview.get("discount_percent")
+            updates.append(
+                (now, overview.get("currency"), overview.get("initial"), final, discount, appid)
+            )
+            if current[appid] != (final, discount):
+                changes.append((appid, now, final, discount))
+
+        conn = self.conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany("UPDATE watch SET checked_at = ? WHERE appid = ?", checked)
+            conn.executemany(
+                "UPDATE watch SET checked_at = ?, currency = ?, initial = ?, final = ?, "
+                "discount_percent = ? WHERE appid = ?",
+                updates
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO prices (appid, changed_at, final, discount_percent) "
+                "VALUES (?, ?, ?, ?)",
+                changes
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return len(changes)
+
+    def report(self, days: int = 7, top_n: int = 20) -> dict[str, Any]:
+        """Current discounts, apps at or below their target price, and recent price drops."""
+        conn = self.conn
+        columns = "appid, currency, initial, final, discount_percent, target_price, checked_at"
+
+        def item(row: tuple) -> dict[str, Any]:
+            appid, currency, initial, final, discount, target, checked_at = row
+            return {
+                "appid": appid,
+                "currency": currency,
+                "price": _price(final),
+                "initial_price": _price(initial),
+                "discount_percent": discount,
+                "target_price": _price(target),
+                "checked_at": _iso(checked_at) if checked_at else None,
+            }
+
+        on_sale = conn.execute(
+            f"SELECT {columns} FROM watch WHERE discount_percent > 0 "
+            "ORDER BY discount_percent DESC, appid LIMIT ?", (top_n,)
+        ).fetchall()
+        below_target = conn.execute(
+            f"SELECT {columns} FROM watch WHERE target_price IS NOT NULL AND final IS NOT NULL "
+            "AND final <= target_price ORDER BY final - target_price, appid LIMIT ?", (top_n,)
+        ).fetchall()
+
+        # A drop is a change to a lower price than the app's previous row
+        since = int(time.time()) - days * 86400
+        drops = conn.execute(
+            "SELECT p.appid, p.changed_at, p.final, p.discount_percent, "
+            "(SELECT q.final FROM prices q WHERE q.appid = p.appid AND q.changed_at < p.changed_at "
+            " ORDER BY q.changed_at DESC LIMIT 1) AS previous, w.currency "
+            "FROM prices p JOIN watch w ON w.appid = p.appid WHERE p.changed_at >= ? "
+            "ORDER BY p.changed_at DESC",
+            (since,)
+        ).fetchall()
+        price_drops = [
+            {
+                "appid": appid,
+                "currency": currency,
+                "from_price": _price(previous),
+                "to_price": _price(final),
+                "discount_percent": discount,
+                "changed_at": _iso(changed_at),
+            }
+            for appid, changed_at, final, discount, previous, currency in drops
+            if previous is not None and final is not None and final < previous
+        ][:top_n]
+
+        (watched, never_checked) = conn.execute(
+            "SELECT COUNT(*), COUNT(*) - COUNT(checked_at) FROM watch"
+        ).fetchone()
+        return {
+            "watched": watched,
+            "never_checked": never_checked,
+            "on_sale": [item(row) for row in on_sale],
+            "below_target": [item(row) for row in below_target],
+            "price_drops": price_drops,
+        }
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+async def poll(watchlist: Watchlist, client, max_age: float, cc: str) -> dict[str, int]:
+    """
+    Check the prices of watched apps not checked within max_age seconds.
+
+    Apps are requested PRICE_BATCH_SIZE at a time. A batch is skipped when
+    the store rate bucket is down to its interactive reserve; skipped apps
+    stay due and are checked first next time.
+
+    Returns:
+        Counts of apps checked, skipped and with a changed price
+    """
+    from mcp_server_steam.deadline import gather_partial
+    from mcp_server_steam.steam_client import store_rate_limiter
+
+    due = await run_in_watchlist(functools.partial(watchlist.due, max_age))
+    batches = [due[i:i + PRICE_BATCH_SIZE] for i in range(0, len(due), PRICE_BATCH_SIZE)]
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCHES)
+
+    async def run(batch: list[int]) -> dict[str, Any] | None:
+        async with semaphore:
+            if store_rate_limiter.headroom() <= settings.cache_refresh_reserve:
+                return None
+            params = {"appids": ",".join(map(str, batch)), "filters": "price_overview", "cc": cc}
+            # Prices must be current, not a cached appdetails response
+            return await client.get_store("/api/appdetails", params=params, cache=False)
+
+    stats = {"checked": 0, "skipped": 0, "changed": 0}
+    for batch, result in zip(batches, await gather_partial(*(run(b) for b in batches))):
+        if isinstance(result, Exception):
+            logger.warning(f"Price check of {len(batch)} apps failed: {str(result)}")
+        if not isinstance(result, dict):
+            stats["skipped"] += len(batch)
+            continue
+        apply = functools.partial(watchlist.apply, batch, result)
+        stats["changed"] += await run_in_watchlist(apply)
+        stats["checked"] += len(batch)
+    return stats
+
+
+_watchlist: Watchlist | None = None
+
+# SQLite work runs on one thread, off the event loop: a write can wait up
+# to 5 s for another worker's lock. One thread also keeps the connection
+# on the thread that opened it.
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="watchlist")
+
+
+async def run_in_watchlist(fn: Callable[[], T]) -> T:
+    """Run watchlist work on the watchlist's thread."""
+    return await asyncio.get_running_loop().run_in_executor(_executor, fn)
+
+
+def get_watchlist(create: bool = True) -> Watchlist | None:
+    """
+    The configured watchlist.
+
+    None when WATCHLIST_PATH is empty, or when it is not created yet and create is False.
+    """
+    global _watchlist
+    if _watchlist is None and settings.watchlist_path:
+        path = os.path.expanduser(settings.watchlist_path)
+        if not create and path != ":memory:" and not os.path.exists(path):
+            return None
+        _watchlist = Watchlist(path)
+    return _watchlist
+
+
+async def _poll_loop(interval: float) -> None:
+    while True:
+        # Check often enough to catch up on apps skipped for lack of budget;
+        # sleeping first keeps the first poll (and its imports) off startup
+        await asyncio.sleep(min(interval, 300))
+        watchlist = get_watchlist(create=False)
+        if watchlist is not None and await run_in_watchlist(watchlist.count):
+            from mcp_server_steam.steam_client import SteamAPIClient
+
+            try:
+                async with SteamAPIClient() as client:
+                    stats = await poll(watchlist, client, interval, settings.watchlist_cc)
+                logger.info(f"Price watchlist poll: {stats}")
+            except Exception as e:
+                logger.warning(f"Price watchlist poll failed: {str(e)}")
+
+
+def start_watchlist_poller() -> asyncio.Task | None:
+    """Poll the watchlist every WATCHLIST_POLL_INTERVAL seconds, if set.
+
+    Returns:
+        The running task, or None when polling is disabled
+    """
+    if settings.watchlist_poll_interval <= 0 or not settings.watchlist_path:
+        return None
+    return asyncio.create_task(_poll_loop(settings.watchlist_poll_interval))
@@ -0,0 +1,90 @@
+"""Bulk workshop item details with per-item caching.
+
+IPublishedFileService/GetDetails takes its IDs as an array parameter
+(publishedfileids[0], publishedfileids[1], ...). Large ID lists are split
+into chunks that keep the request URL short, the chunks are fetched
+concurrently, and each item is cached on its own so overlapping requests
+only fetch the IDs not cached yet. Items live in their own cache so tens of
+thousands of them don't evict the API responses in the shared one.
+"""
+
+import asyncio
+import logging
+from typing import Any
+
+from mcp_server_steam.cache import ResponseCache
+from mcp_server_steam.config import settings
+from mcp_server_steam.deadline import gather_partial
+from mcp_server_steam.steam_client import SteamAPIClient
+
+logger = logging.getLogger(__name__)
+
+# IDs per GetDetails request; 100 array parameters keep the URL around 4 KB
+DETAILS_CHUNK_SIZE = 100
+
+# Chunks requested at once
+MAX_CONCURRENT_CHUNKS = 4
+
+# Steam's EResult for a failed lookup, used for items whose chunk failed
+RESULT_FAIL = 2
+
+workshop_cache = ResponseCache(max_entries=settings.workshop_cache_max_items)
+
+
+def details_params(file_ids: list[str]) -> dict[str, Any]:
+    """GetDetails query parameters for a list of IDs."""
+    return {f"publishedfileids[{i}]": file_id for i, file_id in enumerate(file_ids)}
+
+
+async def fetch_workshop_details(
+    client: SteamAPIClient,
+    published_file_ids: list[int] | list[str]
+) -> list[dict[str, Any]]:
+    """
+    Details of workshop items, in the order of the IDs.
+
+    Cached items are served from the workshop cache; the rest are fetched
+    DETAILS_CHUNK_SIZE at a time, MAX_CONCURRENT_CHUNKS chunks at once.
+    Items found by Steam are cached for WORKSHOP_ITEM_TTL seconds. An item
+    whose chunk failed or missed the deadline is returned as
+    {"publishedfileid": id, "result": 2}, like Steam's own failed lookups.
+
+    Raises:
+        SteamAPIError: If every chunk failed
+    """
+    ids = list(dict.fromkeys(str(i) for i in published_file_ids))
+    items: dict[str, dict[str, Any]] = {}
+    missing = []
+    for file_id in ids:
+        cached = workshop_cache.get(file_id)
+        if cached is not None:
+            items[file_id] = cached
+        else:
+            missing.append(file_id)
+
+    chunks = [missing[i:i + DETAILS_CHUNK_SIZE] for i in range(0, len(missing), DETAILS_CHUNK_SIZE)]
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHUNKS)
+
+    async def run(chunk: list[str]) -> dict[str, Any]:
+        async with semaphore:
+            return await client.get(
+                "IPublishedFileService", "GetDetails", version="v0001", params=details_params(chunk)
+            )
+
+    results = await gather_partial(*(run(chunk) for chunk in chunks))
+    failures = [r for r in results if isinstance(r, Exception)]
+    if chunks and len(failures) == len(chunks):
+        raise failures[0]
+    for chunk, result in zip(chunks, results):
+        if isinstance(result, Exception):
+            logger.info(f"Workshop details for {len(chunk)} items failed: {str(result)}")
+            continue
+        for item in result.get("response", {}).get("publishedfiledetails", []):
+            file_id = str(item.get("publishedfileid"))
+            items[file_id] = item
+            if item.get("result") == 1:
+                workshop_cache.set(file_id, item, settings.workshop_item_ttl)
+
+    return [
+        items.get(file_id) or {"publishedfileid": file_id, "result": RESULT_FAIL} for file_id in ids
+    ]
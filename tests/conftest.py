@@ -0,0 +1,4 @@
+import os
+
+# Settings require an API key at import time; tests never reach Steam
+os.environ.setdefault("STEAM_API_KEY", "test")
@@ -0,0 +1,40 @@
+from mcp_server_steam.achievements import rarity_weight, score_achievements
+
+
+def test_rarity_weight():
+    assert rarity_weight(100.0) == 1.0
+    assert rarity_weight(1.0) == 100.0
+    # Clamped so 0% doesn't get infinite weight
+    assert rarity_weight(0.0) == rarity_weight(0.1)
+
+
+def test_score_achievements():
+    player = [
+        {"apiname": "RARE", "achieved": 1, "unlocktime": 2},
+        {"apiname": "COMMON", "achieved": 1, "unlocktime": 1},
+        {"apiname": "MISSED", "achieved": 0, "unlocktime": 0},
+        {"apiname": "REMOVED", "achieved": 1, "unlocktime": 3},
+    ]
+    rates = [
+        {"name": "RARE", "percent": "1.0"},
+        {"name": "COMMON", "percent": "50.0"},
+        {"name": "MISSED", "percent": "10.0"},
+    ]
+
+    result = score_achievements(player, rates)
+
+    assert result["unlocked"] == 2
+    assert result["total"] == 3
+    assert result["unmatched"] == 1
+    assert result["earned_weight"] == 102.0
+    assert result["possible_weight"] == 112.0
+    assert result["rarity_score"] == round(100 * 102 / 112, 2)
+    assert [a["apiname"] for a in result["rarest_unlocks"]] == ["RARE", "COMMON"]
+
+
+def test_score_without_global_rates():
+    result = score_achievements([{"apiname": "A", "achieved": 1}], [])
+
+    assert result["total"] == 0
+    assert result["unmatched"] == 1
+    assert result["rarity_score"] == 0.0
@@ -0,0 +1,94 @@
+import time
+
+from mcp_server_steam.adaptive import (
+    DECREASE_FACTOR, LATENCY_WINDOW, MIN_RATE_FACTOR, AdaptiveLimit
+)
+
+
+class BusyLimiter:
+    """Stand-in RateLimiter that always reports its budget as spent."""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.factor = 1.0
+
+    def headroom(self):
+        return 0.0
+
+
+def fill_window(limit, latency):
+    for _ in range(LATENCY_WINDOW):
+        limit.record(time.monotonic(), latency, 200)
+
+
+def test_error_cuts_concurrency_and_rate():
+    limit = AdaptiveLimit("test", initial_concurrency=8)
+    limiter = BusyLimiter(10)
+    limit.attach(limiter)
+
+    limit.record(time.monotonic(), None, None)
+
+    assert limit.concurrency == 8 * DECREASE_FACTOR
+    assert limit.rate_factor == MIN_RATE_FACTOR
+    assert limiter.factor == MIN_RATE_FACTOR
+    assert limit.cuts == 1
+
+
+def test_responses_sent_before_a_cut_are_not_cut_again():
+    limit = AdaptiveLimit("test", initial_concurrency=8)
+    sent_at = time.monotonic()
+
+    limit.record(sent_at, None, 503)
+    limit.record(sent_at, None, 429)
+
+    assert limit.limit == 4
+    assert limit.cuts == 1
+
+
+def test_concurrency_grows_only_when_in_use():
+    limit = AdaptiveLimit("test", initial_concurrency=4, max_concurrency=5)
+
+    limit.record(time.monotonic(), 0.01, 200)
+    assert limit.concurrency == 4
+
+    limit.in_flight = 3
+    for _ in range(20):
+        limit.record(time.monotonic(), 0.01, 200)
+    assert limit.concurrency == 5
+
+
+def test_rate_factor_grows_back_to_cap():
+    limit = AdaptiveLimit("test", max_rate_factor=1.0)
+    limiter = BusyLimiter(1)
+    limit.attach(limiter)
+    limit.record(time.monotonic(), None, 500)
+    assert limit.rate_factor == MIN_RATE_FACTOR
+
+    for _ in range(20):
+        limit.record(time.monotonic(), 0.01, 200)
+
+    assert limit.rate_factor == 1.0
+    assert limiter.factor == 1.0
+
+
+def test_latency_spike_cuts_after_baseline():
+    limit = AdaptiveLimit("test", initial_concurrency=8, latency_spike=3.0)
+
+    fill_window(limit, 0.1)
+    assert limit.cuts == 0
+    assert limit.baseline == 0.1
+
+    fill_window(limit, 0.5)
+    assert limit.cuts == 1
+    assert limit.limit == 4
+
+
+def test_small_spikes_are_ignored():
+    limit = AdaptiveLimit("test", latency_spike=3.0)
+
+    fill_window(limit, 0.01)
+    fill_window(limit, 0.2)
+
+    assert limit.cuts == 0
+    # The slower window is folded into the baseline
+    assert limit.baseline > 0.01
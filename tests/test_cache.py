@@ -0,0 +1,72 @@
+import asyncio
+
+from mcp_server_steam.cache import CachePolicy, ResponseCache, make_cache_key
+
+
+def test_concurrent_misses_fetch_once():
+    cache = ResponseCache()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"n": len(calls)}
+
+    async def run():
+        policy = CachePolicy(ttl=60)
+        return await asyncio.gather(*(cache.get_or_fetch("k", fetch, policy) for _ in range(5)))
+
+    results = asyncio.run(run())
+    assert calls == [1]
+    assert results == [{"n": 1}] * 5
+
+
+def test_stale_entry_is_served_while_refreshing():
+    cache = ResponseCache()
+    policy = CachePolicy(ttl=10, stale_ttl=10)
+
+    async def fetch():
+        raise AssertionError("a stale hit must not fetch in the foreground")
+
+    async def refresh():
+        return "new"
+
+    async def run():
+        cache.set("k", "old", policy.ttl)
+        cache.peek("k").stored_at -= 15
+        served = await cache.get_or_fetch("k", fetch, policy, refresh=refresh)
+        await asyncio.sleep(0.01)
+        return served
+
+    assert asyncio.run(run()) == "old"
+    assert cache.get("k") == "new"
+
+
+def test_expired_entry_past_stale_window_is_fetched():
+    cache = ResponseCache()
+    policy = CachePolicy(ttl=10, stale_ttl=10)
+
+    async def fetch():
+        return "new"
+
+    async def run():
+        cache.set("k", "old", policy.ttl)
+        cache.peek("k").stored_at -= 25
+        return await cache.get_or_fetch("k", fetch, policy)
+
+    assert asyncio.run(run()) == "new"
+
+
+def test_lru_eviction():
+    cache = ResponseCache(max_entries=2)
+    cache.set("a", 1, 60)
+    cache.set("b", 2, 60)
+    cache.get("a")
+    cache.set("c", 3, 60)
+
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+
+
+def test_cache_key_ignores_param_order_and_api_key():
+    assert make_cache_key("u", {"a": 1, "b": 2}) == make_cache_key("u", {"b": 2, "a": 1})
+    assert make_cache_key("u", {"a": 1, "key": "secret"}) == "u?a=1"
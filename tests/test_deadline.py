@@ -0,0 +1,75 @@
+import asyncio
+
+from mcp_server_steam.deadline import deadline_scope, gather_partial, remaining
+from mcp_server_steam.steam_client import SteamDeadlineError
+
+
+async def value_after(seconds, value):
+    await asyncio.sleep(seconds)
+    return value
+
+
+async def fail():
+    raise ValueError("upstream failed")
+
+
+def test_gather_partial_without_deadline():
+    async def run():
+        return await gather_partial(value_after(0, 1), fail(), value_after(0.01, 3))
+
+    first, error, third = asyncio.run(run())
+    assert (first, third) == (1, 3)
+    assert isinstance(error, ValueError)
+
+
+def test_gather_partial_stops_at_deadline():
+    slow = []
+
+    async def tracked():
+        try:
+            return await value_after(10, "late")
+        except asyncio.CancelledError:
+            slow.append("cancelled")
+            raise
+
+    async def run():
+        with deadline_scope(0.05):
+            return await gather_partial(value_after(0, "fast"), tracked())
+
+    fast, late = asyncio.run(asyncio.wait_for(run(), 2))
+    assert fast == "fast"
+    assert isinstance(late, SteamDeadlineError)
+    assert slow == ["cancelled"]
+
+
+def test_gather_partial_cancels_work_when_cancelled():
+    cancelled = []
+
+    async def tracked():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def run():
+        caller = asyncio.ensure_future(gather_partial(tracked(), tracked()))
+        await asyncio.sleep(0.01)
+        caller.cancel()
+        try:
+            await caller
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(run())
+    assert cancelled == [True, True]
+
+
+def test_nested_scope_only_shortens():
+    assert remaining() is None
+    with deadline_scope(1):
+        with deadline_scope(60):
+            assert remaining() <= 1
+        with deadline_scope(None):
+            assert remaining() is None
+    assert remaining() is None
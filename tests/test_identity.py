@@ -0,0 +1,47 @@
+import pytest
+
+from mcp_server_steam.identity import STEAM_ID64_BASE, parse_steam_id, vanity_name
+
+GABEN = "76561197960287930"
+
+
+@pytest.mark.parametrize("value, expected", [
+    (GABEN, (GABEN, "steamid64")),
+    ("STEAM_0:0:11101", (GABEN, "steamid2")),
+    ("steam_1:0:11101", (GABEN, "steamid2")),
+    ("[U:1:22202]", (GABEN, "steamid3")),
+    ("U:1:22202", (GABEN, "steamid3")),
+    (f"https://steamcommunity.com/profiles/{GABEN}", (GABEN, "profile_url")),
+    (f"steamcommunity.com/profiles/{GABEN}/?tab=all", (GABEN, "profile_url")),
+    ("https://steamcommunity.com/profiles/[U:1:22202]", (GABEN, "profile_url")),
+    (f"  {GABEN}  ", (GABEN, "steamid64")),
+])
+def test_parse_steam_id(value, expected):
+    assert parse_steam_id(value) == expected
+
+
+@pytest.mark.parametrize("value", [
+    "gabelogannewell",
+    "https://steamcommunity.com/id/gabelogannewell",
+    str(STEAM_ID64_BASE - 1),
+    str(STEAM_ID64_BASE + 2**32),
+    f"STEAM_0:1:{2**31}",
+    "[U:1:4294967296]",
+    "https://steamcommunity.com/profiles/notanid",
+    "",
+])
+def test_parse_steam_id_needs_resolution(value):
+    assert parse_steam_id(value) is None
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("gabelogannewell", "gabelogannewell"),
+    ("https://steamcommunity.com/id/gabelogannewell/", "gabelogannewell"),
+    ("http://www.steamcommunity.com/id/some_name-1?l=english", "some_name-1"),
+    (f"https://steamcommunity.com/profiles/{GABEN}", None),
+    ("x", None),
+    ("has space", None),
+    ("a" * 33, None),
+])
+def test_vanity_name(value, expected):
+    assert vanity_name(value) == expected
@@ -0,0 +1,26 @@
+import json
+
+from mcp_server_steam.metrics import Histogram
+
+
+def test_quantile_is_upper_bound_of_bucket():
+    histogram = Histogram(buckets=(0.1, 0.5, 1.0))
+    for value in (0.05, 0.05, 0.3, 0.7):
+        histogram.observe(value)
+
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.75) == 0.5
+    assert histogram.quantile(1.0) == 1.0
+
+
+def test_quantile_in_overflow_bucket_stays_finite():
+    histogram = Histogram(buckets=(0.1, 0.5, 1.0))
+    histogram.observe(0.05)
+    histogram.observe(60.0)
+
+    assert histogram.quantile(0.99) == 1.0
+    json.dumps(histogram.quantile(0.99), allow_nan=False)
+
+
+def test_quantile_of_empty_histogram():
+    assert Histogram().quantile(0.5) is None
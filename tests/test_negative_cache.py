@@ -0,0 +1,55 @@
+import pytest
+
+from mcp_server_steam.negative_cache import NO_STATS, NOT_FOUND, PRIVATE, classify
+
+
+def reason(endpoint, status, data):
+    known = classify(endpoint, status, data)
+    return known.reason if known is not None else None
+
+
+@pytest.mark.parametrize("data, expected", [
+    ({"response": {}}, PRIVATE),
+    ({"response": {"game_count": 0}}, None),
+    ({"response": {"game_count": 1, "games": [{"appid": 10}]}}, None),
+    (None, None),
+])
+def test_owned_games(data, expected):
+    assert reason("IPlayerService/GetOwnedGames", 200, data) == expected
+
+
+def test_owned_games_ignores_error_status():
+    assert reason("IPlayerService/GetOwnedGames", 500, {"response": {}}) is None
+
+
+def test_recently_played():
+    endpoint = "IPlayerService/GetRecentlyPlayedGames"
+    assert reason(endpoint, 200, {"response": {}}) == PRIVATE
+    assert reason(endpoint, 200, {"response": {"total_count": 0}}) is None
+
+
+def test_player_summaries():
+    endpoint = "ISteamUser/GetPlayerSummaries"
+    assert reason(endpoint, 200, {"response": {"players": []}}) == NOT_FOUND
+    assert reason(endpoint, 200, {"response": {"players": [{"steamid": "1"}]}}) is None
+
+
+def test_friend_list():
+    assert reason("ISteamUser/GetFriendList", 401, None) == PRIVATE
+    assert reason("ISteamUser/GetFriendList", 200, {"friendslist": {"friends": []}}) is None
+
+
+@pytest.mark.parametrize("stats, expected", [
+    ({"error": "Profile is not public", "success": False}, PRIVATE),
+    ({"error": "Requested app has no stats", "success": False}, NO_STATS),
+    ({"error": "Invalid appid", "success": False}, NOT_FOUND),
+    ({"success": False}, NOT_FOUND),
+    ({"achievements": [], "success": True}, None),
+])
+def test_player_achievements(stats, expected):
+    endpoint = "ISteamUserStats/GetPlayerAchievements"
+    assert reason(endpoint, 400, {"playerstats": stats}) == expected
+
+
+def test_unlisted_endpoint():
+    assert classify("ISteamNews/GetNewsForApp", 200, {"response": {}}) is None
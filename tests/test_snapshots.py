@@ -0,0 +1,82 @@
+import pytest
+
+from mcp_server_steam.snapshots import SnapshotStore
+
+USER = "76561197960287930"
+DAY = 24 * 3600
+# 2024-01-01T00:00:00Z
+START = 1704067200
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SnapshotStore(str(tmp_path / "playtime.db"), min_interval=3600)
+    yield store
+    store.close()
+
+
+def games(**minutes):
+    return [
+        {"appid": int(appid[1:]), "name": appid, "playtime_forever": m}
+        for appid, m in minutes.items()
+    ]
+
+
+def playtime_rows(store):
+    return store.conn.execute(
+        "SELECT snapshot_id, appid, minutes FROM playtime ORDER BY snapshot_id, appid"
+    ).fetchall()
+
+
+def test_record_writes_only_changed_playtime(store):
+    first = store.record(USER, games(a10=60, a20=0), taken_at=START)
+    second = store.record(USER, games(a10=120, a20=0, a30=30), taken_at=START + DAY)
+
+    assert playtime_rows(store) == [
+        (first, 10, 60),
+        (first, 20, 0),
+        (second, 10, 120),
+        (second, 30, 30),
+    ]
+
+
+def test_record_skips_snapshots_within_min_interval(store):
+    assert store.record(USER, games(a10=60), taken_at=START) is not None
+    assert store.record(USER, games(a10=90), taken_at=START + 1800) is None
+    assert store.record(USER, games(a10=90), taken_at=START + 3600) is not None
+    # Other users have their own interval
+    assert store.record("76561197960265729", games(a10=5), taken_at=START + 1800) is not None
+
+
+def test_history_replays_deltas(store):
+    store.record(USER, games(a10=60, a20=30), taken_at=START)
+    store.record(USER, games(a10=120, a20=30), taken_at=START + DAY)
+    store.record(USER, games(a10=180, a20=90, a30=60), taken_at=START + 2 * DAY)
+
+    history = store.history(USER, start=START)
+
+    assert history["from"] == "2024-01-01T00:00:00Z"
+    assert history["to"] == "2024-01-03T00:00:00Z"
+    assert history["snapshots"] == 3
+    assert history["hours_played"] == 4.0
+    assert [(g["appid"], g["hours_played"]) for g in history["games"]] == [
+        (10, 2.0), (30, 1.0), (20, 1.0)
+    ]
+    assert history["new_games"] == [{"appid": 30, "name": "a30"}]
+    assert history["daily"] == [
+        {"date": "2024-01-01", "hours_played": 0.0},
+        {"date": "2024-01-02", "hours_played": 1.0},
+        {"date": "2024-01-03", "hours_played": 3.0},
+    ]
+
+
+def test_history_between_snapshots(store):
+    store.record(USER, games(a10=60), taken_at=START)
+    store.record(USER, games(a10=120), taken_at=START + DAY)
+    store.record(USER, games(a10=300), taken_at=START + 2 * DAY)
+
+    history = store.history(USER, start=START + DAY, end=START + DAY + 60)
+
+    assert history["snapshots"] == 1
+    assert history["hours_played"] == 0.0
+    assert store.history(USER, start=START, end=START - 1) is None